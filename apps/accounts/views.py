@@ -13,6 +13,7 @@ from rest_framework import viewsets
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework_simplejwt import views as jwt_views
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.accounts import schemas
@@ -22,6 +23,7 @@ from apps.accounts.serializers.user import UserSerializer
 from apps.base.mixins import CachedListMixin
 from apps.base.pagination import PaginationCommon
 from apps.base.throttling import AuthenticationRateThrottle
+from apps.cart.services.guest_cart import GUEST_CART_HEADER, merge_guest_cart
 
 # TODO: consider about adding more Swagger things like tags
 #  and implement authentication in Swagger via JWT
@@ -46,6 +48,15 @@ class DecoratedTokenObtainPairView(jwt_views.TokenObtainPairView):
             properties={"email": schemas.email_schema, "password": schemas.password_schema},
             required=["email", "password"],
         ),
+        manual_parameters=[
+            openapi.Parameter(
+                GUEST_CART_HEADER,
+                openapi.IN_HEADER,
+                description="Token of the guest cart merged into the cart of the user.",
+                type=openapi.TYPE_STRING,
+                required=False,
+            )
+        ],
         responses={
             status.HTTP_200_OK: openapi.Response(
                 description="JWT tokens obtained successfully",
@@ -72,7 +83,15 @@ class DecoratedTokenObtainPairView(jwt_views.TokenObtainPairView):
         :param kwargs: Arbitrary keyword arguments.
         :return: HTTP response containing JSON Web Tokens
         """
-        return super().post(request, *args, **kwargs)
+        serializer = self.get_serializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+        except TokenError as error:
+            raise InvalidToken(error.args[0])
+
+        # Items collected before logging in are moved to the cart of the user
+        merge_guest_cart(request.headers.get(GUEST_CART_HEADER), serializer.user)
+        return Response(serializer.validated_data, status=status.HTTP_200_OK)
 
 
 class DecoratedTokenRefreshView(jwt_views.TokenRefreshView):
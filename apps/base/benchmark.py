@@ -0,0 +1,52 @@
+"""
+Helpers for benchmark management commands.
+"""
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from django.db import transaction
+
+
+@contextmanager
+def rolled_back() -> Iterator[None]:
+    """
+    Run the block in a transaction that is always rolled back.
+
+    Benchmarks use it to create synthetic data without leaving it in the database.
+    """
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def measure(func: Callable[[], object], repeat: int = 10) -> dict[str, float]:
+    """
+    Measure execution time of the callable.
+
+    :param func: callable to measure.
+    :param repeat: number of runs.
+    :return: minimum, median and mean time in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+    }
+
+
+def format_timing(timing: dict[str, float]) -> str:
+    """
+    Format measured timing for the command output.
+
+    :param timing: timing returned by `measure`.
+    :return: formatted string.
+    """
+    return " / ".join(f"{name} {value:.2f} ms" for name, value in timing.items())
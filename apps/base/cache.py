@@ -0,0 +1,87 @@
+"""
+Tagged cache entries invalidated by versions of their tags.
+
+Every entry stores versions of its tags (e.g. a product, a category or a manufacturer) that
+were current when its data was read. Invalidating a tag replaces its version, so all entries
+tagged with it become stale at once, without scanning the keyspace for their keys.
+"""
+from typing import Any, Iterable, NamedTuple, Optional
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from apps.base.snapshot import bump_versions, get_version
+
+TAG_VERSION_KEY_PREFIX = "tag"
+
+
+class TaggedEntry(NamedTuple):
+    """Cached data together with versions of its tags."""
+
+    data: Any
+    tags: dict[str, str]
+
+
+def get_tag_version_key(tag: str) -> str:
+    """
+    Build the cache key holding the version of the tag.
+
+    :param tag: tag name.
+    :return: cache key.
+    """
+    return f"{TAG_VERSION_KEY_PREFIX}:{tag}"
+
+
+def get_tag_versions(tags: Iterable[str]) -> dict[str, str]:
+    """
+    Retrieve current versions of the tags with a single cache round trip.
+
+    :param tags: tag names.
+    :return: mapping of tags to their versions.
+    """
+    keys = {get_tag_version_key(tag): tag for tag in tags}
+    if not keys:
+        return {}
+
+    versions = cache.get_many(list(keys))
+    for key in keys.keys() - versions.keys():
+        versions[key] = get_version(key)
+    return {keys[key]: version for key, version in versions.items()}
+
+
+def get_tagged(key: str) -> Optional[Any]:
+    """
+    Retrieve cached data, unless any of its tags has been invalidated since it was cached.
+
+    :param key: cache key.
+    :return: cached data or None.
+    """
+    entry = cache.get(key)
+    if not isinstance(entry, TaggedEntry):
+        return None
+    if get_tag_versions(entry.tags) != entry.tags:
+        return None
+    return entry.data
+
+
+def set_tagged(key: str, data: Any, tag_versions: dict[str, str], timeout=DEFAULT_TIMEOUT) -> None:
+    """
+    Cache data together with versions of its tags.
+
+    Versions should be read before the data, so a change made in between invalidates it.
+
+    :param key: cache key.
+    :param data: data to cache.
+    :param tag_versions: versions of the tags, see `get_tag_versions`.
+    :param timeout: cache timeout.
+    """
+    cache.set(key, TaggedEntry(data, tag_versions), timeout=timeout)
+
+
+def invalidate_tags(tags: Iterable[str]) -> None:
+    """
+    Invalidate all cache entries tagged with any of the tags.
+
+    :param tags: tag names.
+    """
+    bump_versions(get_tag_version_key(tag) for tag in set(tags))
@@ -2,10 +2,11 @@
 This file contains mixins for caching.
 """
 from django.conf import settings
-from django.core.cache import cache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from rest_framework.response import Response
 
+from apps.base.cache import get_tag_versions, get_tagged, set_tagged
+
 CACHE_TTL = getattr(settings, "CACHE_TTL", DEFAULT_TIMEOUT)
 
 
@@ -13,7 +14,8 @@ class CachedListMixin:
     """
     A mixin providing common functionality for retrieving a paginated list.
 
-    Note, that you need to declare get_cache_key method inside your class
+    Note, that you need to declare get_cache_key method inside your class. Cached lists
+    are invalidated by tags returned from get_cache_tags method.
     """
 
     def get_cache_key(self) -> str:
@@ -26,6 +28,23 @@ class CachedListMixin:
             f"The 'get_cache_key' method must be implemented in {self.__class__.__name__} class."
         )
 
+    def get_cache_tags(self) -> list[str]:
+        """
+        Method to get tags of the cached list, e.g. "category:<id>".
+
+        :return: list of tags
+        """
+        return []
+
+    def get_page_cache_tags(self, rows) -> list[str]:
+        """
+        Method to get tags depending on rows of the list, e.g. "manufacturer_products:<id>".
+
+        :param rows: page or queryset of rows of the list.
+        :return: list of tags
+        """
+        return []
+
     def list(self, request, *args, **kwargs) -> Response:
         """
         Retrieve a paginated list.
@@ -38,11 +57,12 @@ class CachedListMixin:
         cache_key = self.get_cache_key()
 
         # Try to get data from cache
-        cached_data = cache.get(cache_key)
+        cached_data = get_tagged(cache_key)
         if cached_data is not None:
             return Response(cached_data)
 
         # If not in cache, fetch from the database
+        tag_versions = get_tag_versions(self.get_cache_tags())
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -51,9 +71,13 @@ class CachedListMixin:
         else:
             serializer = self.get_serializer(queryset, many=True)
             data = serializer.data
+        # Tags of rows are only known after fetching them, so they are read right after.
+        tag_versions.update(
+            get_tag_versions(self.get_page_cache_tags(page if page is not None else queryset))
+        )
 
         # Set data in cache for future requests
-        cache.set(cache_key, data, timeout=CACHE_TTL)
+        set_tagged(cache_key, data, tag_versions, timeout=CACHE_TTL)
 
         return Response(data)
 
@@ -62,7 +86,8 @@ class CachedRetrieveMixin:
     """
     A mixin providing common functionality for retrieving a single object.
 
-    Note, that you need to declare get_cache_key method inside your class
+    Note, that you need to declare get_cache_key method inside your class. Cached objects
+    are invalidated by tags returned from get_cache_tags method.
     """
 
     def get_cache_key(self) -> str:
@@ -75,6 +100,15 @@ class CachedRetrieveMixin:
             f"The 'get_cache_key' method must be implemented in {self.__class__.__name__} class."
         )
 
+    def get_cache_tags(self, instance) -> list[str]:
+        """
+        Method to get tags of the cached object, e.g. "product:<id>".
+
+        :param instance: retrieved object.
+        :return: list of tags
+        """
+        return []
+
     def retrieve(self, request, *args, **kwargs) -> Response:
         """
         Retrieve a single object.
@@ -87,16 +121,18 @@ class CachedRetrieveMixin:
         cache_key = self.get_cache_key()
 
         # Try to get data from cache
-        cached_data = cache.get(cache_key)
+        cached_data = get_tagged(cache_key)
         if cached_data is not None:
             return Response(cached_data)
 
         # if not in cache, fetch from the database
         instance = self.get_object()
+        # Tags depend on the object, so their versions are read right after fetching it.
+        tag_versions = get_tag_versions(self.get_cache_tags(instance))
         serializer = self.get_serializer(instance)
         data = serializer.data
 
         # set data in cache for future requests
-        cache.set(cache_key, data, timeout=CACHE_TTL)
+        set_tagged(cache_key, data, tag_versions, timeout=CACHE_TTL)
 
         return Response(data)
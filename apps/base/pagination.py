@@ -4,7 +4,18 @@ Common Pagination Module.
 This module contains a custom pagination class for lists of instances in
 a Django REST framework application.
 """
-from rest_framework.pagination import PageNumberPagination
+from datetime import date, datetime, time
+from typing import Any, Optional
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, ValidationError
+from django.db.models import F, Field, Model, Q, QuerySet
+from django.db.models.expressions import OrderBy
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class PaginationCommon(PageNumberPagination):
@@ -17,3 +28,312 @@ class PaginationCommon(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks by the value of the ordering field instead of an offset.
+
+    The active ordering is taken from the queryset (e.g. applied by OrderingFilter) or from
+    the model Meta, only its first field or annotation is used and the primary key is added
+    as a tiebreak, so every page costs one indexed query without COUNT(*) and results stay
+    stable when new rows are inserted. NULL values are treated as greater than any other value.
+
+    Cursors are opaque signed tokens holding the position of the first or last row
+    of the page.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    cursor_salt = "apps.base.pagination.KeysetPagination"
+    invalid_cursor_message = _("Invalid cursor")
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request, view=None
+    ) -> Optional[list[Model | dict]]:
+        """
+        Retrieve a page of rows after or before the position of the requested cursor.
+
+        :param queryset: ordered queryset to paginate.
+        :param request: The HTTP request object.
+        :param view: view the pagination is used for.
+        :return: list of rows of the page.
+        """
+        self.request = request
+        self.base_url = remove_query_param(request.build_absolute_uri(), "page")
+        self.page_size = self.get_page_size(request)
+        self.field_name, self.field, self.descending = self.get_ordering(queryset)
+        self.ordering = f"{'-' if self.descending else ''}{self.field_name}"
+        self.pk_field = queryset.model._meta.pk
+        self.pk_name = self.pk_field.attname
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["reverse"])
+        queryset = queryset.order_by(*self.get_order_by(reverse))
+        if cursor is not None:
+            queryset = queryset.filter(self.get_seek_filter(cursor, reverse))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data) -> Response:
+        """
+        Return a paginated style response without the total count.
+
+        :param data: serialized rows of the page.
+        :return: response with links to the next and previous pages.
+        """
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """
+        Describe the paginated response.
+
+        :param schema: schema of the results.
+        :return: schema of the paginated response.
+        """
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request) -> int:
+        """
+        Retrieve page size requested by the client.
+
+        :param request: The HTTP request object.
+        :return: page size.
+        """
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_next_link(self) -> Optional[str]:
+        """
+        Build link to the next page.
+
+        :return: URL or None if this is the last page.
+        """
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        """
+        Build link to the previous page.
+
+        :return: URL or None if this is the first page.
+        """
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    @staticmethod
+    def get_ordering(queryset: QuerySet) -> tuple[str, Field, bool]:
+        """
+        Retrieve the primary ordering field of the queryset.
+
+        :param queryset: queryset to paginate.
+        :return: ordering name, model field or annotation output field and whether
+         the ordering is descending.
+        """
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        if not ordering:
+            raise ImproperlyConfigured("Keyset pagination requires an ordered queryset.")
+
+        term = ordering[0]
+        if isinstance(term, OrderBy) and isinstance(term.expression, F):
+            name, descending = term.expression.name, term.descending
+        elif isinstance(term, str):
+            name, descending = term.lstrip("-"), term.startswith("-")
+        else:
+            raise ImproperlyConfigured(f"Unsupported ordering for keyset pagination: {term!r}.")
+
+        if name == "pk":
+            return queryset.model._meta.pk.attname, queryset.model._meta.pk, descending
+
+        if name in queryset.query.annotations:
+            return name, queryset.query.annotations[name].output_field, descending
+
+        try:
+            field = queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            raise ImproperlyConfigured(
+                f"Keyset pagination requires ordering by a model field, got {name!r}."
+            )
+        return field.attname, field, descending
+
+    def get_order_by(self, reverse: bool) -> list[OrderBy]:
+        """
+        Build the ordering of the query, optionally reversed to read previous pages.
+
+        :param reverse: whether to reverse the ordering.
+        :return: list of ordering expressions.
+        """
+        descending = self.descending != reverse
+        if descending:
+            primary = F(self.field_name).desc(nulls_first=True if self.field.null else None)
+            return [primary, F(self.pk_name).desc()]
+
+        primary = F(self.field_name).asc(nulls_last=True if self.field.null else None)
+        return [primary, F(self.pk_name).asc()]
+
+    def get_seek_filter(self, cursor: dict, reverse: bool) -> Q:
+        """
+        Build the condition selecting rows after the cursor position in the query ordering.
+
+        :param cursor: decoded cursor.
+        :param reverse: whether the query ordering is reversed.
+        :return: filter condition.
+        """
+        name = self.field_name
+        value, pk = cursor["value"], cursor["pk"]
+
+        if self.descending == reverse:
+            # Rows with greater values, NULL values come last.
+            if value is None:
+                return Q(**{f"{name}__isnull": True, f"{self.pk_name}__gt": pk})
+            condition = Q(**{f"{name}__gt": value}) | Q(**{name: value, f"{self.pk_name}__gt": pk})
+            if self.field.null:
+                condition |= Q(**{f"{name}__isnull": True})
+            return condition
+
+        # Rows with lower values, NULL values come first.
+        if value is None:
+            return Q(**{f"{name}__isnull": True, f"{self.pk_name}__lt": pk}) | Q(
+                **{f"{name}__isnull": False}
+            )
+        return Q(**{f"{name}__lt": value}) | Q(**{name: value, f"{self.pk_name}__lt": pk})
+
+    def encode_cursor(self, row: Model | dict, *, reverse: bool) -> str:
+        """
+        Build the URL with a signed cursor pointing at the row.
+
+        :param row: model instance or dict the cursor points at.
+        :param reverse: whether the cursor leads to the previous page.
+        :return: URL of the page.
+        """
+        if isinstance(row, dict):
+            value, pk = row.get(self.field_name), row.get(self.pk_name)
+        else:
+            value, pk = getattr(row, self.field_name), getattr(row, self.pk_name)
+
+        token = signing.dumps(
+            {
+                "o": self.ordering,
+                "v": self.serialize_value(value),
+                "pk": self.serialize_value(pk),
+                "r": reverse,
+            },
+            salt=self.cursor_salt,
+            compress=True,
+        )
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request) -> Optional[dict]:
+        """
+        Retrieve the position from the cursor of the request.
+
+        :param request: The HTTP request object.
+        :return: decoded cursor or None if the first page is requested.
+        """
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+
+        try:
+            payload = signing.loads(token, salt=self.cursor_salt)
+            if payload["o"] != self.ordering:
+                raise ValueError("Cursor was created for a different ordering.")
+
+            value = payload["v"]
+            return {
+                "value": None if value is None else self.field.to_python(value),
+                "pk": self.pk_field.to_python(payload["pk"]),
+                "reverse": bool(payload["r"]),
+            }
+        except (signing.BadSignature, ValidationError, KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def serialize_value(value: Any) -> Optional[str]:
+        """
+        Convert a position value into a string keeping its full precision.
+
+        :param value: value of the field.
+        :return: string representation or None.
+        """
+        if value is None:
+            return None
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+        return str(value)
+
+
+class PaginationCommonOrCursor(PaginationCommon):
+    """
+    Page number pagination that switches to keyset pagination on client's request.
+
+    Keyset pagination is used when `?pagination=cursor` or a cursor is provided.
+    """
+
+    cursor_pagination_class = KeysetPagination
+    pagination_query_param = "pagination"
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> Optional[list]:
+        """
+        Paginate the queryset with the pagination selected by the client.
+
+        :param queryset: queryset to paginate.
+        :param request: The HTTP request object.
+        :param view: view the pagination is used for.
+        :return: list of rows of the page.
+        """
+        self.cursor_paginator = None
+        cursor_query_param = self.cursor_pagination_class.cursor_query_param
+        if (
+            request.query_params.get(self.pagination_query_param) == "cursor"
+            or cursor_query_param in request.query_params
+        ):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data) -> Response:
+        """
+        Return a paginated style response of the selected pagination.
+
+        :param data: serialized rows of the page.
+        :return: paginated response.
+        """
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -4,7 +4,12 @@ Module: serializers.py.
 This module contains serializers for handling data serialization in the base app.
 """
 
+from typing import Any, Callable, Optional
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
 
 class BaseDateSerializer(serializers.ModelSerializer):
@@ -12,3 +17,81 @@ class BaseDateSerializer(serializers.ModelSerializer):
 
     createdAt = serializers.DateTimeField(source="created_at", read_only=True)
     updatedAt = serializers.DateTimeField(source="updated_at", read_only=True)
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+    """
+    Read-only list serializer with a fast path for rows returned by `QuerySet.values()`.
+
+    Fields of the child serializer are compiled once per list into pairs of a row key and
+    a converter, so every row is serialized with plain dictionary lookups instead of DRF
+    attribute lookups. Converters are `to_representation` methods of the same fields, so
+    the output is identical to the output of the child serializer. Fields must have
+    a single-level source; rows that are not dictionaries are serialized by the child.
+    """
+
+    def get_compiled_fields(self) -> list[tuple[str, str, Callable[[Any], Any]]]:
+        """
+        Compile readable fields of the child serializer.
+
+        :return: list of tuples of output name, row key and converter.
+        """
+        compiled = []
+        for field in self.child._readable_fields:
+            if len(field.source_attrs) != 1:
+                raise ImproperlyConfigured(
+                    f"Field '{field.field_name}' of {self.child.__class__.__name__} "
+                    "must have a single-level source to be serialized from values."
+                )
+            source = field.source_attrs[0]
+            convert = field.to_representation
+            if isinstance(field, serializers.FileField):
+                convert = self.get_file_converter(field, source)
+            compiled.append((field.field_name, source, convert))
+        return compiled
+
+    def get_file_converter(self, field: serializers.FileField, source: str) -> Callable:
+        """
+        Build a converter of stored file names, rows hold names instead of files.
+
+        :param field: file field of the child serializer.
+        :param source: name of the model file field.
+        :return: converter.
+        """
+        storage = self.child.Meta.model._meta.get_field(source).storage
+        use_url = getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL)
+        request = field.context.get("request")
+
+        def convert(name: str) -> Optional[str]:
+            if not name:
+                return None
+            if not use_url:
+                return name
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+
+        return convert
+
+    def to_representation(self, data) -> list:
+        """
+        Serialize rows, dictionaries are serialized with the compiled fields.
+
+        :param data: rows, model instances or a manager.
+        :return: list of serialized rows.
+        """
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        compiled = None
+        result = []
+        for row in iterable:
+            if not isinstance(row, dict):
+                result.append(self.child.to_representation(row))
+                continue
+            if compiled is None:
+                compiled = self.get_compiled_fields()
+            result.append(
+                {
+                    name: None if (value := row[source]) is None else convert(value)
+                    for name, source, convert in compiled
+                }
+            )
+        return result
@@ -0,0 +1,156 @@
+"""
+Versioned in-process snapshots of rarely changing data.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterable, Optional, TypeVar
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+def get_version(version_key: str) -> str:
+    """
+    Retrieve the current shared version, initializing it if it is missing.
+
+    :param version_key: cache key holding the version.
+    :return: current version token.
+    """
+    version = cache.get(version_key)
+    if version is None:
+        version = uuid4().hex
+        if not cache.add(version_key, version, timeout=None):
+            version = cache.get(version_key, version)
+    return version
+
+
+def bump_versions(version_keys: Iterable[str]) -> None:
+    """
+    Replace shared versions with new tokens, now and after the current transaction commits.
+
+    Bumping again on commit ensures a snapshot built from not yet committed data is not kept.
+
+    :param version_keys: cache keys holding the versions.
+    """
+    version_keys = list(version_keys)
+    if not version_keys:
+        return
+
+    def bump() -> None:
+        cache.set_many({key: uuid4().hex for key in version_keys}, timeout=None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+class VersionedSnapshot(Generic[T]):
+    """
+    Immutable per-process snapshot refreshed when a shared version key changes.
+
+    Every worker keeps the built value in memory and only compares its version with the one
+    stored in the cache, so reads cost a single cache round trip and no database queries.
+    Versions are random tokens, so an evicted version key simply forces a rebuild.
+    """
+
+    def __init__(self, version_key: str, builder: Callable[[], T]) -> None:
+        """
+        Initialize the snapshot.
+
+        :param version_key: cache key holding the current version of the snapshot.
+        :param builder: callable that builds the snapshot value from the database.
+        """
+        self.version_key = version_key
+        self.builder = builder
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._value: Optional[T] = None
+
+    def get(self) -> T:
+        """
+        Retrieve the snapshot, rebuilding it if the shared version has changed.
+
+        :return: snapshot value.
+        """
+        version = get_version(self.version_key)
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    # The version is read before building, so a concurrent invalidation
+                    # leaves this value outdated and it is rebuilt on the next access.
+                    self._value = self.builder()
+                    self._version = version
+        return self._value
+
+    def invalidate(self) -> None:
+        """
+        Bump the shared version, so every worker rebuilds its snapshot on the next access.
+        """
+        bump_versions([self.version_key])
+
+
+class KeyedVersionedSnapshot(Generic[K, T]):
+    """
+    Family of per-process snapshots, each built for a key and versioned separately.
+
+    Invalidating one key (e.g. a category) rebuilds only its snapshot. The least recently
+    used snapshots are dropped when there are more than `max_size` of them.
+    """
+
+    def __init__(
+        self, version_key_prefix: str, builder: Callable[[K], T], max_size: int = 1000
+    ) -> None:
+        """
+        Initialize the snapshot family.
+
+        :param version_key_prefix: prefix of cache keys holding versions of the snapshots.
+        :param builder: callable that builds the snapshot of a key from the database.
+        :param max_size: maximum number of snapshots kept in memory.
+        """
+        self.version_key_prefix = version_key_prefix
+        self.builder = builder
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[K, tuple[str, T]] = OrderedDict()
+
+    def get_version_key(self, key: K) -> str:
+        """
+        Build the cache key holding the version of the snapshot.
+
+        :param key: key of the snapshot.
+        :return: cache key.
+        """
+        return f"{self.version_key_prefix}:{key}"
+
+    def get(self, key: K) -> T:
+        """
+        Retrieve the snapshot of the key, rebuilding it if its shared version has changed.
+
+        :param key: key of the snapshot.
+        :return: snapshot value.
+        """
+        version = get_version(self.get_version_key(key))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        value = self.builder(key)
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, keys: Iterable[K]) -> None:
+        """
+        Bump shared versions of the keys, so their snapshots are rebuilt on the next access.
+
+        :param keys: keys of the snapshots.
+        """
+        bump_versions(self.get_version_key(key) for key in set(keys))
@@ -3,7 +3,6 @@ This module contains the admin configurations for the cart app.
 """
 
 from django.contrib import admin
-from django.core.cache import cache
 
 from apps.cart.models import CartItem, Cart
 
@@ -38,46 +37,6 @@ class CartAdmin(admin.ModelAdmin):
     list_per_page = 10
     list_max_show_all = 100
 
-    def save_model(self, request, obj, form, change):
-        """
-        Override save_model to invalidate cache when cart is saved.
-
-        :param request: HttpRequest object
-        :param obj: Cart instance being saved
-        :param form: ModelForm instance
-        :param change: Boolean indicating if this is a change (True) or a new object (False)
-        """
-        super().save_model(request, obj, form, change)
-
-        # Invalidate the cart cache
-        cart_id = obj.cart.id
-        cache.delete(f"carts:{cart_id}:{request.path}?{request.GET.urlencode()}")
-
-        # Invalidate related cart items cache
-        cart_items = obj.cart_items.all()
-        for item in cart_items:
-            cache.delete(f"cart_item_detail:{request.path}?{request.GET.urlencode()}:{item.id}")
-        cache.delete(f"cart_item_list:{request.path}?{request.GET.urlencode()}")
-
-    def delete_model(self, request, obj):
-        """
-        Override delete_model to invalidate cache when cart is deleted.
-
-        :param request: HttpRequest object
-        :param obj: Cart instance being deleted
-        """
-        # Invalidate the cart cache
-        cart_id = obj.id
-        cache.delete(f"carts:{cart_id}:{request.path}?{request.GET.urlencode()}")
-
-        # Invalidate related cart items cache
-        cart_items = obj.cart_items.all()
-        for item in cart_items:
-            cache.delete(f"cart_item_detail:{request.path}?{request.GET.urlencode()}:{item.id}")
-        cache.delete(f"cart_item_list:{request.path}?{request.GET.urlencode()}")
-
-        super().delete_model(request, obj)
-
 
 class CartItemAdmin(admin.ModelAdmin):
     """Admin class for CartItem model."""
@@ -100,42 +59,6 @@ class CartItemAdmin(admin.ModelAdmin):
     list_per_page = 10
     list_max_show_all = 100
 
-    def save_model(self, request, obj, form, change):
-        """
-        Override save_model to invalidate cache when a cart item is saved.
-
-        :param request: HttpRequest object
-        :param obj: CartItem instance being saved
-        :param form: ModelForm instance
-        :param change: Boolean indicating if this is a change (True) or a new object (False)
-        """
-        super().save_model(request, obj, form, change)
-
-        # Invalidate the cart item cache
-        cache.delete(f"cart_item_detail:{request.path}?{request.GET.urlencode()}:{obj.id}")
-        cache.delete(f"cart_item_list:{request.path}?{request.GET.urlencode()}")
-
-        # Invalidate related cart cache
-        cart_id = obj.cart.id
-        cache.delete(f"carts:{cart_id}:{request.path}?{request.GET.urlencode()}")
-
-    def delete_model(self, request, obj):
-        """
-        Override delete_model to invalidate cache when an cart item is deleted.
-
-        :param request: HttpRequest object
-        :param obj: CartITem instance being deleted
-        """
-        # Invalidate the cart item cache
-        cache.delete(f"cart_item_detail:{request.path}?{request.GET.urlencode()}:{obj.id}")
-        cache.delete(f"cart_item_list:{request.path}?{request.GET.urlencode()}")
-
-        # Invalidate related cart cache
-        cart_id = obj.cart.id
-        cache.delete(f"carts:{cart_id}:{request.path}?{request.GET.urlencode()}")
-
-        super().delete_model(request, obj)
-
 
 admin.site.register(Cart, CartAdmin)
 admin.site.register(CartItem, CartItemAdmin)
@@ -0,0 +1,106 @@
+"""
+Management command to benchmark adding items to carts with the SQL and Redis cart storages.
+"""
+import random
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from apps.base.benchmark import format_timing, measure, rolled_back
+from apps.cart.models import Cart
+from apps.cart.services.storage import (
+    DIRTY_CARTS_KEY,
+    RedisCartStorage,
+    SQLCartStorage,
+    get_redis_client,
+)
+from apps.product.models import Category, Manufacturer, Product
+
+
+class Command(BaseCommand):
+    """Compare throughput of adding items to carts with the SQL and Redis storages."""
+
+    help = (
+        "Compare throughput of adding items to carts with the SQL and Redis cart storages. "
+        "Redis is reached with CART_REDIS_URL, synthetic data is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument("--products", type=int, default=50, help="Number of products.")
+        parser.add_argument(
+            "--operations", type=int, default=1000, help="Number of added items per run."
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Number of runs.")
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        client = get_redis_client()
+        try:
+            client.ping()
+        except RedisConnectionError as error:
+            raise CommandError(f"Redis is unavailable: {error}")
+
+        operations, repeat = options["operations"], options["repeat"]
+        with rolled_back():
+            user, products = self.create_data(options["products"])
+            added = [random.choice(products) for _ in range(operations)]
+            carts = []
+
+            def add_items(storage):
+                cart = Cart.objects.create(user=user, is_active=False)
+                carts.append(cart)
+                for product in added:
+                    storage.add_item(cart, product, 1)
+                return cart
+
+            redis_storage = RedisCartStorage(client)
+            try:
+                for name, func in (
+                    ("sql", lambda: add_items(SQLCartStorage())),
+                    ("redis", lambda: add_items(redis_storage)),
+                    ("redis with flush", lambda: redis_storage.flush(add_items(redis_storage))),
+                ):
+                    timing = measure(func, repeat=repeat)
+                    self.stdout.write(
+                        f"{name}: {operations / timing['median'] * 1000:.0f} items/s "
+                        f"({format_timing(timing)})"
+                    )
+            finally:
+                for cart in carts:
+                    client.delete(*RedisCartStorage.get_keys(cart.pk))
+                    client.srem(DIRTY_CARTS_KEY, str(cart.pk))
+
+    def create_data(self, products_count: int) -> tuple:
+        """
+        Create a synthetic user and products.
+
+        :param products_count: number of products.
+        :return: user and products.
+        """
+        user = get_user_model().objects.create_user(
+            email="benchmark-cart@example.com", password="benchmark"
+        )
+        category = Category.objects.create(name="Benchmark category", level=0)
+        manufacturer = Manufacturer.objects.create(
+            trade_brand="Benchmark", country="Benchmark", country_brand_registration="Benchmark"
+        )
+        products = Product.objects.bulk_create(
+            Product(
+                name=f"Benchmark cart product {i}",
+                slug=f"benchmark-cart-product-{i}",
+                product_code=f"CART-{i}",
+                price=100,
+                price_discount=100,
+                manufacturer=manufacturer,
+                categories=category,
+                image="product/default.jpg",
+            )
+            for i in range(products_count)
+        )
+        return user, products
@@ -0,0 +1,26 @@
+"""
+Management command to write pending changes of carts to the database.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.cart.services.storage import get_cart_storage
+
+
+class Command(BaseCommand):
+    """Write carts changed in the cart storage to the database."""
+
+    help = (
+        "Write carts changed in the cart storage to the database. Run it periodically when "
+        "CART_STORAGE is 'redis', with the 'sql' storage there is nothing to write."
+    )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        result = get_cart_storage().flush_pending()
+        self.stdout.write(self.style.SUCCESS(f"Carts flushed: {result.flushed}."))
+        if result.failed:
+            self.stderr.write(
+                self.style.ERROR(f"Carts failed to flush: {result.failed}, they stay dirty.")
+            )
@@ -0,0 +1,65 @@
+"""
+Management command to purge inactive and stale carts.
+"""
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.cart.services.purge import DEFAULT_BATCH_SIZE, empty_stale_carts, purge_inactive_carts
+from apps.cart.services.storage import get_cart_storage
+
+
+class Command(BaseCommand):
+    """Delete old inactive carts and empty active carts nobody has touched for long."""
+
+    help = (
+        "Delete old inactive carts and empty active carts nobody has touched for long. Carts "
+        "are processed in batches skipping carts locked by requests, run it periodically."
+    )
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--inactive-days",
+            type=int,
+            default=30,
+            help="Delete inactive carts not updated for this number of days.",
+        )
+        parser.add_argument(
+            "--stale-days",
+            type=int,
+            default=90,
+            help="Empty active carts not updated for this number of days.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of carts processed in a transaction.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        # Changes kept in the cart storage are written first, so they count as updates.
+        get_cart_storage().flush_pending()
+
+        now = timezone.now()
+        for name, purge, days in (
+            ("Inactive carts deleted", purge_inactive_carts, options["inactive_days"]),
+            ("Stale carts emptied", empty_stale_carts, options["stale_days"]),
+        ):
+            started = time.perf_counter()
+            result = purge(now - timedelta(days=days), batch_size=options["batch_size"])
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{name}: {result.carts} carts, {result.items} items "
+                    f"in {elapsed:.2f} s ({result.carts / elapsed:.0f} carts/s)."
+                )
+            )
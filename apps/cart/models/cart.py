@@ -2,17 +2,16 @@
 Cart related models for the cart app.
 """
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
 
 from django.contrib.auth import get_user_model
 from django.db import models
 from django.db.models import (
-    DecimalField,
     ExpressionWrapper,
     PositiveIntegerField,
     Q,
     Sum,
     UniqueConstraint,
-    F,
 )
 
 from apps.base.models import BaseID, BaseDate
@@ -39,9 +38,25 @@ class Cart(BaseID, BaseDate):
             )
         ]
 
+    def get_prefetched_items(self) -> Optional[list]:
+        """
+        Retrieve items prefetched with `get_cart_items_prefetch`.
+
+        :return: list of items or None if items aren't prefetched.
+        """
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        return list(prefetched["items"]) if "items" in prefetched else None
+
     @property
     def total_quantity(self):
-        """Count the total number of items in the cart."""
+        """
+        Count the total number of items in the cart.
+
+        Prefetched items are summed without a query.
+        """
+        items = self.get_prefetched_items()
+        if items is not None:
+            return sum(item.quantity for item in items)
         return (
             self.items.aggregate(
                 total_quantity=ExpressionWrapper(
@@ -53,17 +68,16 @@ class Cart(BaseID, BaseDate):
 
     @property
     def total_price(self):
-        """Calculate the total cost of items in the cart."""
-        total_price = self.items.aggregate(
-            total_price=Sum(
-                ExpressionWrapper(
-                    F("quantity")
-                    * F("product__price")
-                    * ((100 - F("product__discount_percentage")) / 100),
-                    output_field=DecimalField(),
-                )
-            )
-        )["total_price"] or Decimal("0")
+        """
+        Calculate the total cost of items in the cart.
+
+        Unrounded costs of items are summed in Python and rounded once, exactly like the total
+        of an order, prefetched items are summed without a query.
+        """
+        items = self.get_prefetched_items()
+        if items is None:
+            items = self.items.select_related("product")
+        total_price = sum((item.unrounded_cost for item in items), Decimal("0"))
         return Decimal(total_price).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
     def __str__(self) -> str:
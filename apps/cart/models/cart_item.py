@@ -7,6 +7,7 @@ from decimal import Decimal, ROUND_HALF_UP
 
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 
 from apps.base.models import BaseID, BaseDate
@@ -34,10 +35,31 @@ class CartItem(BaseID, BaseDate):
         """
         return f"CartItem for {self.product} for {self.cart}, " f"cost - {self.cost}"
 
+    @property
+    def unrounded_cost(self) -> decimal.Decimal:
+        """
+        Calculate the cost of item in the cart from the price and the discount, like in orders.
+
+        The rounded promotional price isn't used, so cart and order totals round the same.
+        """
+        discount = Decimal(str(self.product.discount_percentage)) / Decimal("100")
+        return self.quantity * Decimal(str(self.product.price)) * (Decimal("1") - discount)
+
     @property
     def cost(self) -> decimal.Decimal:
         """Calculate the total cost of item in the cart."""
-        cost = (
-            self.quantity * self.product.price * ((100 - self.product.discount_percentage) / 100)
-        )
-        return Decimal(cost).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return Decimal(self.unrounded_cost).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def get_cart_items_prefetch() -> Prefetch:
+    """
+    Prefetch items of carts together with their products.
+
+    Items of all prefetched carts are loaded with a single query, so costs of items and totals
+    of carts are calculated without further queries.
+
+    :return: prefetch of the `items` relation.
+    """
+    return Prefetch(
+        "items", queryset=CartItem.objects.select_related("product").order_by("created_at")
+    )
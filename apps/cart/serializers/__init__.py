@@ -1,5 +1,5 @@
-from apps.cart.serializers.cart import CartSerializer
-from apps.cart.serializers.cart_item import CartItemSerializer
+from apps.cart.serializers.cart import CartSerializer, GuestCartSerializer
+from apps.cart.serializers.cart_item import CartItemBulkSerializer, CartItemSerializer
 
 
-__all__ = ["CartSerializer", "CartItemSerializer"]
+__all__ = ["CartSerializer", "GuestCartSerializer", "CartItemBulkSerializer", "CartItemSerializer"]
@@ -18,7 +18,7 @@ class CartSerializer(serializers.ModelSerializer):
     totalQuantity = serializers.IntegerField(source="total_quantity", read_only=True)
     totalPrice = serializers.DecimalField(
         source="total_price",
-        max_digits=5,
+        max_digits=12,
         decimal_places=2,
         read_only=True,
     )
@@ -41,3 +41,17 @@ class CartSerializer(serializers.ModelSerializer):
     #     """Update item in Cart. Use the PATCH method."""
     #     items = validated_data.pop("items")
     #     return update_cart(instance, items)
+
+
+class GuestCartSerializer(serializers.Serializer):
+    """Serializer of carts of anonymous visitors, see `services.guest_cart`."""
+
+    token = serializers.CharField(read_only=True)
+    items = CartItemSerializer(many=True, read_only=True)
+    totalQuantity = serializers.IntegerField(source="total_quantity", read_only=True)
+    totalPrice = serializers.DecimalField(
+        source="total_price",
+        max_digits=12,
+        decimal_places=2,
+        read_only=True,
+    )
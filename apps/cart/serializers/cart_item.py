@@ -5,9 +5,12 @@ from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 from apps.cart.models import CartItem
+from apps.cart.services.storage import get_cart_storage
 from apps.product.models import Product
 from apps.product.serializers.product import LiteProductSerializer
 
+CART_BULK_MAX_ITEMS = 100
+
 
 class CartItemSerializer(serializers.ModelSerializer):
     """Serializer for goods in Cart."""
@@ -31,7 +34,7 @@ class CartItemSerializer(serializers.ModelSerializer):
     #     read_only=True,
     # )
     cost = serializers.DecimalField(
-        max_digits=5,
+        max_digits=12,
         decimal_places=2,
         read_only=True,
     )
@@ -66,20 +69,8 @@ class CartItemSerializer(serializers.ModelSerializer):
                 {"productID": "productID is required when creating CartItem instance."}
             )
 
-        # Check if a cart item with the same product already exists in the cart
-        existing_cart_item = CartItem.objects.filter(cart=cart, product=product_id).first()
-
-        if existing_cart_item:
-            # If the item already exists, update its quantity
-            existing_cart_item.quantity += quantity
-            existing_cart_item.save()
-
-            return existing_cart_item
-        else:
-            # If the item does not exist, create a new cart item
-            cart_item = CartItem.objects.create(product=product_id, cart=cart, quantity=quantity)
-
-        return cart_item
+        # Quantities of products already in the cart are increased
+        return get_cart_storage().add_item(cart, product_id, quantity)
 
     def update(self, instance, validated_data):
         """
@@ -89,6 +80,41 @@ class CartItemSerializer(serializers.ModelSerializer):
         :param validated_data: validated data containing info about cart item.
         :return: updated CartItem instance.
         """
-        instance.quantity = validated_data.get("quantity", instance.quantity)
-        instance.save()
-        return instance
+        return get_cart_storage().set_quantity(
+            instance, validated_data.get("quantity", instance.quantity)
+        )
+
+
+class CartItemQuantitySerializer(serializers.Serializer):
+    """Serializer of a product and its quantity in bulk changes of the cart."""
+
+    productID = serializers.UUIDField(source="product_id")
+    quantity = serializers.IntegerField(min_value=1, default=1)
+
+
+class CartItemBulkSerializer(serializers.Serializer):
+    """Serializer of bulk changes of items in the cart."""
+
+    add = CartItemQuantitySerializer(many=True, required=False, default=list)
+    update = CartItemQuantitySerializer(many=True, required=False, default=list)
+    remove = serializers.ListField(child=serializers.UUIDField(), required=False, default=list)
+
+    def validate(self, attrs):
+        """
+        Check that changes aren't empty, too large or repeating products.
+
+        :param attrs: changes of items.
+        :return: validated changes.
+        """
+        product_ids = [
+            *(item["product_id"] for item in attrs["add"]),
+            *(item["product_id"] for item in attrs["update"]),
+            *attrs["remove"],
+        ]
+        if not product_ids:
+            raise ValidationError("At least one of `add`, `update` or `remove` is required.")
+        if len(product_ids) > CART_BULK_MAX_ITEMS:
+            raise ValidationError(f"No more than {CART_BULK_MAX_ITEMS} products can be changed.")
+        if len(set(product_ids)) != len(product_ids):
+            raise ValidationError("Every product can be changed only once.")
+        return attrs
@@ -0,0 +1,44 @@
+"""
+Cache tags of cart app responses.
+
+Responses are cached per user and tagged with the cart they are built from. Every write of a
+cart or its items replaces the version of the cart tag, so cached responses of the cart are
+never served stale, whichever endpoint, admin page or service made the change.
+"""
+from typing import Iterable
+from uuid import UUID
+
+from apps.base.cache import invalidate_tags
+
+
+def get_cart_tag(cart_id: UUID) -> str:
+    """
+    Build the cache tag of the cart and its items.
+
+    :param cart_id: id of the cart.
+    :return: cache tag.
+    """
+    return f"cart:{cart_id}"
+
+
+def get_user_carts_tag(user_id) -> str:
+    """
+    Build the cache tag of carts of the user, e.g. for changes of the active cart.
+
+    :param user_id: id of the user.
+    :return: cache tag.
+    """
+    return f"user_carts:{user_id}"
+
+
+def invalidate_cart_cache(cart_ids: Iterable[UUID], user_ids: Iterable = ()) -> None:
+    """
+    Invalidate cached responses of the carts and, optionally, of carts of the users.
+
+    :param cart_ids: ids of changed carts.
+    :param user_ids: ids of users whose carts were created, deactivated or deleted.
+    """
+    invalidate_tags(
+        [get_cart_tag(cart_id) for cart_id in cart_ids]
+        + [get_user_carts_tag(user_id) for user_id in user_ids]
+    )
@@ -2,64 +2,76 @@
 This module provides functionality for creating carts and associated cart items.
 """
 
+from typing import Iterable
+from uuid import UUID
+
 from django.contrib.auth import get_user_model
-from django.db import transaction
-from django.db.models import F
-from django.shortcuts import get_object_or_404
+from rest_framework.exceptions import ValidationError
 
-from apps.cart.models import CartItem, Cart
+from apps.cart.models import Cart
+from apps.cart.services.storage import get_cart_storage
 from apps.product.models import Product
 
 User = get_user_model()
 
 
-@transaction.atomic
-def update_cart(instance, items):
-    """Update the quantities of items in the cart."""
-    for item in items:
-        product_id = item["product_id"]
-        quantity = item["quantity"]
-        instance.items.filter(product_id=product_id).update(quantity=quantity)
-    return instance
-
+def get_cart_products(product_ids: Iterable[UUID], queryset=None) -> dict[UUID, Product]:
+    """
+    Fetch products added to a cart with a single query.
 
-# def create_or_add_cart_item(
-#     cart: Cart, product_id: UUID, price: decimal, discount_percentage: decimal
-# ) -> CartItem:
-#     """Create a new items or update items and return it."""
-#     cart_item, created = CartItem.objects.get_or_create(
-#         cart=cart,
-#         product_id=product_id,
-#     )
-#     if not created:
-#         cart_item.update()
-#     return cart_item
+    :param product_ids: ids of products.
+    :param queryset: queryset of products, all products by default.
+    :return: products by ids.
+    :raise ValidationError: if any of the products doesn't exist.
+    """
+    product_ids = set(product_ids)
+    queryset = Product.objects.all() if queryset is None else queryset
+    products = queryset.in_bulk(product_ids)
+    missing = product_ids - set(products)
+    if missing:
+        raise ValidationError(
+            {
+                "productID": [
+                    f'Invalid pk "{product_id}" - object does not exist.'
+                    for product_id in sorted(map(str, missing))
+                ]
+            }
+        )
+    return products
 
 
-# def get_product_for_cart(cart: Cart, items: list[dict]):
-#     """Get product, its quantity, price and return it."""
-#     for item in items:
-#         product_id = item["product_id"]
-#         price = get_object_or_404(Product, pk=product_id).price
-#         discount_percentage = get_object_or_404(Product, pk=product_id).discount_percentage
-#         create_or_add_cart_item(cart, product_id, price, discount_percentage)
+def change_cart_items(cart: Cart, add: list[dict], update: list[dict], remove: list[UUID]) -> Cart:
+    """
+    Add, update and remove many items of the cart at once.
 
+    Products of all operations are fetched with a single query and the cart storage writes
+    items in bulk, so the number of queries doesn't depend on the number of items.
 
-@transaction.atomic
-def create_or_update_cart(items: list[dict], user: User) -> Cart:
-    """Create or update a cart for the specified user with the provided items."""
-    cart, _ = Cart.objects.get_or_create(user=user, is_active=True)
-    for item in items:
-        product_id = item["product_id"]
-        product = get_object_or_404(Product, pk=product_id)  # noqa: F841
-        CartItem.objects.filter(cart=cart, product_id=product_id).update(
-            quantity=F("quantity") + 1
-        )
+    :param cart: active cart.
+    :param add: product ids and quantities added to the cart.
+    :param update: product ids and new quantities of items.
+    :param remove: ids of products removed from the cart.
+    :return: cart.
+    """
+    products = get_cart_products(
+        {item["product_id"] for item in [*add, *update]}, Product.objects.only("pk")
+    )
+    storage = get_cart_storage()
+    storage.change_items(
+        cart,
+        added={products[item["product_id"]]: item["quantity"] for item in add},
+        updated={products[item["product_id"]]: item["quantity"] for item in update},
+        removed=remove,
+    )
+    if remove:
+        deactivate_empty_cart(cart)
     return cart
 
 
 def deactivate_empty_cart(cart: Cart):
     """Make the cart inactive if it's empty."""
-    if cart.items.count() == 0:
+    storage = get_cart_storage()
+    if storage.count_items(cart) == 0:
+        storage.flush(cart)
         cart.is_active = False
         cart.save()
@@ -9,6 +9,7 @@ from django.db.models import QuerySet
 
 from apps.cart.models import CartItem
 from apps.cart.services.cart import deactivate_empty_cart
+from apps.cart.services.storage import get_cart_storage
 
 
 def get_cart_item_detail(pk: UUID) -> QuerySet[CartItem]:
@@ -18,5 +19,5 @@ def get_cart_item_detail(pk: UUID) -> QuerySet[CartItem]:
 
 def delete_cart_item(cart_item, cart):
     """Delete item from the cart."""
-    cart_item.delete()
+    get_cart_storage().remove_item(cart_item)
     deactivate_empty_cart(cart)
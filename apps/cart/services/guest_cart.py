@@ -0,0 +1,163 @@
+"""
+Carts of anonymous visitors.
+
+A guest cart is identified by a signed token, which the client keeps and sends in the
+`X-Guest-Cart` header. Quantities of products are kept in a single cache entry expiring
+`GUEST_CART_TTL` seconds after the last change, so abandoned guest carts disappear without
+database rows or cleanup jobs. On login the guest cart is merged into the active cart of the
+user with one bulk change.
+"""
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from rest_framework.exceptions import ValidationError
+
+from apps.cart.models import Cart, CartItem
+from apps.cart.serializers.cart_item import CART_BULK_MAX_ITEMS
+from apps.cart.services.cart import get_cart_products
+from apps.cart.services.storage import get_cart_storage
+from apps.product.models import Product
+
+GUEST_CART_HEADER = "X-Guest-Cart"
+GUEST_CART_SALT = "apps.cart.guest_cart"
+GUEST_CART_TTL = getattr(settings, "GUEST_CART_TTL", 60 * 60 * 24 * 7)
+
+
+def create_guest_cart_token() -> str:
+    """
+    Create a token of a new guest cart.
+
+    :return: signed token.
+    """
+    return signing.dumps(uuid4().hex, salt=GUEST_CART_SALT)
+
+
+def get_guest_cart_id(token: str) -> str:
+    """
+    Retrieve the id of the guest cart from its token.
+
+    :param token: signed token.
+    :return: id of the guest cart.
+    :raise ValidationError: if the token is forged or malformed.
+    """
+    try:
+        return signing.loads(token, salt=GUEST_CART_SALT)
+    except signing.BadSignature:
+        raise ValidationError({"detail": "Invalid guest cart token."})
+
+
+def get_guest_cart_key(cart_id: str) -> str:
+    """
+    Build the cache key of the guest cart.
+
+    :param cart_id: id of the guest cart.
+    :return: cache key.
+    """
+    return f"guest_cart:{cart_id}"
+
+
+def get_guest_cart_quantities(token: Optional[str]) -> dict[str, int]:
+    """
+    Retrieve quantities of products in the guest cart.
+
+    :param token: signed token or None.
+    :return: quantities by product ids, empty for missing or expired carts.
+    """
+    if not token:
+        return {}
+    return cache.get(get_guest_cart_key(get_guest_cart_id(token))) or {}
+
+
+def change_guest_cart(
+    token: str, add: list[dict], update: list[dict], remove: list[UUID]
+) -> dict[str, int]:
+    """
+    Add, update and remove items of the guest cart and prolong its expiration.
+
+    :param token: signed token.
+    :param add: product ids and quantities added to the cart.
+    :param update: product ids and new quantities of items.
+    :param remove: ids of products removed from the cart.
+    :return: new quantities by product ids.
+    """
+    get_cart_products({item["product_id"] for item in [*add, *update]}, Product.objects.only("pk"))
+    quantities = get_guest_cart_quantities(token)
+    for item in add:
+        product_id = str(item["product_id"])
+        quantities[product_id] = quantities.get(product_id, 0) + item["quantity"]
+    for item in update:
+        quantities[str(item["product_id"])] = item["quantity"]
+    for product_id in remove:
+        quantities.pop(str(product_id), None)
+    if len(quantities) > CART_BULK_MAX_ITEMS:
+        raise ValidationError(f"Guest carts can't hold more than {CART_BULK_MAX_ITEMS} products.")
+
+    cache.set(get_guest_cart_key(get_guest_cart_id(token)), quantities, timeout=GUEST_CART_TTL)
+    return quantities
+
+
+def get_guest_cart_summary(token: Optional[str], quantities: dict[str, int]) -> dict:
+    """
+    Build the guest cart with its items and totals for serialization.
+
+    Products are fetched with a single query, products deleted meanwhile are skipped.
+
+    :param token: signed token or None.
+    :param quantities: quantities by product ids.
+    :return: token, unsaved cart items and totals.
+    """
+    products = Product.objects.in_bulk([UUID(product_id) for product_id in quantities])
+    items = [
+        CartItem(product=products[UUID(product_id)], quantity=quantity)
+        for product_id, quantity in quantities.items()
+        if UUID(product_id) in products
+    ]
+    return {
+        "token": token,
+        "items": items,
+        "total_quantity": sum(item.quantity for item in items),
+        "total_price": sum((item.unrounded_cost for item in items), Decimal("0")).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        ),
+    }
+
+
+def merge_guest_cart(token: Optional[str], user) -> Optional[Cart]:
+    """
+    Add items of the guest cart to the active cart of the user and delete the guest cart.
+
+    Quantities of products already in the cart are summed. Items are written with a single
+    bulk change, products deleted meanwhile are skipped.
+
+    :param token: signed token or None.
+    :param user: user who logged in.
+    :return: active cart of the user or None if there was nothing to merge.
+    """
+    try:
+        quantities = get_guest_cart_quantities(token)
+    except ValidationError:
+        # A forged token must not prevent logging in
+        return None
+    if not quantities:
+        return None
+    # Deleting the guest cart claims it, so concurrent logins with the token merge it once.
+    if not cache.delete(get_guest_cart_key(get_guest_cart_id(token))):
+        return None
+
+    products = Product.objects.only("pk").in_bulk([UUID(product_id) for product_id in quantities])
+    cart, _ = Cart.objects.get_or_create(user=user, is_active=True)
+    get_cart_storage().change_items(
+        cart,
+        added={
+            products[UUID(product_id)]: quantity
+            for product_id, quantity in quantities.items()
+            if UUID(product_id) in products
+        },
+        updated={},
+        removed=[],
+    )
+    return cart
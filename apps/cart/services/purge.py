@@ -0,0 +1,126 @@
+"""
+Purging of inactive and stale carts.
+
+Every order deactivates a cart and users get a new one, so inactive carts pile up. Ordered
+items are copied to orders, so inactive carts aren't needed after a while and are deleted.
+Active carts nobody has touched for long are emptied, users keep their carts.
+
+Carts are processed in small batches ordered by id, every batch in its own transaction. Rows
+locked by concurrent cart writes are skipped (`SKIP LOCKED` where the database supports it),
+so the purge never waits for requests and is retried on the next run for skipped carts.
+"""
+from datetime import datetime
+from functools import partial
+from typing import NamedTuple
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+
+from apps.cart.models import Cart, CartItem
+from apps.cart.services.cache import invalidate_cart_cache
+from apps.cart.services.storage import get_cart_storage
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class PurgeResult(NamedTuple):
+    """Numbers of processed carts and deleted items."""
+
+    carts: int
+    items: int
+
+
+def process_in_batches(
+    carts: QuerySet, process, batch_size: int, no_key: bool = False
+) -> PurgeResult:
+    """
+    Lock carts in batches skipping locked ones and process every batch in a transaction.
+
+    Batches are selected after the last processed id, so the loop ends even when processed
+    carts still match the queryset.
+
+    :param carts: queryset of processed carts.
+    :param process: function processing ids of locked carts, returns numbers of carts and items.
+    :param batch_size: number of carts processed at once.
+    :param no_key: lock carts with `FOR NO KEY UPDATE`, for processing that keeps cart rows.
+    :return: total numbers of processed carts and deleted items.
+    """
+    carts_count = items_count = 0
+    last_id = None
+    while True:
+        with transaction.atomic():
+            batch = carts.select_for_update(skip_locked=True, no_key=no_key).order_by("pk")
+            if last_id is not None:
+                batch = batch.filter(pk__gt=last_id)
+            cart_ids = list(batch.values_list("pk", flat=True)[:batch_size])
+            if not cart_ids:
+                break
+            processed_carts, deleted_items = process(cart_ids)
+        carts_count += processed_carts
+        items_count += deleted_items
+        last_id = cart_ids[-1]
+    return PurgeResult(carts_count, items_count)
+
+
+def delete_carts(cart_ids: list) -> tuple[int, int]:
+    """
+    Delete carts and their items.
+
+    :param cart_ids: ids of locked carts.
+    :return: numbers of deleted carts and items.
+    """
+    items = CartItem.objects.filter(cart_id__in=cart_ids).delete()[0]
+    return Cart.objects.filter(pk__in=cart_ids).delete()[0], items
+
+
+def empty_carts(cart_ids: list, before: datetime) -> tuple[int, int]:
+    """
+    Delete items of carts updated before the date.
+
+    Items written meanwhile by requests not locking the cart are kept, and carts changed in the
+    cart storage since the purge started are skipped. Items are deleted with a single query
+    without signals, which would write pending changes of the carts into the deleted rows, so
+    cached responses of the carts are invalidated here.
+
+    :param cart_ids: ids of locked carts.
+    :param before: date of the last update of deleted items.
+    :return: numbers of emptied carts and deleted items.
+    """
+    dirty_ids = get_cart_storage().get_dirty_cart_ids(cart_ids)
+    cart_ids = [cart_id for cart_id in cart_ids if cart_id not in dirty_ids]
+    items = CartItem.objects.filter(cart_id__in=cart_ids, updated_at__lt=before)
+    deleted = items._raw_delete(items.db)
+    invalidate_cart_cache(cart_ids)
+    return len(cart_ids), deleted
+
+
+def purge_inactive_carts(before: datetime, batch_size: int = DEFAULT_BATCH_SIZE) -> PurgeResult:
+    """
+    Delete inactive carts last updated before the date.
+
+    :param before: date of the last update of deleted carts.
+    :param batch_size: number of carts deleted at once.
+    :return: numbers of deleted carts and items.
+    """
+    carts = Cart.objects.filter(is_active=False, updated_at__lt=before)
+    # Deleted carts need the full row lock.
+    return process_in_batches(carts, delete_carts, batch_size)
+
+
+def empty_stale_carts(before: datetime, batch_size: int = DEFAULT_BATCH_SIZE) -> PurgeResult:
+    """
+    Delete items of active carts whose cart and items weren't updated since the date.
+
+    :param before: date of the last update of emptied carts.
+    :param batch_size: number of carts emptied at once.
+    :return: numbers of emptied carts and deleted items.
+    """
+    items = CartItem.objects.filter(cart=OuterRef("pk"))
+    carts = Cart.objects.filter(
+        Exists(items),
+        ~Exists(items.filter(updated_at__gte=before)),
+        is_active=True,
+        updated_at__lt=before,
+    )
+    # Emptied carts are kept, so the weaker lock doesn't block inserts of items referencing them.
+    return process_in_batches(carts, partial(empty_carts, before=before), batch_size, no_key=True)
@@ -0,0 +1,522 @@
+"""
+Storage backends of cart items.
+
+Cart mutations go through a backend chosen by the `CART_STORAGE` setting:
+
+- "sql" (default) writes items to the `cart_items` table right away.
+- "redis" keeps quantities of active carts in Redis hashes (product id -> quantity), so adding
+  an item is an atomic `HINCRBY` without database round trips. Changed carts are marked
+  dirty and written to the database later: by the `flush_carts` management command, before
+  the cart is read from the database and at checkout. Copies of carts are deleted once
+  they are written, and items written to the database directly, e.g. in the admin, first
+  write pending changes of their cart and then discard its copy.
+
+Reads always use the database, backends only have to flush pending changes before them.
+Every change invalidates cached responses of the cart, including changes kept in Redis and
+bulk queries sending no model signals.
+"""
+import logging
+from contextvars import ContextVar
+from functools import partial
+from typing import Callable, Iterable, NamedTuple, Optional
+from uuid import UUID, uuid4
+
+import redis
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.cart.models import Cart, CartItem
+from apps.cart.services.cache import invalidate_cart_cache
+from apps.product.models import Product
+
+DIRTY_CARTS_KEY = "carts:dirty"
+
+logger = logging.getLogger(__name__)
+
+_redis_client = None
+# Set while carts are written from Redis, so their item signals don't discard the copies.
+_flushing = ContextVar("cart_storage_flushing", default=False)
+
+
+class FlushResult(NamedTuple):
+    """Numbers of flushed carts and carts failed to be flushed."""
+
+    flushed: int
+    failed: int
+
+
+class SQLCartStorage:
+    """
+    Storage writing cart items to the database.
+    """
+
+    def add_item(self, cart: Cart, product: Product, quantity: int) -> CartItem:
+        """
+        Add the quantity of the product to the cart.
+
+        :param cart: active cart.
+        :param product: product.
+        :param quantity: added quantity.
+        :return: cart item with the new quantity.
+        """
+        item = CartItem.objects.filter(cart=cart, product=product).first()
+        if item is None:
+            return CartItem.objects.create(cart=cart, product=product, quantity=quantity)
+        CartItem.objects.filter(pk=item.pk).update(
+            quantity=F("quantity") + quantity, updated_at=timezone.now()
+        )
+        invalidate_cart_cache([cart.pk])
+        item.refresh_from_db(fields=["quantity"])
+        return item
+
+    def set_quantity(self, item: CartItem, quantity: int) -> CartItem:
+        """
+        Replace the quantity of the cart item.
+
+        :param item: stored cart item.
+        :param quantity: new quantity.
+        :return: cart item with the new quantity.
+        """
+        item.quantity = quantity
+        item.save(update_fields=["quantity", "updated_at"])
+        return item
+
+    def remove_item(self, item: CartItem) -> None:
+        """
+        Remove the item from its cart.
+
+        :param item: stored cart item.
+        """
+        item.delete()
+
+    def change_items(
+        self,
+        cart: Cart,
+        added: dict[Product, int],
+        updated: dict[Product, int],
+        removed: Iterable[UUID],
+    ) -> None:
+        """
+        Add, replace and remove quantities of many products of the cart at once.
+
+        The cart row is locked, so concurrent changes of the cart are applied one after
+        another, and items are read, updated, created and deleted with one query each.
+
+        :param cart: active cart.
+        :param added: added quantities by products.
+        :param updated: new quantities by products.
+        :param removed: ids of removed products.
+        """
+        with transaction.atomic():
+            list(Cart.objects.select_for_update().filter(pk=cart.pk).values_list("pk"))
+            products = {product.pk: product for product in [*added, *updated]}
+            stored = {
+                item.product_id: item
+                for item in CartItem.objects.filter(cart=cart, product_id__in=list(products))
+            }
+            changed, created = [], []
+            for product, quantity in [*added.items(), *updated.items()]:
+                item = stored.get(product.pk)
+                if item is None:
+                    created.append(CartItem(cart=cart, product=product, quantity=quantity))
+                    continue
+                item.quantity = item.quantity + quantity if product in added else quantity
+                item.updated_at = timezone.now()
+                changed.append(item)
+            CartItem.objects.bulk_update(changed, ["quantity", "updated_at"])
+            CartItem.objects.bulk_create(created)
+            CartItem.objects.filter(cart=cart, product_id__in=list(removed)).delete()
+            invalidate_cart_cache([cart.pk])
+
+    def count_items(self, cart: Cart) -> int:
+        """
+        Count items of the cart.
+
+        :param cart: cart.
+        :return: number of items.
+        """
+        return cart.items.count()
+
+    def flush(self, cart: Cart) -> None:
+        """
+        Write pending changes of the cart to the database, there are none.
+
+        :param cart: cart.
+        """
+
+    def flush_pending(self) -> FlushResult:
+        """
+        Write pending changes of all carts to the database, there are none.
+
+        :return: numbers of flushed and failed carts.
+        """
+        return FlushResult(0, 0)
+
+    def get_dirty_cart_ids(self, cart_ids: Iterable) -> set:
+        """
+        Select carts with pending changes, there are none.
+
+        :param cart_ids: ids of carts.
+        :return: ids of carts with pending changes.
+        """
+        return set()
+
+    def flush_before_write(self, cart_id) -> None:
+        """
+        Write pending changes of the cart before its items are written directly, there are none.
+
+        :param cart_id: id of the cart.
+        """
+
+    def discard_after_write(self, cart_id) -> None:
+        """
+        Forget copies of the cart after its items are written directly, there are none.
+
+        :param cart_id: id of the cart.
+        """
+
+
+class RedisCartStorage:
+    """
+    Storage keeping quantities of active carts in Redis and writing them to the database later.
+
+    Every cart is kept in two hashes: quantities and ids of items by product ids. Ids of new
+    items are generated in Redis, so items keep their ids when they are written to the
+    database. A cart is copied from the database on its first change and the copy is deleted
+    once it is written back, so carts changed in the database meanwhile are copied again.
+    """
+
+    def __init__(self, client: redis.Redis) -> None:
+        """
+        Initialize the storage.
+
+        :param client: Redis client decoding responses.
+        """
+        self.client = client
+
+    @staticmethod
+    def get_keys(cart_id) -> tuple[str, str, str]:
+        """
+        Build keys of the cart.
+
+        :param cart_id: id of the cart.
+        :return: keys of quantities, ids of items and the loaded marker.
+        """
+        return f"cart:{cart_id}:quantities", f"cart:{cart_id}:ids", f"cart:{cart_id}:loaded"
+
+    def run_changes(self, cart: Cart, add_commands: Callable) -> list:
+        """
+        Run commands changing quantities of the cart and mark the cart dirty atomically.
+
+        The transaction watches the loaded marker: a cart without a copy is copied from the
+        database in the same transaction, and the transaction is retried when the copy is
+        deleted by a concurrent flush, so changes are never applied to a partial copy.
+
+        :param cart: cart.
+        :param add_commands: function adding commands to the pipeline.
+        :return: results of the added commands.
+        """
+        quantities_key, ids_key, loaded_key = self.get_keys(cart.pk)
+        first = 0
+
+        def write(pipe) -> None:
+            nonlocal first
+            items = None
+            if not pipe.exists(loaded_key):
+                items = list(cart.items.values_list("product_id", "id", "quantity"))
+            pipe.multi()
+            first = 0
+            if items is not None:
+                pipe.delete(quantities_key, ids_key)
+                if items:
+                    pipe.hset(quantities_key, mapping={str(p): q for p, _, q in items})
+                    pipe.hset(ids_key, mapping={str(p): str(pk) for p, pk, _ in items})
+                pipe.set(loaded_key, 1)
+                first = 4 if items else 2
+            add_commands(pipe)
+            pipe.sadd(DIRTY_CARTS_KEY, str(cart.pk))
+
+        results = self.client.transaction(write, loaded_key)
+        invalidate_cart_cache([cart.pk])
+        return results[first:-1]
+
+    def change(self, cart: Cart, product_id: UUID, command: str, *args) -> list:
+        """
+        Run a command changing the quantity of the product in the cart.
+
+        :param cart: cart.
+        :param product_id: id of the product.
+        :param command: name of the command run on the hash of quantities.
+        :param args: arguments of the command after the product id.
+        :return: results of the command and of reading the id of the item.
+        """
+        quantities_key, ids_key, _ = self.get_keys(cart.pk)
+
+        def add_commands(pipe) -> None:
+            getattr(pipe, command)(quantities_key, str(product_id), *args)
+            pipe.hsetnx(ids_key, str(product_id), str(uuid4()))
+            pipe.hget(ids_key, str(product_id))
+
+        return self.run_changes(cart, add_commands)
+
+    def add_item(self, cart: Cart, product: Product, quantity: int) -> CartItem:
+        """
+        Add the quantity of the product to the cart with an atomic increment.
+
+        :param cart: active cart.
+        :param product: product.
+        :param quantity: added quantity.
+        :return: unsaved cart item with the new quantity.
+        """
+        new_quantity, _, item_id = self.change(cart, product.pk, "hincrby", quantity)
+        return CartItem(id=UUID(item_id), cart=cart, product=product, quantity=new_quantity)
+
+    def set_quantity(self, item: CartItem, quantity: int) -> CartItem:
+        """
+        Replace the quantity of the cart item.
+
+        :param item: stored cart item.
+        :param quantity: new quantity.
+        :return: cart item with the new quantity.
+        """
+        self.change(item.cart, item.product_id, "hset", quantity)
+        item.quantity = quantity
+        return item
+
+    def remove_item(self, item: CartItem) -> None:
+        """
+        Remove the item from its cart.
+
+        :param item: stored cart item.
+        """
+        quantities_key, ids_key, _ = self.get_keys(item.cart_id)
+
+        def add_commands(pipe) -> None:
+            pipe.hdel(quantities_key, str(item.product_id))
+            pipe.hdel(ids_key, str(item.product_id))
+
+        self.run_changes(item.cart, add_commands)
+
+    def change_items(
+        self,
+        cart: Cart,
+        added: dict[Product, int],
+        updated: dict[Product, int],
+        removed: Iterable[UUID],
+    ) -> None:
+        """
+        Add, replace and remove quantities of many products of the cart in one transaction.
+
+        :param cart: active cart.
+        :param added: added quantities by products.
+        :param updated: new quantities by products.
+        :param removed: ids of removed products.
+        """
+        quantities_key, ids_key, _ = self.get_keys(cart.pk)
+
+        def add_commands(pipe) -> None:
+            for command, quantities in (("hincrby", added), ("hset", updated)):
+                for product, quantity in quantities.items():
+                    getattr(pipe, command)(quantities_key, str(product.pk), quantity)
+                    pipe.hsetnx(ids_key, str(product.pk), str(uuid4()))
+            for product_id in removed:
+                pipe.hdel(quantities_key, str(product_id))
+                pipe.hdel(ids_key, str(product_id))
+
+        self.run_changes(cart, add_commands)
+
+    def count_items(self, cart: Cart) -> int:
+        """
+        Count items of the cart, in the database when it has no copy in Redis.
+
+        :param cart: cart.
+        :return: number of items.
+        """
+        quantities_key, _, loaded_key = self.get_keys(cart.pk)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.exists(loaded_key)
+        pipe.hlen(quantities_key)
+        loaded, count = pipe.execute()
+        return count if loaded else cart.items.count()
+
+    def flush(self, cart: Cart) -> None:
+        """
+        Write pending changes of the cart to the database if it is dirty.
+
+        :param cart: cart.
+        """
+        if self.client.sismember(DIRTY_CARTS_KEY, str(cart.pk)):
+            self.flush_carts([cart.pk])
+
+    def flush_pending(self) -> FlushResult:
+        """
+        Write pending changes of all dirty carts to the database.
+
+        Carts are written one by one, a cart failing to be written stays dirty and doesn't
+        stop writing the others.
+
+        :return: numbers of flushed and failed carts.
+        """
+        flushed = failed = 0
+        for cart_id in self.client.smembers(DIRTY_CARTS_KEY):
+            try:
+                self.flush_carts([cart_id])
+            except Exception:
+                logger.exception("Failed to flush cart %s", cart_id)
+                failed += 1
+            else:
+                flushed += 1
+        return FlushResult(flushed, failed)
+
+    def flush_carts(self, cart_ids: Iterable) -> None:
+        """
+        Write items of carts from Redis to the database and delete their copies.
+
+        A cart is unmarked before its items are read, so changes made during the flush mark it
+        dirty again and keep its copy. Carts failing to be written are marked dirty again.
+
+        :param cart_ids: ids of carts.
+        """
+        for cart_id in cart_ids:
+            quantities_key, ids_key, loaded_key = self.get_keys(cart_id)
+            self.client.srem(DIRTY_CARTS_KEY, str(cart_id))
+            pipe = self.client.pipeline(transaction=True)
+            pipe.exists(loaded_key)
+            pipe.hgetall(quantities_key)
+            pipe.hgetall(ids_key)
+            loaded, quantities, ids = pipe.execute()
+            # A copy deleted meanwhile was written already, there is nothing to write.
+            if not loaded:
+                continue
+            token = _flushing.set(True)
+            try:
+                write_cart_items(
+                    cart_id,
+                    {
+                        UUID(product_id): (UUID(ids[product_id]), int(quantity))
+                        for product_id, quantity in quantities.items()
+                    },
+                )
+            except Exception:
+                self.client.sadd(DIRTY_CARTS_KEY, str(cart_id))
+                raise
+            finally:
+                _flushing.reset(token)
+            transaction.on_commit(partial(self.discard, cart_id))
+
+    def discard(self, cart_id) -> None:
+        """
+        Delete the copy of the cart in Redis unless it has pending changes.
+
+        The transaction watches keys of the copy, so it is retried when the cart is changed
+        meanwhile and the changed copy is kept.
+
+        :param cart_id: id of the cart.
+        """
+        keys = self.get_keys(cart_id)
+
+        def delete(pipe) -> None:
+            if pipe.sismember(DIRTY_CARTS_KEY, str(cart_id)):
+                return
+            pipe.multi()
+            pipe.delete(*keys)
+
+        self.client.transaction(delete, *keys)
+
+    def get_dirty_cart_ids(self, cart_ids: Iterable) -> set:
+        """
+        Select carts with changes not written to the database yet.
+
+        :param cart_ids: ids of carts.
+        :return: ids of carts with pending changes.
+        """
+        cart_ids = list(cart_ids)
+        pipe = self.client.pipeline(transaction=False)
+        for cart_id in cart_ids:
+            pipe.sismember(DIRTY_CARTS_KEY, str(cart_id))
+        return {cart_id for cart_id, dirty in zip(cart_ids, pipe.execute()) if dirty}
+
+    def flush_before_write(self, cart_id) -> None:
+        """
+        Write pending changes of the cart before its items are written to the database directly.
+
+        :param cart_id: id of the cart.
+        """
+        if not _flushing.get() and self.client.sismember(DIRTY_CARTS_KEY, str(cart_id)):
+            self.flush_carts([cart_id])
+
+    def discard_after_write(self, cart_id) -> None:
+        """
+        Delete the copy of the cart once its items written directly are committed.
+
+        Otherwise the copy would overwrite them on the next flush.
+
+        :param cart_id: id of the cart.
+        """
+        if not _flushing.get():
+            transaction.on_commit(partial(self.discard, cart_id))
+
+
+@transaction.atomic
+def write_cart_items(cart_id, items: dict[UUID, tuple[UUID, int]]) -> None:
+    """
+    Make stored items of the cart equal to the given items.
+
+    Items of products deleted meanwhile are skipped.
+
+    :param cart_id: id of the cart.
+    :param items: ids of items and quantities by ids of products.
+    """
+    existing = set(Product.objects.filter(pk__in=list(items)).values_list("pk", flat=True))
+    items = {product_id: item for product_id, item in items.items() if product_id in existing}
+    stored = {item.product_id: item for item in CartItem.objects.filter(cart_id=cart_id)}
+    CartItem.objects.filter(cart_id=cart_id).exclude(product_id__in=list(items)).delete()
+
+    changed, created = [], []
+    for product_id, (item_id, quantity) in items.items():
+        item = stored.get(product_id)
+        if item is None:
+            created.append(
+                CartItem(id=item_id, cart_id=cart_id, product_id=product_id, quantity=quantity)
+            )
+        elif item.quantity != quantity:
+            item.quantity = quantity
+            item.updated_at = timezone.now()
+            changed.append(item)
+    CartItem.objects.bulk_update(changed, ["quantity", "updated_at"])
+    CartItem.objects.bulk_create(created)
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Retrieve the Redis client of cart storage, it is created once per process.
+
+    :return: Redis client.
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.CART_REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+def get_cart_storage() -> "SQLCartStorage | RedisCartStorage":
+    """
+    Retrieve the cart storage configured by the `CART_STORAGE` setting.
+
+    :return: cart storage.
+    """
+    if getattr(settings, "CART_STORAGE", "sql") == "redis":
+        return RedisCartStorage(get_redis_client())
+    return SQLCartStorage()
+
+
+def flush_cart(cart: Optional[Cart]) -> None:
+    """
+    Write pending changes of the cart to the database before it is read.
+
+    :param cart: cart or None.
+    """
+    if cart is not None:
+        get_cart_storage().flush(cart)
@@ -3,10 +3,12 @@ Django signals related to the Cart models.
 """
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
-from apps.cart.models import Cart
+from apps.cart.models import Cart, CartItem
+from apps.cart.services.cache import invalidate_cart_cache
+from apps.cart.services.storage import get_cart_storage
 from apps.order.models.order import Order
 
 User = get_user_model()
@@ -30,6 +32,9 @@ def create_cart_for_user(sender, instance, created, **kwargs):
 @receiver(post_delete, sender=Cart)
 def recreate_cart_for_user(sender, instance, **kwargs):
     """Create a new cart for the user after the existing one is deleted."""
+    # Users already got a new cart when the deleted one was deactivated, e.g. by purging
+    if not instance.is_active:
+        return
     user = instance.user
     # Check if the user exists and if they have any active carts
     if user:
@@ -38,6 +43,30 @@ def recreate_cart_for_user(sender, instance, **kwargs):
             Cart.objects.create(user=user)
 
 
+@receiver([post_save, post_delete], sender=Cart)
+def invalidate_cart(sender, instance, **kwargs):
+    """Invalidate cached responses of the cart and of carts of its user."""
+    invalidate_cart_cache([instance.pk], [instance.user_id])
+
+
+@receiver([post_save, post_delete], sender=CartItem)
+def invalidate_cart_item(sender, instance, **kwargs):
+    """Invalidate cached responses of the cart of the item."""
+    invalidate_cart_cache([instance.cart_id])
+
+
+@receiver([pre_save, pre_delete], sender=CartItem)
+def flush_cart_before_item_write(sender, instance, **kwargs):
+    """Write changes of the cart pending in the cart storage before the item is written."""
+    get_cart_storage().flush_before_write(instance.cart_id)
+
+
+@receiver([post_save, post_delete], sender=CartItem)
+def discard_cart_copy_after_item_write(sender, instance, **kwargs):
+    """Discard the copy of the cart kept by the cart storage, it misses the written item."""
+    get_cart_storage().discard_after_write(instance.cart_id)
+
+
 @receiver(post_save, sender=Order)
 def delete_cart_after_order(sender, instance, created, **kwargs):
     """Make the cart inactive after creating an order."""
@@ -5,12 +5,17 @@ import logging
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from apps.cart.models import Cart, CartItem
+from apps.cart.models.cart_item import get_cart_items_prefetch
+from apps.order.models.order import Order
+from apps.order.models.order_item import OrderItem
+from apps.product.models import Product
 from apps.product.tests.test_product import ProductSetupMixin
 
 User = get_user_model()
@@ -61,6 +66,29 @@ class CartTestCase(ProductSetupMixin, TestCase):
 
         self.assertEqual(self.cart1.total_price, expected_price)
 
+    def test_total_price_equals_order_total(self):
+        """Test that the cart total is rounded like the total of the order made from it."""
+        self.product.price = Decimal("9.99")
+        self.product.discount_percentage = 15
+        self.product.save()
+        self.cart1_item.quantity = 10
+        self.cart1_item.save()
+
+        order = Order.objects.create(order_number="1001", status=Order.OrderStatusChoices.NEW)
+        order_item = OrderItem.objects.create(
+            order=order,
+            product=self.product,
+            quantity=10,
+            price=self.product.price,
+            discount_percentage=self.product.discount_percentage,
+        )
+
+        self.assertEqual(order.total_order_price, Decimal("84.92"))
+        self.assertEqual(self.cart1.total_price, order.total_order_price)
+        self.assertEqual(self.cart1_item.cost, order_item.order_item_cost)
+        cart = Cart.objects.prefetch_related(get_cart_items_prefetch()).get(pk=self.cart1.pk)
+        self.assertEqual(cart.total_price, order.total_order_price)
+
 
 class CartAPITestCase(ProductSetupMixin, APITestCase):
     """TestCase for Cart API to check that it works expected."""
@@ -115,6 +143,80 @@ class CartAPITestCase(ProductSetupMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assert_cart_response_data(response_data[0])
 
+    def test_cart_list_query_count(self):
+        """Test that the cart is read with a constant number of queries and correct totals."""
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse("cart:carts-list")
+        products = Product.objects.bulk_create(
+            Product(
+                name=f"Cart product {i}",
+                slug=f"cart-product-{i}",
+                product_code=f"CART-{i}",
+                price=Decimal("999.99"),
+                price_discount=Decimal("999.99"),
+                manufacturer=self.manufacturer,
+                categories=self.lower_level_category,
+                image="product/default.jpg",
+            )
+            for i in range(199)
+        )
+
+        for items_count in (1, 20, 200):
+            CartItem.objects.bulk_create(
+                CartItem(cart=self.cart, product=product, quantity=2)
+                for product in products[self.cart.items.count() - 1 : items_count - 1]
+            )
+            cache.clear()
+            with self.assertNumQueries(2):
+                response = self.client.get(url)
+
+            cart_data = response.data[0]
+            self.assertEqual(len(cart_data["items"]), items_count)
+            self.assertEqual(cart_data["totalQuantity"], 4 + 2 * (items_count - 1))
+            expected_price = Decimal("360.00") + Decimal("1999.98") * (items_count - 1)
+            self.assertEqual(Decimal(cart_data["totalPrice"]), expected_price)
+
+    def test_cart_list_cache_invalidation(self):
+        """Test that cached carts are served until the cart, its items or products change."""
+        self.addCleanup(cache.clear)
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse("cart:carts-list")
+
+        self.assertEqual(self.client.get(url).data[0]["totalQuantity"], 4)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).data[0]["totalQuantity"], 4)
+
+        item_url = reverse("cart:cart_items-detail", kwargs={"pk": self.cart_item.pk})
+        self.client.put(item_url, {"quantity": 1}, format="json")
+        self.assertEqual(self.client.get(url).data[0]["totalQuantity"], 1)
+
+        CartItem.objects.filter(pk=self.cart_item.pk).first().delete()
+        self.assertEqual(self.client.get(url).data[0]["totalQuantity"], 0)
+
+        CartItem.objects.create(cart=self.cart, product=self.product, quantity=2)
+        self.assertEqual(self.client.get(url).data[0]["totalPrice"], "180.00")
+        self.product.price = 200
+        self.product.save()
+        self.assertEqual(self.client.get(url).data[0]["totalPrice"], "360.00")
+
+        self.cart.is_active = False
+        self.cart.save()
+        self.assertEqual(self.client.get(url).data, [])
+
+    def test_cart_items_cached_per_user(self):
+        """Test that cached cart items of a user are never served to another user."""
+        self.addCleanup(cache.clear)
+        url = reverse("cart:cart_items-list")
+        other_user = User.objects.create_user(email="otheruser@test.com", password="password")
+        CartItem.objects.create(
+            cart=other_user.carts.get(is_active=True), product=self.product, quantity=7
+        )
+
+        self.client.force_authenticate(user=self.admin_user)
+        self.assertEqual(self.client.get(url).data[0]["quantity"], 4)
+        self.client.force_authenticate(user=other_user)
+        self.assertEqual(self.client.get(url).data[0]["quantity"], 7)
+
     def test_cart_list_without_authentication(self):
         """Test user has to be authenticated to make requests."""
         url = reverse("cart:carts-list")
@@ -7,7 +7,9 @@ from decimal import Decimal, ROUND_HALF_UP
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -253,3 +255,73 @@ class CartItemAPITestCase(ProductSetupMixin, APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(CartItem.objects.count(), 0)
+
+    def test_bulk_cart_items(self):
+        """Test adding, updating and removing items in one request returns the cart totals."""
+        url = reverse("cart:cart_items-bulk")
+        data = {
+            "add": [{"productID": self.product2.id, "quantity": 2}],
+            "update": [{"productID": self.product.id, "quantity": 1}],
+        }
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["totalQuantity"], 3)
+        self.assertEqual(response.data["totalPrice"], "290.00")
+        self.assertEqual(len(response.data["items"]), 2)
+
+        data = {"add": [{"productID": self.product2.id}], "remove": [self.product.id]}
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            dict(self.cart.items.values_list("product_id", "quantity")), {self.product2.id: 3}
+        )
+
+        response = self.client.post(url, {"remove": [self.product2.id]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.cart.refresh_from_db()
+        self.assertFalse(self.cart.is_active)
+
+    def test_bulk_cart_items_query_count(self):
+        """Test that the number of queries doesn't depend on the number of changed items."""
+        url = reverse("cart:cart_items-bulk")
+        products = Product.objects.bulk_create(
+            Product(
+                name=f"Bulk Product {i}",
+                slug=f"bulk-product-{i}",
+                price=10,
+                price_discount=10,
+                product_code=f"BULK{i}",
+                manufacturer=self.manufacturer,
+                categories=self.lower_level_category,
+                image="product/default.jpg",
+            )
+            for i in range(20)
+        )
+
+        counts = []
+        for changed in (products[:2], products[2:]):
+            data = {
+                "add": [{"productID": product.id} for product in changed[1:]],
+                "update": [{"productID": changed[0].id, "quantity": 5}],
+                "remove": [self.product.id] if not counts else [],
+            }
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            counts.append(len(queries))
+        self.assertEqual(response.data["totalQuantity"], 5 + 1 + 5 + 17)
+        self.assertLessEqual(counts[1], counts[0])
+
+    def test_bulk_cart_items_validation(self):
+        """Test that empty, repeated and nonexistent products are rejected."""
+        url = reverse("cart:cart_items-bulk")
+        for data in (
+            {},
+            {"add": [{"productID": self.product.id}], "remove": [self.product.id]},
+            {"update": [{"productID": self.product.id, "quantity": 0}]},
+            {"add": [{"productID": uuid.uuid4()}]},
+        ):
+            response = self.client.post(url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, data)
+        self.assertEqual(self.cart.items.get().quantity, 4)
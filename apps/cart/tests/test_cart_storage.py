@@ -0,0 +1,295 @@
+"""
+Test module for storages of cart items.
+"""
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.cart.models import CartItem
+from apps.cart.services.storage import DIRTY_CARTS_KEY, RedisCartStorage
+from apps.product.models import Product
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class FakeRedis:
+    """
+    In-process replacement of the Redis client with commands used by the cart storage.
+
+    Values are stored as strings like responses of a client decoding responses.
+    """
+
+    def __init__(self):
+        """Initialize empty data."""
+        self.data = {}
+
+    def ping(self) -> bool:
+        """Check the connection."""
+        return True
+
+    def exists(self, *keys) -> int:
+        """Count existing keys."""
+        return sum(key in self.data for key in keys)
+
+    def delete(self, *keys) -> int:
+        """Delete keys."""
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def set(self, key, value) -> bool:
+        """Set the string value."""
+        self.data[key] = str(value)
+        return True
+
+    def hset(self, key, field=None, value=None, mapping=None) -> int:
+        """Set fields of the hash."""
+        values = dict(mapping or {})
+        if field is not None:
+            values[field] = value
+        hash_ = self.data.setdefault(key, {})
+        added = len(set(values) - set(hash_))
+        hash_.update({name: str(item) for name, item in values.items()})
+        return added
+
+    def hsetnx(self, key, field, value) -> int:
+        """Set the field of the hash unless it exists."""
+        hash_ = self.data.setdefault(key, {})
+        if field in hash_:
+            return 0
+        hash_[field] = str(value)
+        return 1
+
+    def hincrby(self, key, field, amount=1) -> int:
+        """Increment the field of the hash."""
+        hash_ = self.data.setdefault(key, {})
+        hash_[field] = str(int(hash_.get(field, 0)) + amount)
+        return int(hash_[field])
+
+    def hget(self, key, field):
+        """Read the field of the hash."""
+        return self.data.get(key, {}).get(field)
+
+    def hdel(self, key, *fields) -> int:
+        """Delete fields of the hash."""
+        hash_ = self.data.get(key, {})
+        return sum(hash_.pop(field, None) is not None for field in fields)
+
+    def hgetall(self, key) -> dict:
+        """Read the hash."""
+        return dict(self.data.get(key, {}))
+
+    def hlen(self, key) -> int:
+        """Count fields of the hash."""
+        return len(self.data.get(key, {}))
+
+    def sadd(self, key, *members) -> int:
+        """Add members to the set."""
+        set_ = self.data.setdefault(key, set())
+        added = len(set(members) - set_)
+        set_.update(members)
+        return added
+
+    def srem(self, key, *members) -> int:
+        """Remove members from the set."""
+        set_ = self.data.get(key, set())
+        removed = len(set(members) & set_)
+        set_.difference_update(members)
+        return removed
+
+    def sismember(self, key, member) -> bool:
+        """Check membership in the set."""
+        return member in self.data.get(key, set())
+
+    def smembers(self, key) -> set:
+        """Read the set."""
+        return set(self.data.get(key, set()))
+
+    def pipeline(self, transaction=True) -> "FakePipeline":
+        """Create a pipeline buffering commands."""
+        return FakePipeline(self, buffering=True)
+
+    def transaction(self, func, *watches):
+        """Run the function with a pipeline executing commands until `multi` is called."""
+        pipe = FakePipeline(self, buffering=False)
+        func(pipe)
+        return pipe.execute()
+
+
+class FakePipeline:
+    """Pipeline of `FakeRedis` commands."""
+
+    def __init__(self, client, buffering):
+        """Initialize the pipeline."""
+        self.client = client
+        self.buffering = buffering
+        self.commands = []
+
+    def multi(self) -> None:
+        """Start buffering commands."""
+        self.buffering = True
+
+    def execute(self) -> list:
+        """Run buffered commands."""
+        commands, self.commands = self.commands, []
+        return [command() for command in commands]
+
+    def __getattr__(self, name):
+        """Run or buffer the command of the client."""
+        method = getattr(self.client, name)
+
+        def command(*args, **kwargs):
+            if not self.buffering:
+                return method(*args, **kwargs)
+            self.commands.append(lambda: method(*args, **kwargs))
+            return self
+
+        return command
+
+
+@override_settings(CART_STORAGE="redis")
+class RedisCartStorageTestCase(ProductSetupMixin, APITestCase):
+    """TestCase for cart items kept in Redis and written to the database later."""
+
+    def setUp(self):
+        """Set up basic environment for test case."""
+        self.redis = FakeRedis()
+        patcher = mock.patch(
+            "apps.cart.services.storage.get_redis_client", return_value=self.redis
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        super().product_setup()
+        self.client.force_authenticate(user=self.admin_user)
+        self.cart = self.admin_user.carts.get(is_active=True)
+        self.cart_item = CartItem.objects.create(cart=self.cart, product=self.product, quantity=4)
+        self.product2 = Product.objects.create(
+            name="Test Product 2",
+            slug="test-product-2",
+            price=100.00,
+            product_code="TEST456",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="product/default.jpg",
+        )
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def get_quantities(self) -> dict:
+        """Utility method to read stored quantities of the cart by products."""
+        return dict(self.cart.items.values_list("product_id", "quantity"))
+
+    def test_items_written_before_reads(self):
+        """Test that added items are kept in Redis until the cart is read."""
+        url = reverse("cart:cart_items-list")
+        response = self.client.post(url, {"productID": self.product.id, "quantity": 2})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["quantity"], 6)
+        self.assertEqual(response.data["id"], str(self.cart_item.id))
+
+        response = self.client.post(url, {"productID": self.product2.id, "quantity": 1})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        created_id = response.data["id"]
+        self.assertEqual(self.get_quantities(), {self.product.id: 4})
+        self.assertTrue(self.redis.sismember(DIRTY_CARTS_KEY, str(self.cart.id)))
+
+        response = self.client.get(reverse("cart:carts-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["totalQuantity"], 7)
+        self.assertEqual(self.get_quantities(), {self.product.id: 6, self.product2.id: 1})
+        self.assertEqual(str(self.cart.items.get(product=self.product2).id), created_id)
+        self.assertFalse(self.redis.sismember(DIRTY_CARTS_KEY, str(self.cart.id)))
+
+    def test_update_and_delete_items(self):
+        """Test that updated and removed items are written and empty carts deactivated."""
+        url = reverse("cart:cart_items-detail", kwargs={"pk": self.cart_item.id})
+        response = self.client.put(url, {"quantity": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["quantity"], 3)
+
+        call_command("flush_carts", stdout=StringIO())
+        self.assertEqual(self.get_quantities(), {self.product.id: 3})
+
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(self.cart.items.exists())
+        self.cart.refresh_from_db()
+        self.assertFalse(self.cart.is_active)
+
+    def test_bulk_changes(self):
+        """Test that bulk changes are applied in Redis and written before the cart summary."""
+        data = {
+            "add": [{"productID": self.product2.id, "quantity": 2}],
+            "update": [{"productID": self.product.id, "quantity": 1}],
+        }
+        response = self.client.post(reverse("cart:cart_items-bulk"), data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["totalQuantity"], 3)
+        self.assertEqual(self.get_quantities(), {self.product.id: 1, self.product2.id: 2})
+
+    def test_flush_carts_command(self):
+        """Test that the command writes all dirty carts and failed carts stay dirty."""
+        self.client.post(reverse("cart:cart_items-list"), {"productID": self.product2.id})
+
+        err = StringIO()
+        with mock.patch(
+            "apps.cart.services.storage.write_cart_items", side_effect=RuntimeError
+        ), self.assertLogs("apps.cart.services.storage", level="ERROR"):
+            call_command("flush_carts", stdout=StringIO(), stderr=err)
+        self.assertIn("Carts failed to flush: 1", err.getvalue())
+        self.assertTrue(self.redis.sismember(DIRTY_CARTS_KEY, str(self.cart.id)))
+
+        out = StringIO()
+        call_command("flush_carts", stdout=out)
+        self.assertIn("Carts flushed: 1.", out.getvalue())
+        self.assertEqual(self.get_quantities(), {self.product.id: 4, self.product2.id: 1})
+
+    def test_benchmark_cart_storage(self):
+        """Test that the benchmark reports throughput of both storages and cleans Redis."""
+        out = StringIO()
+        call_command("benchmark_cart_storage", products=3, operations=10, repeat=1, stdout=out)
+        self.assertIn("sql:", out.getvalue())
+        self.assertIn("redis with flush:", out.getvalue())
+        self.assertFalse(self.redis.smembers(DIRTY_CARTS_KEY))
+
+    def test_copy_deleted_after_flush(self):
+        """Test that items written to the database after a flush aren't overwritten."""
+        url = reverse("cart:cart_items-list")
+        self.client.post(url, {"productID": self.product.id})
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("flush_carts", stdout=StringIO())
+        self.assertFalse(self.redis.exists(*RedisCartStorage.get_keys(self.cart.id)))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CartItem.objects.create(cart=self.cart, product=self.product2, quantity=3)
+        self.client.post(url, {"productID": self.product.id})
+        response = self.client.get(reverse("cart:carts-list"))
+        self.assertEqual(response.data[0]["totalQuantity"], 9)
+        self.assertEqual(self.get_quantities(), {self.product.id: 6, self.product2.id: 3})
+
+    def test_direct_write_of_dirty_cart(self):
+        """Test that pending changes are written before items written directly and kept."""
+        self.client.post(reverse("cart:cart_items-list"), {"productID": self.product2.id})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.cart_item.quantity = 9
+            self.cart_item.save()
+        self.assertFalse(self.redis.sismember(DIRTY_CARTS_KEY, str(self.cart.id)))
+        self.assertFalse(self.redis.exists(*RedisCartStorage.get_keys(self.cart.id)))
+        self.assertEqual(self.get_quantities(), {self.product.id: 9, self.product2.id: 1})
+
+    def test_flush_skips_deleted_products(self):
+        """Test that items of products deleted before the flush are skipped."""
+        self.client.post(reverse("cart:cart_items-list"), {"productID": self.product2.id})
+        Product.objects.filter(pk=self.product2.pk).delete()
+
+        out = StringIO()
+        call_command("flush_carts", stdout=out)
+        self.assertIn("Carts flushed: 1.", out.getvalue())
+        self.assertEqual(self.get_quantities(), {self.product.id: 4})
@@ -0,0 +1,131 @@
+"""
+Test module for carts of anonymous visitors.
+"""
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.cart.models import CartItem
+from apps.cart.services.guest_cart import (
+    GUEST_CART_HEADER,
+    get_guest_cart_quantities,
+    merge_guest_cart,
+)
+from apps.product.models import Product
+from apps.product.tests.test_product import ProductSetupMixin
+
+User = get_user_model()
+
+
+class GuestCartTestCase(ProductSetupMixin, APITestCase):
+    """TestCase for guest carts and merging them into carts of users on login."""
+
+    def setUp(self):
+        """Set up basic environment for test case."""
+        super().product_setup()
+        self.product2 = Product.objects.create(
+            name="Test Product 2",
+            slug="test-product-2",
+            price=100.00,
+            product_code="TEST456",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="product/default.jpg",
+        )
+        self.url = reverse("cart:guest-cart")
+
+    def tearDown(self) -> None:
+        """Clear guest carts and cached responses."""
+        cache.clear()
+
+    def test_guest_cart(self):
+        """Test that anonymous visitors change their cart with the returned token."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["token"], response.data["items"]), (None, []))
+
+        data = {"add": [{"productID": self.product.id, "quantity": 2}]}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        token = response.data["token"]
+        headers = {GUEST_CART_HEADER: token}
+
+        data = {
+            "add": [{"productID": self.product.id}, {"productID": self.product2.id}],
+        }
+        self.client.post(self.url, data, format="json", headers=headers)
+        response = self.client.get(self.url, headers=headers)
+        self.assertEqual(response.data["token"], token)
+        self.assertEqual(response.data["totalQuantity"], 4)
+        self.assertEqual(response.data["totalPrice"], "370.00")
+
+        data = {"remove": [self.product.id]}
+        response = self.client.post(self.url, data, format="json", headers=headers)
+        self.assertEqual(response.data["totalQuantity"], 1)
+        self.assertFalse(CartItem.objects.exists())
+
+    def test_invalid_guest_cart_token(self):
+        """Test that forged tokens and nonexistent products are rejected."""
+        response = self.client.get(self.url, headers={GUEST_CART_HEADER: "forged:token"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        data = {"add": [{"productID": self.lower_level_category.id}]}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_merge_guest_cart_on_login(self):
+        """Test that items of the guest cart are added to the cart of the user on login."""
+        credentials = {"email": "guest@example.com", "password": "TestPassword123#"}
+        user = User.objects.create_user(**credentials)
+        cart = user.carts.get(is_active=True)
+        CartItem.objects.create(cart=cart, product=self.product, quantity=4)
+
+        data = {
+            "add": [
+                {"productID": self.product.id, "quantity": 2},
+                {"productID": self.product2.id, "quantity": 3},
+            ]
+        }
+        token = self.client.post(self.url, data, format="json").data["token"]
+
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            credentials,
+            format="json",
+            headers={GUEST_CART_HEADER: token},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            dict(cart.items.values_list("product_id", "quantity")),
+            {self.product.id: 6, self.product2.id: 3},
+        )
+        self.assertEqual(get_guest_cart_quantities(token), {})
+
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            credentials,
+            format="json",
+            headers={GUEST_CART_HEADER: "forged:token"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_merge_guest_cart_once(self):
+        """Test that a guest cart claimed by a concurrent login is not merged again."""
+        data = {"add": [{"productID": self.product2.id, "quantity": 3}]}
+        token = self.client.post(self.url, data, format="json").data["token"]
+        user = User.objects.create_user(email="guest@example.com", password="TestPassword123#")
+        cart = user.carts.get(is_active=True)
+
+        with mock.patch("apps.cart.services.guest_cart.cache.delete", return_value=False):
+            self.assertIsNone(merge_guest_cart(token, user))
+        self.assertFalse(cart.items.exists())
+
+        self.assertEqual(merge_guest_cart(token, user), cart)
+        self.assertIsNone(merge_guest_cart(token, user))
+        self.assertEqual(
+            dict(cart.items.values_list("product_id", "quantity")), {self.product2.id: 3}
+        )
@@ -0,0 +1,110 @@
+"""
+Test module for purging inactive and stale carts.
+"""
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.cart.models import Cart, CartItem
+from apps.cart.services.purge import empty_stale_carts, purge_inactive_carts
+from apps.cart.services.storage import get_cart_storage
+from apps.cart.tests.test_cart_storage import FakeRedis
+from apps.product.tests.test_product import ProductSetupMixin
+
+User = get_user_model()
+
+
+class PurgeCartsTestCase(ProductSetupMixin, TestCase):
+    """TestCase for deleting old inactive carts and emptying stale active carts."""
+
+    def setUp(self):
+        """Set up basic environment for test case."""
+        super().product_setup()
+        self.old = timezone.now() - timedelta(days=100)
+
+        self.users = [
+            User.objects.create_user(email=f"user{i}@example.com", password="pass")
+            for i in range(3)
+        ]
+        self.inactive_carts = [
+            Cart.objects.create(user=user, is_active=False) for user in self.users[:2]
+        ]
+        for cart in self.inactive_carts + [user.carts.get(is_active=True) for user in self.users]:
+            CartItem.objects.create(cart=cart, product=self.product, quantity=1)
+
+    def make_old(self, carts) -> None:
+        """Utility method to move updates of carts and their items to the past."""
+        Cart.objects.filter(pk__in=[cart.pk for cart in carts]).update(updated_at=self.old)
+        CartItem.objects.filter(cart__in=carts).update(updated_at=self.old)
+
+    def test_purge_inactive_carts(self):
+        """Test that only old inactive carts are deleted and users keep their active carts."""
+        self.make_old(self.inactive_carts[:1])
+
+        result = purge_inactive_carts(timezone.now() - timedelta(days=30), batch_size=1)
+        self.assertEqual(result, (1, 1))
+        self.assertFalse(Cart.objects.filter(pk=self.inactive_carts[0].pk).exists())
+        self.assertTrue(Cart.objects.filter(pk=self.inactive_carts[1].pk).exists())
+        self.assertEqual(self.users[0].carts.filter(is_active=True).count(), 1)
+
+    def test_empty_stale_carts(self):
+        """Test that stale active carts are emptied and kept, fresh items are kept."""
+        stale_carts = [user.carts.get(is_active=True) for user in self.users[:2]]
+        self.make_old(stale_carts)
+        CartItem.objects.create(cart=stale_carts[1], product=self.product, quantity=1)
+
+        result = empty_stale_carts(timezone.now() - timedelta(days=90), batch_size=1)
+        self.assertEqual(result, (1, 1))
+        self.assertFalse(stale_carts[0].items.exists())
+        self.assertEqual(stale_carts[1].items.count(), 2)
+        self.assertEqual(Cart.objects.filter(is_active=True).count(), len(self.users) + 1)
+
+    @override_settings(CART_STORAGE="redis")
+    def test_empty_stale_carts_skips_dirty_carts(self):
+        """Test that carts changed in Redis during the purge keep their items and changes."""
+        redis = FakeRedis()
+        patcher = mock.patch("apps.cart.services.storage.get_redis_client", return_value=redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        stale_carts = [user.carts.get(is_active=True) for user in self.users[:2]]
+        self.make_old(stale_carts)
+        get_cart_storage().add_item(stale_carts[0], self.product, 2)
+
+        result = empty_stale_carts(timezone.now() - timedelta(days=90))
+        self.assertEqual(result, (1, 1))
+        self.assertFalse(stale_carts[1].items.exists())
+
+        get_cart_storage().flush_pending()
+        self.assertEqual(stale_carts[0].items.get().quantity, 3)
+
+    @skipUnlessDBFeature("has_select_for_no_key_update", "has_select_for_update_skip_locked")
+    def test_purge_locks(self):
+        """Test that emptied carts are locked with the weaker lock and deleted ones are not."""
+        self.make_old(Cart.objects.all())
+
+        for purge, lock in (
+            (purge_inactive_carts, "FOR UPDATE SKIP LOCKED"),
+            (empty_stale_carts, "FOR NO KEY UPDATE SKIP LOCKED"),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                purge(timezone.now() - timedelta(days=90))
+            locks = [query["sql"] for query in queries if "SKIP LOCKED" in query["sql"]]
+            self.assertTrue(locks)
+            self.assertTrue(all(sql.endswith(lock) for sql in locks), locks)
+
+    def test_purge_carts_command(self):
+        """Test that the command reports processed carts."""
+        self.make_old(Cart.objects.all())
+
+        out = StringIO()
+        call_command("purge_carts", batch_size=2, stdout=out)
+        self.assertIn("Inactive carts deleted: 2 carts, 2 items", out.getvalue())
+        self.assertIn("Stale carts emptied: 3 carts, 3 items", out.getvalue())
+        self.assertFalse(CartItem.objects.exists())
@@ -4,7 +4,7 @@ URLs for the cart app.
 from django.urls import path, include
 from rest_framework.routers import SimpleRouter
 
-from apps.cart.views import CartViewSet, CartItemViewSet
+from apps.cart.views import CartViewSet, CartItemViewSet, GuestCartView
 
 router = SimpleRouter()
 router.register(prefix=r"carts/items", viewset=CartItemViewSet, basename="cart_items")
@@ -13,5 +13,7 @@ router.register(prefix=r"carts", viewset=CartViewSet, basename="carts")
 app_name = "cart"
 
 urlpatterns = [
+    # Registered before the router, which would match it as a cart detail
+    path("carts/guest/", GuestCartView.as_view(), name="guest-cart"),
     path("", include(router.urls)),
 ]
@@ -1,4 +1,5 @@
 from apps.cart.views.cart import CartViewSet
 from apps.cart.views.cart_item import CartItemViewSet
+from apps.cart.views.guest_cart import GuestCartView
 
-__all__ = ["CartViewSet", "CartItemViewSet"]
+__all__ = ["CartViewSet", "CartItemViewSet", "GuestCartView"]
@@ -1,14 +1,19 @@
 """
 This module contains necessary Cart views for the cart app.
 """
-from django.core.cache import cache
+from django.db.models import prefetch_related_objects
 from rest_framework import permissions
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 
+from apps.base.cache import get_tag_versions, get_tagged, set_tagged
 from apps.base.mixins import CACHE_TTL
 from apps.cart.models import Cart
+from apps.cart.models.cart_item import get_cart_items_prefetch
 from apps.cart.serializers import CartSerializer
+from apps.cart.services.cache import get_cart_tag, get_user_carts_tag
+from apps.cart.services.storage import flush_cart
+from apps.product.services.cache import get_product_tag
 
 
 class CartViewSet(viewsets.ModelViewSet):
@@ -24,13 +29,16 @@ class CartViewSet(viewsets.ModelViewSet):
 
         return [permissions.IsAuthenticated()]
 
-    def get_cache_key(self, cart_id) -> str:
+    def get_cache_key(self) -> str:
         """
-        Method to get cache key for the cart list.
+        Method to get cache key for the cart list, carts are cached per user.
 
         :return: cache key for the cart.
         """
-        return f"carts:{cart_id}:{self.request.path}?{self.request.GET.urlencode()}"
+        return (
+            f"cart_list:{self.request.user.pk}:{self.request.path}?"
+            f"{self.request.GET.urlencode()}"
+        )
 
     def get_queryset(self):
         """
@@ -40,23 +48,42 @@ class CartViewSet(viewsets.ModelViewSet):
         """
         user = self.request.user
         # Logic to filter carts based on the user
-        queryset = Cart.objects.filter(user=user, is_active=True)
+        queryset = Cart.objects.filter(user=user, is_active=True).prefetch_related(
+            get_cart_items_prefetch()
+        )
         return queryset
 
     def list(self, request, *args, **kwargs) -> Response:
         """
         Override the list method to add caching.
-        """
-        cart = Cart.objects.filter(user=self.request.user, is_active=True).first()
-        cache_key = self.get_cache_key(cart.id)
-        cached_data = cache.get(cache_key)
 
-        if cached_data:
+        The active cart is read with its items and their products, so items, their costs and
+        totals are serialized with two queries regardless of the number of items. Pending
+        changes of the cart are written to the database before its items are read. Cached
+        carts are invalidated by writes of the cart, its items and their products.
+        """
+        cache_key = self.get_cache_key()
+        cached_data = get_tagged(cache_key)
+        if cached_data is not None:
             return Response(cached_data)
 
-        response = super().list(request, *args, **kwargs)
-        cache.set(cache_key, response.data, timeout=CACHE_TTL)
-        return response
+        # Versions are read before the data, so changes made meanwhile invalidate it.
+        tag_versions = get_tag_versions([get_user_carts_tag(request.user.pk)])
+        cart = Cart.objects.filter(user=request.user, is_active=True).first()
+        if cart is None:
+            data = []
+        else:
+            tag_versions.update(get_tag_versions([get_cart_tag(cart.id)]))
+            flush_cart(cart)
+            prefetch_related_objects([cart], get_cart_items_prefetch())
+            tag_versions.update(
+                get_tag_versions(
+                    get_product_tag(item.product_id) for item in cart.get_prefetched_items()
+                )
+            )
+            data = self.get_serializer([cart], many=True).data
+        set_tagged(cache_key, data, tag_versions, timeout=CACHE_TTL)
+        return Response(data)
 
     def get_object(self):
         """
@@ -65,7 +92,7 @@ class CartViewSet(viewsets.ModelViewSet):
         :return: specific Cart object.
         """
         return (
-            Cart.objects.prefetch_related("items")
+            Cart.objects.prefetch_related(get_cart_items_prefetch())
             .select_related("user")
             .get(pk=self.kwargs.get("pk"), is_active=True)
         )
@@ -110,35 +137,7 @@ class CartViewSet(viewsets.ModelViewSet):
         :param kwargs: Additional keyword arguments.
         """
         cart_instance = self.get_object()
+        flush_cart(cart_instance)
         cart_instance.is_active = False
         cart_instance.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def perform_destroy(self, instance):
-        """
-        Override perform_destroy to clear cache after deleting a cart.
-        """
-        # Clear the list cache when a cart is deleted
-        cache.delete(self.get_cache_key(instance.id))
-
-    def perform_create(self, serializer):
-        """
-        Perform actions when creating instance.
-
-        :param serializer: The serializer instance used for validation and saving.
-        :return:
-        """
-        instance = serializer.save()
-        cache.delete(self.get_cache_key(instance.id))
-        return instance
-
-    def perform_update(self, serializer):
-        """
-        Override perform_update to clear cache after updating a cart item.
-
-        :param serializer: The serializer instance used for validation and saving.
-        """
-        instance = serializer.save()
-        # Clear the list cache when a cart item is updated
-        cache.delete(self.get_cache_key(instance.id))
-        return instance
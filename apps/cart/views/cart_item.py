@@ -1,43 +1,80 @@
 """
 This module contains Cart item API views for the cart app.
 """
-from django.core.cache import cache
+from django.db.models import prefetch_related_objects
 from django.shortcuts import get_object_or_404
 from rest_framework import permissions, mixins
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from apps.base.mixins import CachedListMixin, CACHE_TTL
+from apps.base.mixins import CachedListMixin, CachedRetrieveMixin
 from apps.cart.models import CartItem, Cart
-from apps.cart.serializers import CartItemSerializer
+from apps.cart.models.cart_item import get_cart_items_prefetch
+from apps.cart.serializers import CartItemBulkSerializer, CartItemSerializer, CartSerializer
+from apps.cart.services.cache import get_cart_tag, get_user_carts_tag
+from apps.cart.services.cart import change_cart_items
 from apps.cart.services.cart_item import delete_cart_item
+from apps.cart.services.storage import flush_cart
+from apps.product.services.cache import get_product_tag
 
 
-class CartItemViewSet(CachedListMixin, viewsets.ModelViewSet, mixins.CreateModelMixin):
+class CartItemViewSet(
+    CachedListMixin, CachedRetrieveMixin, viewsets.ModelViewSet, mixins.CreateModelMixin
+):
     """CartItem API handler."""
 
     # http_method_names = ["get", "put", "patch", "delete",]
     serializer_class = CartItemSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-    def get_cache_key(self, cart_item_id=None) -> str:
+    def get_cache_key(self) -> str:
         """
-        Method to get cache key.
+        Method to get cache key, cart items are cached per user.
 
         :return: cache key for the cart items.
         """
-        base_key = self.request.path
-        if self.request.GET:
-            base_key += f"?{self.request.GET.urlencode()}"
-        if cart_item_id is not None:
-            return f"cart_item_detail:{base_key}:{cart_item_id}"
+        base_key = f"{self.request.user.pk}:{self.request.path}?{self.request.GET.urlencode()}"
+        if "pk" in self.kwargs:
+            return f"cart_item_detail:{base_key}"
         return f"cart_item_list:{base_key}"
 
+    def get_cache_tags(self, instance=None) -> list[str]:
+        """
+        Method to get cache tags, cached items are invalidated by writes of their cart.
+
+        :param instance: retrieved cart item, None for the list.
+        :return: list of cache tags
+        """
+        if instance is not None:
+            return [get_cart_tag(instance.cart_id), get_product_tag(instance.product_id)]
+        return [
+            get_user_carts_tag(self.request.user.pk),
+            get_cart_tag(self.get_active_cart().id),
+        ]
+
+    def get_page_cache_tags(self, rows) -> list[str]:
+        """
+        Costs of listed items change with their products.
+        """
+        return [get_product_tag(item.product_id) for item in rows]
+
+    def get_active_cart(self) -> Cart:
+        """
+        Retrieve the active cart of the user with pending changes written to the database.
+
+        :return: active cart.
+        """
+        if not hasattr(self, "_active_cart"):
+            self._active_cart = get_object_or_404(Cart, user=self.request.user, is_active=True)
+            flush_cart(self._active_cart)
+        return self._active_cart
+
     def get_queryset(self):
         """Return the queryset for the view."""
-        user = self.request.user
-        cart = get_object_or_404(Cart, user=user, is_active=True)
-        return CartItem.objects.select_related("cart", "product").filter(cart=cart)
+        return CartItem.objects.select_related("cart", "product").filter(
+            cart=self.get_active_cart()
+        )
 
     def get_object(self):
         """
@@ -45,13 +82,10 @@ class CartItemViewSet(CachedListMixin, viewsets.ModelViewSet, mixins.CreateModel
 
         :return: requested CartItem instance.
         """
-        user = self.request.user
-        # Logic to filter cart items based on the user
-        cart = get_object_or_404(Cart, user=user, is_active=True)
         return get_object_or_404(
             CartItem.objects.select_related("cart", "product"),
             pk=self.kwargs.get("pk"),
-            cart=cart,
+            cart=self.get_active_cart(),
         )
 
     def create(self, request, *args, **kwargs):
@@ -72,21 +106,22 @@ class CartItemViewSet(CachedListMixin, viewsets.ModelViewSet, mixins.CreateModel
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    def retrieve(self, request, *args, **kwargs):
-        """Retrieve cart item instance."""
-        cart_item_id = self.kwargs.get("pk")
-        cache_key = self.get_cache_key(cart_item_id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return Response(cached_data)
-
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        data = serializer.data
+    @action(detail=False, methods=["post"])
+    def bulk(self, request, *args, **kwargs):
+        """
+        Add, update and remove many items of the cart in one request.
 
-        cache.set(cache_key, data, timeout=CACHE_TTL)
+        :param request: HTTP request with `add`, `update` and `remove` changes.
+        :return: HTTP response with the cart, its items and totals.
+        """
+        serializer = CartItemBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        cart, _ = Cart.objects.get_or_create(user=request.user, is_active=True)
+        change_cart_items(cart, **serializer.validated_data)
 
-        return Response(data)
+        flush_cart(cart)
+        prefetch_related_objects([cart], get_cart_items_prefetch())
+        return Response(CartSerializer(cart).data)
 
     def partial_update(self, request, *args, **kwargs):
         """
@@ -110,56 +145,3 @@ class CartItemViewSet(CachedListMixin, viewsets.ModelViewSet, mixins.CreateModel
         cart = instance.cart
         delete_cart_item(instance, cart)
         return Response(status=status.HTTP_204_NO_CONTENT)
-
-    def perform_create(self, serializer):
-        """
-        Perform actions when creating instance.
-
-        :param serializer: The serializer instance used for validation and saving.
-        :return:
-        """
-        instance = serializer.save()
-        # Clear the list cache when a new cart item is created
-        cache.delete(f"cart_item_list:{self.request.path}?{self.request.GET.urlencode()}")
-        cart_id = instance.cart.id
-        # Invalidate related cart cache
-        cache.delete(f"carts:{cart_id}:{self.request.path}?{self.request.GET.urlencode()}")
-        return instance
-
-    def perform_update(self, serializer) -> None:
-        """
-        Perform actions when updating Cart Item instance.
-
-        :param serializer: The serializer instance used for validation and saving.
-        :return:
-        """
-        instance = serializer.save()
-        request_path = self.request.path
-
-        # Invalidate cart item cache
-        cache.delete(self.get_cache_key(instance.id))
-        cache.delete(f"cart_item_list:{request_path}?{self.request.GET.urlencode()}")
-
-        # Invalidate related cart cache
-        cart_id = instance.cart.id
-        cache.delete(f"carts:{cart_id}:{self.request.path}?{self.request.GET.urlencode()}")
-
-        return instance
-
-    def perform_destroy(self, instance):
-        """
-        Perform actions when deleting an Cart Item instance.
-
-        :param instance: instance to be destroyed.
-        """
-        # clear cache before deleting an instance
-        request_path = self.request.path
-        # Invalidate cart item cache
-        cache.delete(self.get_cache_key(instance.id))
-        cache.delete(f"cart_item_list:{request_path}?{self.request.GET.urlencode()}")
-
-        # Invalidate related cart cache
-        cart_id = instance.cart.id
-        cache.delete(f"carts:{cart_id}:{self.request.path}?{self.request.GET.urlencode()}")
-
-        instance.delete()
@@ -0,0 +1,50 @@
+"""
+This module contains the guest cart API view for the cart app.
+"""
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.cart.serializers import CartItemBulkSerializer, GuestCartSerializer
+from apps.cart.services.guest_cart import (
+    GUEST_CART_HEADER,
+    change_guest_cart,
+    create_guest_cart_token,
+    get_guest_cart_quantities,
+    get_guest_cart_summary,
+)
+
+
+class GuestCartView(APIView):
+    """
+    Cart of an anonymous visitor identified by the token in the `X-Guest-Cart` header.
+
+    The token is returned by the first change of the cart, items are merged into the cart of
+    the user on login when the same header is sent.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, *args, **kwargs) -> Response:
+        """
+        Retrieve the guest cart with its items and totals.
+
+        :param request: HTTP request object.
+        :return: HTTP response with the cart, empty if there is no token or it expired.
+        """
+        token = request.headers.get(GUEST_CART_HEADER)
+        summary = get_guest_cart_summary(token, get_guest_cart_quantities(token))
+        return Response(GuestCartSerializer(summary).data)
+
+    def post(self, request, *args, **kwargs) -> Response:
+        """
+        Add, update and remove items of the guest cart, creating it if there is no token.
+
+        :param request: HTTP request with `add`, `update` and `remove` changes.
+        :return: HTTP response with the token, items and totals of the cart.
+        """
+        serializer = CartItemBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        token = request.headers.get(GUEST_CART_HEADER) or create_guest_cart_token()
+        quantities = change_guest_cart(token, **serializer.validated_data)
+        return Response(GuestCartSerializer(get_guest_cart_summary(token, quantities)).data)
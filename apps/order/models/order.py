@@ -6,7 +6,6 @@ This module defines the Order model for the order app.
 from decimal import Decimal, ROUND_HALF_UP
 
 from django.db import models
-from django.db.models import Sum, ExpressionWrapper, F, DecimalField
 
 from django.utils.translation import gettext_lazy as _
 
@@ -86,13 +85,10 @@ class Order(BaseID, BaseDate):
 
     @property
     def total_order_price(self):
-        """Calculate the total cost of items in the order."""
-        total_price = self.items.aggregate(
-            total_price=Sum(
-                ExpressionWrapper(
-                    F("quantity") * F("price") * ((100 - F("discount_percentage")) / 100),
-                    output_field=DecimalField(),
-                )
-            )
-        )["total_price"] or Decimal("0")
+        """
+        Calculate the total cost of items in the order.
+
+        Unrounded costs of items are summed in Python and rounded once, like the cart total.
+        """
+        total_price = sum((item.unrounded_cost for item in self.items.all()), Decimal("0"))
         return Decimal(total_price).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
@@ -55,12 +55,16 @@ class OrderItem(BaseID, BaseDate):
         """
         return f"OrderItem for {self.product} for Order №{self.order}, " f"price - {self.price}"
 
+    @property
+    def unrounded_cost(self) -> Decimal:
+        """Calculate the cost of item in the order before rounding."""
+        discount = Decimal(str(self.discount_percentage)) / Decimal("100")
+        return self.quantity * self.price * (Decimal("1") - discount)
+
     @property
     def order_item_cost(self) -> Decimal:
         """Calculate the total cost of item in the order."""
-        discount = Decimal(str(self.discount_percentage)) / Decimal("100")
-        cost = self.quantity * self.price * (Decimal("1") - discount)
-        return Decimal(cost).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return Decimal(self.unrounded_cost).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
     def clean(self):
         """
@@ -11,6 +11,7 @@ from rest_framework.exceptions import PermissionDenied
 
 from apps.base.serializers import BaseDateSerializer
 from apps.cart.models import Cart
+from apps.cart.services.storage import flush_cart
 from apps.order.models.order import Order
 from apps.order.serializers.delivery import DeliverySerializer
 from apps.order.serializers.order_item import OrderItemSerializer
@@ -81,6 +82,7 @@ class OrderSerializer(BaseDateSerializer, serializers.ModelSerializer):
                 if not request.user.is_authenticated:
                     raise PermissionDenied("Only authenticated users can create orders via cart.")
                 cart = get_object_or_404(Cart, is_active=True, user=request.user, id=cart_id)
+                flush_cart(cart)
                 validated_data["items"] = [
                     {"product_id": item.product.id, "quantity": item.quantity}
                     for item in cart.items.all()
@@ -2,12 +2,14 @@
 Django signals related to the order app.
 """
 from django.db.models import Max
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import post_delete, pre_save, post_save
 from django.dispatch import receiver
 
 from apps.order.models.order import Order
 from apps.order.models.order_item import OrderItem
 from apps.order.utils import create_reserve, create_or_update_transaction
+from apps.product.services.cache import invalidate_product_cache
+from apps.product.services.popularity import add_product_sales
 
 
 @receiver(pre_save, sender=Order)
@@ -118,3 +120,47 @@ def create_reserves_for_order_item(sender, instance, created, **kwargs):
         if not created:
             transaction.quantity = instance.quantity
             transaction.save()
+
+
+@receiver(pre_save, sender=OrderItem)
+def remember_previous_sales(sender, instance, raw=False, **kwargs):
+    """
+    Signal to remember the stored product and quantity of an OrderItem before saving.
+    """
+    if raw or instance._state.adding:
+        return
+
+    instance._previous_sales = (
+        OrderItem.objects.filter(pk=instance.pk).values_list("product_id", "quantity").first()
+    )
+
+
+@receiver(post_save, sender=OrderItem)
+def update_popularity_on_save(sender, instance, created, raw=False, **kwargs):
+    """
+    Signal to add sold items to the popularity score of the product.
+
+    Changed items replace their previous quantity, weighted by the date of the item.
+    """
+    if raw:
+        return
+
+    previous_sales = getattr(instance, "_previous_sales", None)
+    if previous_sales is not None:
+        previous_product_id, previous_quantity = previous_sales
+        if (previous_product_id, previous_quantity) == (instance.product_id, instance.quantity):
+            return
+        add_product_sales(previous_product_id, -previous_quantity, instance.created_at)
+        invalidate_product_cache([previous_product_id])
+
+    add_product_sales(instance.product_id, instance.quantity, instance.created_at)
+    invalidate_product_cache([instance.product_id])
+
+
+@receiver(post_delete, sender=OrderItem)
+def update_popularity_on_delete(sender, instance, **kwargs):
+    """
+    Signal to remove items of a deleted OrderItem from the popularity score of the product.
+    """
+    add_product_sales(instance.product_id, -instance.quantity, instance.created_at)
+    invalidate_product_cache([instance.product_id])
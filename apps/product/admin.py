@@ -7,14 +7,17 @@ This module contains the admin configurations for the product app.
 from django.contrib import admin
 from django.contrib import messages
 from django.core.exceptions import ValidationError
+from django.db.models import F
 from django.forms import BaseInlineFormSet
 from django.urls import reverse
 from django.utils.html import format_html
 from django.utils.translation import ngettext
 
 from apps.product.filters.category import BaseSubcategoryFilter, ProductSubcategoryFilter
-from apps.product.models import Manufacturer, Category, ProductImage
+from apps.product.models import Manufacturer, Category, ProductImage, ProductReview
 from apps.product.models.product import ProductCharacteristics, TypeProductCharacteristics, Product
+from apps.product.services.price_history import record_price_changes
+from apps.product.signals import update_product_indexes
 
 
 class BaseProductInlineFormSet(BaseInlineFormSet):
@@ -71,7 +74,14 @@ class ProductAdmin(admin.ModelAdmin):
     @admin.action(description="Remove promotional discount")
     def remove_discount(self, request, queryset):
         """Custom admin action to remove promotional discount."""
-        updated = queryset.update(discount_percentage=0)
+        # Ids are read first, the changelist may filter the queryset by the discount.
+        product_ids = list(queryset.values_list("pk", flat=True))
+        updated = Product.objects.filter(pk__in=product_ids).update(
+            discount_percentage=0, price_discount=F("price")
+        )
+        # Bulk updates bypass signals, so indexes and the price history are updated here.
+        update_product_indexes(product_ids)
+        record_price_changes(product_ids)
         self.message_user(
             request,
             ngettext(
@@ -94,7 +104,7 @@ class ProductAdmin(admin.ModelAdmin):
         "updated_at",
     )
     list_select_related = ("manufacturer", "categories")
-    readonly_fields = ("created_at", "updated_at")
+    readonly_fields = ("rating", "rating_count", "created_at", "updated_at")
     search_fields = (
         "name",
         "product_code",
@@ -232,9 +242,24 @@ class ProductImageAdmin(admin.ModelAdmin):
     autocomplete_fields = ("product",)
 
 
+class ProductReviewAdmin(admin.ModelAdmin):
+    """Admin class for ProductReview model."""
+
+    list_display = ("product", "user", "rating", "created_at", "updated_at")
+    list_select_related = ("product", "user")
+    readonly_fields = ("created_at", "updated_at")
+    search_fields = ("product__name", "user__email")
+    search_help_text = "You can search reviews by product name or user email"
+    list_filter = ("rating", "created_at", "updated_at")
+    list_per_page = 10
+    list_max_show_all = 100
+    autocomplete_fields = ("product", "user")
+
+
 admin.site.register(Product, ProductAdmin)
 admin.site.register(ProductCharacteristics, ProductCharacteristicsAdmin)
 admin.site.register(TypeProductCharacteristics, TypeProductCharacteristicsAdmin)
 admin.site.register(Manufacturer, ManufacturerAdmin)
 admin.site.register(Category, CategoryAdmin)
 admin.site.register(ProductImage, ProductImageAdmin)
+admin.site.register(ProductReview, ProductReviewAdmin)
@@ -25,7 +25,7 @@ class BaseSubcategoryFilter(admin.SimpleListFilter):
 
         :return: list of tuples containing category ids and names.
         """
-        categories = Category.objects.all()
+        categories = Category.objects.select_related("parent__parent")
 
         return [(str(category.id), category) for category in categories]
 
@@ -38,8 +38,7 @@ class BaseSubcategoryFilter(admin.SimpleListFilter):
         :return: filtered queryset
         """
         if self.value():
-            category = Category.objects.get(pk=self.value())
-            subcategories = list(category.get_descendants()) + [category]
+            subcategories = Category.get_subtree_ids(self.value())
 
             return queryset.filter(parent_id__in=subcategories)
 
@@ -58,7 +57,6 @@ class ProductSubcategoryFilter(BaseSubcategoryFilter):
         :return: filtered queryset
         """
         if self.value():
-            category = Category.objects.get(pk=self.value())
-            subcategories = list(category.get_descendants()) + [category]
+            subcategories = Category.get_subtree_ids(self.value())
 
             return queryset.filter(categories__in=subcategories)
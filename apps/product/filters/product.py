@@ -1,21 +1,40 @@
 """
-This module filters the Product model for the product app.
+This module filters product listing rows for the product app.
 """
 from django_filters import rest_framework as filters
 
-from apps.product.models import Product
+from apps.product.models import ProductListing
 
 
-class ProductFilter(filters.FilterSet):
-    """The class for product filtering."""
+class ProductListingFilter(filters.FilterSet):
+    """The class for filtering of product listing rows."""
 
     min_price = filters.NumberFilter(field_name="price", lookup_expr="gte")
     max_price = filters.NumberFilter(field_name="price", lookup_expr="lte")
-    manufacturer = filters.CharFilter(field_name="manufacturer__trade_brand", lookup_expr="iexact")
+    min_price_discount = filters.NumberFilter(field_name="price_discount", lookup_expr="gte")
+    max_price_discount = filters.NumberFilter(field_name="price_discount", lookup_expr="lte")
+    manufacturer = filters.CharFilter(field_name="manufacturer_brand", lookup_expr="iexact")
     type_characteristic = filters.CharFilter(
-        field_name="types_product__type_characteristic", lookup_expr="iexact"
+        field_name="product__types_product__name", lookup_expr="iexact"
     )
+    in_stock_only = filters.BooleanFilter(method="filter_in_stock_only")
 
     class Meta:
-        model = Product
-        fields = ["min_price", "max_price", "manufacturer", "name"]
+        model = ProductListing
+        fields = [
+            "min_price",
+            "max_price",
+            "min_price_discount",
+            "max_price_discount",
+            "manufacturer",
+            "name",
+            "in_stock_only",
+        ]
+
+    def filter_in_stock_only(self, queryset, name, value):
+        """
+        Filter rows of products available for order, rows are read from partial indexes.
+        """
+        if value:
+            return queryset.filter(available_quantity__gt=0)
+        return queryset
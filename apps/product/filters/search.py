@@ -0,0 +1,42 @@
+"""
+This module contains the search filter for the product app.
+"""
+from django.db.models import Case, IntegerField, Value, When
+from rest_framework.filters import SearchFilter
+
+from apps.product.services.search import search_products
+
+
+class ProductSearchFilter(SearchFilter):
+    """
+    Search filter backed by the product search engine.
+
+    Matching products are ordered by relevance unless another ordering is requested.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """
+        Filter the queryset by the search query.
+
+        :param request: http request object.
+        :param queryset: queryset to filter.
+        :param view: view the filter is used for.
+        :return: filtered queryset
+        """
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+
+        product_ids = search_products(query, scope=queryset)
+        if not product_ids:
+            return queryset.none()
+
+        search_rank = Case(
+            *[When(pk=pk, then=Value(position)) for position, pk in enumerate(product_ids)],
+            output_field=IntegerField(),
+        )
+        return (
+            queryset.filter(pk__in=product_ids)
+            .annotate(search_rank=search_rank)
+            .order_by("search_rank")
+        )
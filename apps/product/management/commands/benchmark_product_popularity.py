@@ -0,0 +1,148 @@
+"""
+Management command to benchmark sorting of product lists by popularity.
+"""
+import random
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Sum
+from django.test import RequestFactory
+from django.utils import timezone
+
+from apps.base.benchmark import format_timing, measure, rolled_back
+from apps.order.models.order import Order
+from apps.order.models.order_item import OrderItem
+from apps.product.models import Category, Manufacturer, Product, ProductListing
+from apps.product.serializers.product import ProductListingSerializer
+from apps.product.services.listing import rebuild_product_listings
+from apps.product.services.popularity import rebuild_product_popularity
+
+DEFAULT_ORDER_ITEMS = [1000, 10000, 50000]
+
+
+class Command(BaseCommand):
+    """Compare the maintained popularity score with aggregating order items per request."""
+
+    help = "Compare the maintained popularity score with aggregating order items per request."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=500,
+            help="Number of synthetic products to create, the data is rolled back afterwards.",
+        )
+        parser.add_argument(
+            "--order-items",
+            type=int,
+            action="append",
+            help="Size of the synthetic order history, can be repeated.",
+        )
+        parser.add_argument("--page-size", type=int, default=20, help="Number of listed rows.")
+        parser.add_argument("--repeat", type=int, default=10, help="Number of runs.")
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        context = {"request": RequestFactory().get("/")}
+        page_size = options["page_size"]
+
+        with rolled_back():
+            category, products = self.create_products(options["products"])
+
+            def maintained():
+                rows = ProductListing.objects.filter(category=category).order_by(
+                    "-popularity", "-product"
+                )
+                return ProductListingSerializer(
+                    rows.values()[:page_size], many=True, context=context
+                ).data
+
+            def aggregated():
+                return list(
+                    Product.objects.filter(categories=category)
+                    .annotate(sold=Sum("order_items__quantity"))
+                    .order_by("-sold", "-pk")
+                    .values_list("pk", flat=True)[:page_size]
+                )
+
+            created = 0
+            for order_items in sorted(options["order_items"] or DEFAULT_ORDER_ITEMS):
+                self.create_order_items(products, order_items - created, offset=created)
+                created = order_items
+                rebuild_product_popularity()
+
+                self.stdout.write(f"{len(products)} products, {created} order items")
+                for name, func in (("maintained", maintained), ("aggregated", aggregated)):
+                    timing = measure(func, options["repeat"])
+                    self.stdout.write(f"  {name}: {format_timing(timing)}")
+
+    def create_products(self, count: int) -> tuple[Category, list[Product]]:
+        """
+        Create synthetic products in a category with their listing rows.
+
+        :param count: number of products.
+        :return: category and created products.
+        """
+        category = Category.objects.create(name="Benchmark category", level=0)
+        manufacturer = Manufacturer.objects.create(
+            trade_brand="Benchmark", country="Benchmark", country_brand_registration="Benchmark"
+        )
+        products = Product.objects.bulk_create(
+            (
+                Product(
+                    name=f"Benchmark product {i}",
+                    slug=f"benchmark-product-{i}",
+                    product_code=f"CODE-{i}",
+                    price=100,
+                    price_discount=100,
+                    manufacturer=manufacturer,
+                    categories=category,
+                    image="product/default.jpg",
+                )
+                for i in range(count)
+            ),
+            batch_size=1000,
+        )
+        rebuild_product_listings()
+        return category, products
+
+    def create_order_items(self, products: list[Product], count: int, offset: int) -> None:
+        """
+        Create synthetic orders with one item each, sold during the last year.
+
+        Popular products are sold more often, as sales usually follow a power law.
+
+        :param products: sold products.
+        :param count: number of order items.
+        :param offset: number of previously created order items.
+        """
+        rng = random.Random(offset)
+        now = timezone.now()
+        orders = Order.objects.bulk_create(
+            (
+                Order(order_number=10**9 + offset + i, email="benchmark@example.com")
+                for i in range(count)
+            ),
+            batch_size=1000,
+        )
+        items = OrderItem.objects.bulk_create(
+            (
+                OrderItem(
+                    order=order,
+                    product=products[min(int(rng.paretovariate(1)) - 1, len(products) - 1)],
+                    price=100,
+                    quantity=rng.randint(1, 3),
+                )
+                for order in orders
+            ),
+            batch_size=1000,
+        )
+        # Creation dates are set automatically, so they are spread over the year afterwards.
+        for item in items:
+            item.created_at = now - timedelta(days=rng.uniform(0, 365))
+        OrderItem.objects.bulk_update(items, ["created_at"], batch_size=1000)
@@ -0,0 +1,164 @@
+"""
+Management command to benchmark concurrent writes of product reviews.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count, OuterRef, Subquery, Sum
+
+from apps.product.models import Category, Manufacturer, Product, ProductReview
+from apps.product.services.listing import rebuild_product_listings
+from apps.product.services.reviews import (
+    copy_listing_ratings,
+    get_rating_expression,
+    reconcile_product_ratings,
+)
+
+
+class Command(BaseCommand):
+    """Compare write throughput of incremental rating aggregates and re-aggregation."""
+
+    help = (
+        "Compare write throughput of incremental rating aggregates and re-aggregation of all "
+        "reviews under concurrency. Threads need committed data, so synthetic data is committed "
+        "and deleted afterwards; run it against a database with row-level locking."
+    )
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--products", type=int, default=10, help="Number of reviewed products."
+        )
+        parser.add_argument("--threads", type=int, default=8, help="Number of writing threads.")
+        parser.add_argument(
+            "--reviews", type=int, default=200, help="Number of reviews written by every thread."
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        threads, reviews = options["threads"], options["reviews"]
+        category, manufacturer, products, users = self.create_data(
+            options["products"], threads * reviews
+        )
+        try:
+            for name, write in (
+                ("incremental", self.write_incremental),
+                ("re-aggregated", self.write_reaggregated),
+            ):
+                ProductReview.objects.filter(product__in=products).delete()
+                reconcile_product_ratings()
+
+                batches = [
+                    [
+                        (
+                            products[(i * reviews + j) % len(products)],
+                            users[i * reviews + j],
+                            (i * reviews + j) % 5 + 1,
+                        )
+                        for j in range(reviews)
+                    ]
+                    for i in range(threads)
+                ]
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=threads) as executor:
+                    list(executor.map(lambda batch: self.write_batch(write, batch), batches))
+                elapsed = time.perf_counter() - started
+
+                # Reviews written by the incremental path must leave no aggregates to correct.
+                lost = reconcile_product_ratings()
+                self.stdout.write(
+                    f"{name}: {threads * reviews / elapsed:.0f} reviews/s, "
+                    f"{lost} products with lost updates"
+                )
+        finally:
+            Product.objects.filter(pk__in=[product.pk for product in products]).delete()
+            get_user_model().objects.filter(pk__in=[user.pk for user in users]).delete()
+            manufacturer.delete()
+            category.delete()
+
+    def create_data(self, products_count: int, users_count: int) -> tuple:
+        """
+        Create synthetic products and users.
+
+        :param products_count: number of products.
+        :param users_count: number of users.
+        :return: category, manufacturer, products and users.
+        """
+        category = Category.objects.create(name="Benchmark category", level=0)
+        manufacturer = Manufacturer.objects.create(
+            trade_brand="Benchmark", country="Benchmark", country_brand_registration="Benchmark"
+        )
+        products = Product.objects.bulk_create(
+            Product(
+                name=f"Benchmark review product {i}",
+                slug=f"benchmark-review-product-{i}",
+                product_code=f"REVIEW-{i}",
+                price=100,
+                price_discount=100,
+                manufacturer=manufacturer,
+                categories=category,
+                image="product/default.jpg",
+            )
+            for i in range(products_count)
+        )
+        rebuild_product_listings()
+        users = get_user_model().objects.bulk_create(
+            (
+                get_user_model()(email=f"benchmark-review-{i}@example.com", password="!")
+                for i in range(users_count)
+            ),
+            batch_size=1000,
+        )
+        return category, manufacturer, products, users
+
+    def write_batch(self, write, batch: list) -> None:
+        """
+        Write reviews in a thread, closing its database connection afterwards.
+
+        :param write: function writing a review.
+        :param batch: products, users and ratings of reviews.
+        """
+        try:
+            for product, user, rating in batch:
+                write(product, user, rating)
+        finally:
+            connection.close()
+
+    def write_incremental(self, product: Product, user, rating: int) -> None:
+        """
+        Write a review, signals add its rating to the product aggregates.
+
+        :param product: reviewed product.
+        :param user: author of the review.
+        :param rating: rating of the review.
+        """
+        ProductReview.objects.create(product=product, user=user, rating=rating)
+
+    @transaction.atomic
+    def write_reaggregated(self, product: Product, user, rating: int) -> None:
+        """
+        Write a review without signals and aggregate all reviews of the product.
+
+        :param product: reviewed product.
+        :param user: author of the review.
+        :param rating: rating of the review.
+        """
+        ProductReview.objects.bulk_create(
+            [ProductReview(product=product, user=user, rating=rating)]
+        )
+        reviews = ProductReview.objects.filter(product=OuterRef("pk")).order_by().values("product")
+        rating_sum = Subquery(reviews.annotate(value=Sum("rating")).values("value"))
+        rating_count = Subquery(reviews.annotate(value=Count("pk")).values("value"))
+        Product.objects.filter(pk=product.pk).update(
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+            rating=get_rating_expression(rating_sum, rating_count),
+        )
+        copy_listing_ratings([product.pk])
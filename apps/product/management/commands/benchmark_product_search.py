@@ -0,0 +1,119 @@
+"""
+Management command to benchmark product search.
+"""
+import operator
+import random
+from functools import reduce
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from apps.base.benchmark import format_timing, measure, rolled_back
+from apps.product.models import Category, Manufacturer, Product
+from apps.product.services.search import get_search_backend, rebuild_search_documents
+
+WORDS = [
+    "dog", "cat", "puppy", "kitten", "food", "dry", "wet", "premium", "grain", "free",
+    "chicken", "salmon", "lamb", "turkey", "adult", "senior", "small", "large", "breed",
+    "treats", "snack", "dental", "toy", "ball", "collar", "leash", "bowl", "litter", "sand",
+    "shampoo", "vitamins", "sterilised", "sensitive", "hypoallergenic", "light", "mini",
+]  # fmt: skip
+BRANDS = ["Brit", "Royal Canin", "Acana", "Purina", "Josera", "Hills", "Orijen", "Optimeal"]
+DEFAULT_QUERIES = ["brit", "salmon food", "hypoalergenic", "dog dry premium", "code-1"]
+
+
+def legacy_search(query: str) -> list:
+    """
+    Search products the way the previous SearchFilter did.
+
+    :param query: search query.
+    :return: ids of matching products.
+    """
+    queryset = Product.objects.all()
+    for term in query.split():
+        lookups = [
+            Q(name__icontains=term),
+            Q(manufacturer__trade_brand__icontains=term),
+            Q(product_code__icontains=term),
+        ]
+        queryset = queryset.filter(reduce(operator.or_, lookups))
+    return list(queryset.values_list("pk", flat=True))
+
+
+class Command(BaseCommand):
+    """Compare the product search engine with the legacy ILIKE search filter."""
+
+    help = "Compare the product search engine with the legacy ILIKE search filter."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=0,
+            help="Number of synthetic products to create, the data is rolled back afterwards.",
+        )
+        parser.add_argument("--repeat", type=int, default=10, help="Number of runs per query.")
+        parser.add_argument(
+            "--query", action="append", dest="queries", help="Query to run, can be repeated."
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        backend = get_search_backend()
+        queries = options["queries"] or DEFAULT_QUERIES
+
+        with rolled_back():
+            if options["products"]:
+                self.create_products(options["products"])
+
+            self.stdout.write(
+                f"{Product.objects.count()} products, backend {type(backend).__name__}"
+            )
+            # Warm up the backend, e.g. build the in-process index.
+            backend.search(queries[0])
+
+            for query in queries:
+                legacy_results = legacy_search(query)
+                engine_results = backend.search(query)
+                legacy = measure(lambda: legacy_search(query), options["repeat"])
+                engine = measure(lambda: backend.search(query), options["repeat"])
+
+                self.stdout.write(f"{query!r}")
+                self.stdout.write(f"  legacy: {format_timing(legacy)}, {len(legacy_results)} hits")
+                self.stdout.write(f"  engine: {format_timing(engine)}, {len(engine_results)} hits")
+
+    def create_products(self, count: int) -> None:
+        """
+        Create synthetic products and index them.
+
+        :param count: number of products.
+        """
+        rng = random.Random(0)
+        category = Category.objects.create(name="Benchmark category", level=0)
+        manufacturers = [
+            Manufacturer.objects.create(
+                trade_brand=brand, country="Benchmark", country_brand_registration="Benchmark"
+            )
+            for brand in BRANDS
+        ]
+        Product.objects.bulk_create(
+            (
+                Product(
+                    name=" ".join(rng.sample(WORDS, 4)).capitalize(),
+                    slug=f"benchmark-product-{i}",
+                    product_code=f"CODE-{i}",
+                    price=rng.randint(10, 5000),
+                    manufacturer=rng.choice(manufacturers),
+                    categories=category,
+                    image="product/default.jpg",
+                )
+                for i in range(count)
+            ),
+            batch_size=1000,
+        )
+        rebuild_search_documents()
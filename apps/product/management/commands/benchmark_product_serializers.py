@@ -0,0 +1,118 @@
+"""
+Management command to benchmark serialization of product lists.
+"""
+import random
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from apps.base.benchmark import format_timing, measure, rolled_back
+from apps.product.models import Category, Manufacturer, Product, ProductListing
+from apps.product.models.product import (
+    ProductCharacteristics,
+    TypeProductCharacteristics,
+    calculate_price_discount,
+    get_types_product_prefetch,
+)
+from apps.product.serializers.product import ProductListingSerializer, ProductListSerializer
+from apps.product.services.listing import rebuild_product_listings
+
+
+class Command(BaseCommand):
+    """Compare serializers of product lists in rows per second."""
+
+    help = "Compare serializers of product lists in rows per second."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=1000,
+            help="Number of synthetic products to create, the data is rolled back afterwards.",
+        )
+        parser.add_argument("--repeat", type=int, default=10, help="Number of runs.")
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        context = {"request": RequestFactory().get("/")}
+
+        with rolled_back():
+            self.create_products(options["products"])
+
+            products = list(
+                Product.objects.select_related(
+                    "manufacturer", "categories", "listing"
+                ).prefetch_related(get_types_product_prefetch())
+            )
+            listings = list(ProductListing.objects.all())
+            rows = list(ProductListing.objects.values())
+            cases = {
+                "product serializer": lambda: ProductListSerializer(
+                    products, many=True, context=context
+                ).data,
+                "listing serializer": lambda: ProductListingSerializer(
+                    listings, many=True, context=context
+                ).data,
+                "values fast path": lambda: ProductListingSerializer(
+                    rows, many=True, context=context
+                ).data,
+            }
+
+            self.stdout.write(f"{len(rows)} products")
+            for name, serialize in cases.items():
+                timing = measure(serialize, options["repeat"])
+                rate = len(rows) / (timing["median"] / 1000) if timing["median"] else 0
+                self.stdout.write(f"  {name}: {format_timing(timing)}, {rate:.0f} rows/s")
+
+    def create_products(self, count: int) -> None:
+        """
+        Create synthetic products with characteristics and their listing rows.
+
+        :param count: number of products.
+        """
+        rng = random.Random(0)
+        category = Category.objects.create(name="Benchmark category", level=0)
+        manufacturer = Manufacturer.objects.create(
+            trade_brand="Benchmark", country="Benchmark", country_brand_registration="Benchmark"
+        )
+        characteristic = ProductCharacteristics.objects.create(name="Benchmark weight")
+        types = [
+            TypeProductCharacteristics.objects.create(
+                name=f"Benchmark {weight} kg", product_characteristics=characteristic
+            )
+            for weight in range(1, 6)
+        ]
+        products = []
+        for i in range(count):
+            price, discount = rng.randint(10, 5000), rng.choice([0, 5, 10, 15])
+            products.append(
+                Product(
+                    name=f"Benchmark product {i}",
+                    slug=f"benchmark-product-{i}",
+                    product_code=f"CODE-{i}",
+                    description_short="Benchmark description",
+                    price=price,
+                    discount_percentage=discount,
+                    # Bulk creation skips save(), so the promotional price is set here.
+                    price_discount=calculate_price_discount(price, discount),
+                    manufacturer=manufacturer,
+                    categories=category,
+                    image="product/default.jpg",
+                )
+            )
+        Product.objects.bulk_create(products, batch_size=1000)
+        TypeProductCharacteristics.product.through.objects.bulk_create(
+            (
+                TypeProductCharacteristics.product.through(
+                    product_id=product.pk, typeproductcharacteristics_id=rng.choice(types).pk
+                )
+                for product in products
+            ),
+            batch_size=1000,
+        )
+        rebuild_product_listings()
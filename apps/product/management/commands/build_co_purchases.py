@@ -0,0 +1,51 @@
+"""
+Management command to build the "frequently bought together" index of products.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.product.services.co_purchase import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_TOP,
+    build_co_purchases,
+)
+
+
+class Command(BaseCommand):
+    """Build the co-purchase index of products from order items."""
+
+    help = "Build the co-purchase index of products from order items."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Count only order items created after the last build.",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=DEFAULT_TOP,
+            help="Number of stored neighbours of every product.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of order items read from the database at once.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        products, stored = build_co_purchases(
+            options["top"], incremental=options["incremental"], chunk_size=options["chunk_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Co-purchase index built: {products} products, {stored} neighbours stored."
+            )
+        )
@@ -0,0 +1,43 @@
+"""
+Management command to verify the category closure table.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.product.services.category_closure import (
+    check_category_closure,
+    rebuild_category_closure,
+)
+
+
+class Command(BaseCommand):
+    """Verify that the category closure table matches the parent hierarchy."""
+
+    help = "Verify that the category closure table matches the parent hierarchy."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rebuild the closure table if it is inconsistent.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        missing, extra = check_category_closure()
+
+        if not missing and not extra:
+            self.stdout.write(self.style.SUCCESS("Category closure is consistent."))
+            return
+
+        message = f"Category closure is inconsistent: {len(missing)} missing, {len(extra)} extra."
+        if not options["fix"]:
+            raise CommandError(message)
+
+        self.stdout.write(self.style.WARNING(message))
+        rows = rebuild_category_closure()
+        self.stdout.write(self.style.SUCCESS(f"Category closure rebuilt: {rows} rows."))
@@ -0,0 +1,86 @@
+"""
+Management command to pre-generate gzipped sitemaps and product feeds.
+"""
+import gzip
+import os
+from typing import Iterable
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.product.services.feeds import (
+    FEED_FORMATS,
+    get_sitemap_pages_count,
+    iter_product_feed,
+    iter_sitemap,
+    iter_sitemap_index,
+)
+
+
+class Command(BaseCommand):
+    """Write gzipped sitemaps and product feeds of the catalog to files."""
+
+    help = "Write gzipped sitemaps and product feeds of the catalog to files."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--output-dir",
+            default=os.path.join(settings.MEDIA_ROOT, "feeds"),
+            help="Directory of the generated files.",
+        )
+        parser.add_argument(
+            "--base-url",
+            required=True,
+            help="Scheme and host of the shop, e.g. https://example.com.",
+        )
+        parser.add_argument(
+            "--files-url",
+            default=f"{settings.MEDIA_URL}feeds/",
+            help="Path the output directory is served at, used in the sitemap index.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        output_dir = options["output_dir"]
+        base_url = options["base_url"].rstrip("/")
+        os.makedirs(output_dir, exist_ok=True)
+
+        page_names = []
+        for page in range(1, get_sitemap_pages_count() + 1):
+            page_names.append(f"sitemap-{page}.xml.gz")
+            self.write(os.path.join(output_dir, page_names[-1]), iter_sitemap(base_url, page))
+        self.write(
+            os.path.join(output_dir, "sitemap.xml.gz"),
+            iter_sitemap_index(base_url, [options["files_url"] + name for name in page_names]),
+        )
+        for feed_format in FEED_FORMATS:
+            self.write(
+                os.path.join(output_dir, f"feed.{feed_format}.gz"),
+                iter_product_feed(base_url, feed_format),
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Feeds generated in {output_dir}: {len(page_names)} sitemap pages."
+            )
+        )
+
+    def write(self, path: str, chunks: Iterable[str]) -> None:
+        """
+        Write chunks of text to a gzipped file.
+
+        The file is written under a temporary name and then renamed, so a served file is never
+        partially written.
+
+        :param path: path of the file.
+        :param chunks: chunks of text.
+        """
+        temporary_path = f"{path}.tmp"
+        with gzip.open(temporary_path, "wt", encoding="utf-8") as file:
+            file.writelines(chunks)
+        os.replace(temporary_path, path)
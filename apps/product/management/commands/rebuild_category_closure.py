@@ -0,0 +1,19 @@
+"""
+Management command to rebuild the category closure table.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.product.services.category_closure import rebuild_category_closure
+
+
+class Command(BaseCommand):
+    """Rebuild the category closure table from the parent hierarchy."""
+
+    help = "Rebuild the category closure table from the parent hierarchy."
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        rows = rebuild_category_closure()
+        self.stdout.write(self.style.SUCCESS(f"Category closure rebuilt: {rows} rows."))
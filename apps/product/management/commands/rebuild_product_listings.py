@@ -0,0 +1,27 @@
+"""
+Management command to rebuild product listing rows.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.product.services.listing import rebuild_product_listings
+
+
+class Command(BaseCommand):
+    """Rebuild listing rows of all products."""
+
+    help = "Rebuild listing rows of all products."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Number of products refreshed at once."
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        refreshed = rebuild_product_listings(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Product listings rebuilt: {refreshed} products."))
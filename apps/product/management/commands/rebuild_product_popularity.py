@@ -0,0 +1,30 @@
+"""
+Management command to rebuild popularity scores of products.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.product.services.popularity import rebuild_product_popularity
+
+
+class Command(BaseCommand):
+    """Recalculate popularity scores of all products from order items."""
+
+    help = "Recalculate popularity scores of all products from order items."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of order items read from the database at once.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        products = rebuild_product_popularity(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Popularity rebuilt: {products} products sold."))
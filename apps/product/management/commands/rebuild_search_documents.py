@@ -0,0 +1,27 @@
+"""
+Management command to rebuild product search documents.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.product.services.search import rebuild_search_documents
+
+
+class Command(BaseCommand):
+    """Rebuild search documents of all products."""
+
+    help = "Rebuild search documents of all products."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Number of products indexed at once."
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        indexed = rebuild_search_documents(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Search documents rebuilt: {indexed} products."))
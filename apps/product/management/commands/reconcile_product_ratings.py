@@ -0,0 +1,32 @@
+"""
+Management command to reconcile rating aggregates of products with their reviews.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.product.services.reviews import DEFAULT_CHUNK_SIZE, reconcile_product_ratings
+
+
+class Command(BaseCommand):
+    """Recalculate rating aggregates of all products from their reviews."""
+
+    help = "Recalculate rating aggregates of all products from their reviews."
+
+    def add_arguments(self, parser) -> None:
+        """
+        Add command arguments.
+        """
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of products processed at once.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Execute the command.
+        """
+        corrected = reconcile_product_ratings(chunk_size=options["chunk_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Ratings reconciled: {corrected} products corrected.")
+        )
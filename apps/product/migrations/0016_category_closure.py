@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-17 05:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_category_closure(apps, schema_editor):
+    Category = apps.get_model('product', 'Category')
+    CategoryClosure = apps.get_model('product', 'CategoryClosure')
+
+    parents = dict(Category.objects.values_list('id', 'parent_id'))
+    links = []
+    for category_id in parents:
+        current, depth = category_id, 0
+        while current is not None:
+            links.append(
+                CategoryClosure(ancestor_id=current, descendant_id=category_id, depth=depth)
+            )
+            current, depth = parents.get(current), depth + 1
+
+    CategoryClosure.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0015_alter_product_product_code_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveSmallIntegerField(verbose_name='Depth')),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='product.category')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='product.category')),
+            ],
+            options={
+                'verbose_name': 'Category closure',
+                'verbose_name_plural': 'Category closures',
+                'db_table': 'category_closure',
+                'indexes': [models.Index(fields=['descendant', 'depth'], name='idx_category_closure_desc')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='categoryclosure',
+            constraint=models.UniqueConstraint(fields=('ancestor', 'descendant'), name='unique_category_closure_pair'),
+        ),
+        migrations.RunPython(populate_category_closure, migrations.RunPython.noop),
+    ]
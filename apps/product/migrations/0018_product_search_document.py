@@ -0,0 +1,104 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:04
+
+import re
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+import django.db.models.deletion
+
+CREATE_INDEXES_SQL = [
+    'CREATE INDEX IF NOT EXISTS idx_search_documents_vector '
+    'ON product_search_documents USING gin (search_vector)',
+    'CREATE INDEX IF NOT EXISTS idx_search_documents_trgm '
+    'ON product_search_documents USING gin (document gin_trgm_ops)',
+]
+DROP_INDEXES_SQL = [
+    'DROP INDEX IF EXISTS idx_search_documents_vector',
+    'DROP INDEX IF EXISTS idx_search_documents_trgm',
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    # GIN indexes are specific to PostgreSQL, other databases use the in-process index.
+    if schema_editor.connection.vendor == 'postgresql':
+        for sql in CREATE_INDEXES_SQL:
+            schema_editor.execute(sql)
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for sql in DROP_INDEXES_SQL:
+            schema_editor.execute(sql)
+
+
+def populate_search_documents(apps, schema_editor):
+    Product = apps.get_model('product', 'Product')
+    ProductSearchDocument = apps.get_model('product', 'ProductSearchDocument')
+
+    def normalize(text):
+        return ' '.join(re.findall(r'\w+', (text or '').lower()))
+
+    documents = []
+    products = Product.objects.select_related('manufacturer').prefetch_related(
+        'product_characteristics', 'types_product__product_characteristics'
+    )
+    for product in products.iterator(chunk_size=1000):
+        characteristics = [item.name for item in product.product_characteristics.all()]
+        characteristics += [
+            f'{item.product_characteristics.name} {item.name}'
+            for item in product.types_product.all()
+        ]
+        fields = {
+            'name': product.name,
+            'brand': product.manufacturer.trade_brand,
+            'code': product.product_code,
+            'characteristics': ' '.join(characteristics),
+        }
+        documents.append(
+            ProductSearchDocument(
+                product_id=product.pk,
+                document=' '.join(normalize(value) for value in fields.values()),
+                **fields,
+            )
+        )
+    ProductSearchDocument.objects.bulk_create(documents, batch_size=1000)
+
+    if schema_editor.connection.vendor == 'postgresql':
+        ProductSearchDocument.objects.update(
+            search_vector=SearchVector('name', weight='A', config='simple')
+            + SearchVector('code', weight='A', config='simple')
+            + SearchVector('brand', weight='B', config='simple')
+            + SearchVector('characteristics', weight='C', config='simple')
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0017_product_keyset_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='ProductSearchDocument',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='product.product', verbose_name='Product')),
+                ('name', models.CharField(max_length=256, verbose_name='Name')),
+                ('brand', models.CharField(blank=True, max_length=256, verbose_name='Brand')),
+                ('code', models.CharField(max_length=256, verbose_name='Product code')),
+                ('characteristics', models.TextField(blank=True, verbose_name='Characteristics')),
+                ('document', models.TextField(verbose_name='Document')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(null=True, verbose_name='Search vector')),
+            ],
+            options={
+                'verbose_name': 'Product search document',
+                'verbose_name_plural': 'Product search documents',
+                'db_table': 'product_search_documents',
+            },
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,143 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:11
+
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_product_listings(apps, schema_editor):
+    Product = apps.get_model('product', 'Product')
+    ProductListing = apps.get_model('product', 'ProductListing')
+
+    listings = []
+    products = Product.objects.select_related('manufacturer', 'categories').prefetch_related(
+        'types_product__product_characteristics'
+    )
+    for product in products.iterator(chunk_size=1000):
+        price_discount = None
+        if product.price:
+            price_discount = (
+                product.price * ((100 - product.discount_percentage) / 100)
+            ).quantize(Decimal('0.01'), rounding=ROUND_HALF_EVEN)
+        listings.append(
+            ProductListing(
+                product_id=product.pk,
+                category_id=product.categories_id,
+                manufacturer_id=product.manufacturer_id,
+                slug=product.slug,
+                name=product.name,
+                product_code=product.product_code,
+                description_short=product.description_short,
+                price=product.price,
+                price_discount=price_discount,
+                discount_percentage=product.discount_percentage,
+                rating=product.rating,
+                image=product.image.name,
+                category_slug=product.categories.slug,
+                manufacturer_brand=product.manufacturer.trade_brand,
+                types_product=[
+                    {
+                        'productCharacteristics': item.product_characteristics.name,
+                        'typeCharacteristic': item.name,
+                    }
+                    for item in product.types_product.all()
+                ],
+                created_at=product.created_at,
+            )
+        )
+    ProductListing.objects.bulk_create(listings, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0018_product_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductListing',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='listing', serialize=False, to='product.product', verbose_name='Product')),
+                ('slug', models.SlugField(max_length=256)),
+                ('name', models.CharField(max_length=256, verbose_name='Name')),
+                ('product_code', models.CharField(max_length=256, verbose_name='Product code')),
+                ('description_short', models.CharField(blank=True, max_length=256, null=True, verbose_name='Short description')),
+                ('price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='Price')),
+                ('price_discount', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='Promotional price')),
+                ('discount_percentage', models.DecimalField(decimal_places=2, default=0, max_digits=5, verbose_name='Discount percentage')),
+                ('rating', models.DecimalField(decimal_places=2, default=0, max_digits=3, verbose_name='Rating')),
+                ('image', models.ImageField(upload_to='product/%Y/%m/%d', verbose_name='Image path')),
+                ('category_slug', models.SlugField(max_length=256, verbose_name='Category slug')),
+                ('manufacturer_brand', models.CharField(max_length=256, verbose_name='Manufacturer brand')),
+                ('types_product', models.JSONField(blank=True, default=list, verbose_name='Types of product characteristics')),
+                ('created_at', models.DateTimeField(verbose_name='Product creation date')),
+            ],
+            options={
+                'verbose_name': 'Product listing',
+                'verbose_name_plural': 'Product listings',
+                'db_table': 'product_listing',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_products_created_id',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_products_price_id',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_products_rating_id',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_products_cat_created_id',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_products_cat_price_id',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='idx_products_cat_rating_id',
+        ),
+        migrations.AddField(
+            model_name='productlisting',
+            name='category',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_listings', to='product.category', verbose_name='Category'),
+        ),
+        migrations.AddField(
+            model_name='productlisting',
+            name='manufacturer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_listings', to='product.manufacturer', verbose_name='Manufacturer'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['created_at', 'product'], name='idx_listing_created_id'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['price', 'product'], name='idx_listing_price_id'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['rating', 'product'], name='idx_listing_rating_id'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['category', 'created_at', 'product'], name='idx_listing_cat_created_id'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['category', 'price', 'product'], name='idx_listing_cat_price_id'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['category', 'rating', 'product'], name='idx_listing_cat_rating_id'),
+        ),
+        migrations.RunPython(populate_product_listings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:20
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations, models
+
+
+def populate_price_discount(apps, schema_editor):
+    Product = apps.get_model('product', 'Product')
+    ProductListing = apps.get_model('product', 'ProductListing')
+
+    products = []
+    for product in Product.objects.only('price', 'discount_percentage').iterator(chunk_size=1000):
+        if product.price is not None:
+            product.price_discount = (
+                product.price * (100 - product.discount_percentage) / 100
+            ).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            products.append(product)
+    Product.objects.bulk_update(products, ['price_discount'], batch_size=1000)
+
+    # Listing rows were filled with the previous rounding of the promotional price.
+    ProductListing.objects.update(
+        price_discount=models.Subquery(
+            Product.objects.filter(pk=models.OuterRef('pk')).values('price_discount')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0019_product_listing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='price_discount',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text='Price with the discount, calculated on save', max_digits=10, null=True, verbose_name='Promotional price'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['price_discount', 'product'], name='idx_listing_discount_id'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['category', 'price_discount', 'product'], name='idx_listing_cat_discount_id'),
+        ),
+        migrations.RunPython(populate_price_discount, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:22
+
+from django.db import migrations, models
+
+
+def populate_characteristics(apps, schema_editor):
+    Product = apps.get_model('product', 'Product')
+    ProductListing = apps.get_model('product', 'ProductListing')
+    TypeProductCharacteristics = apps.get_model('product', 'TypeProductCharacteristics')
+
+    types = models.Prefetch(
+        'types_product',
+        queryset=TypeProductCharacteristics.objects.select_related(
+            'product_characteristics'
+        ).order_by('product_characteristics__name', 'name'),
+    )
+    listings = []
+    for product in Product.objects.prefetch_related(types).iterator(chunk_size=1000):
+        characteristics = {}
+        for item in product.types_product.all():
+            characteristics.setdefault(item.product_characteristics.name, []).append(item.name)
+        listings.append(
+            ProductListing(
+                product_id=product.pk,
+                types_product=[
+                    {
+                        'productCharacteristics': item.product_characteristics.name,
+                        'typeCharacteristic': item.name,
+                    }
+                    for item in product.types_product.all()
+                ],
+                characteristics=characteristics,
+            )
+        )
+    ProductListing.objects.bulk_update(
+        listings, ['types_product', 'characteristics'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0020_product_price_discount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productlisting',
+            name='characteristics',
+            field=models.JSONField(blank=True, default=dict, help_text='Names of characteristics mapped to their types', verbose_name='Characteristics'),
+        ),
+        migrations.RunPython(populate_characteristics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:29
+
+from django.db import migrations, models
+from django.db.models import IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+
+
+def populate_available_quantity(apps, schema_editor):
+    ProductListing = apps.get_model('product', 'ProductListing')
+    Warehouse = apps.get_model('warehouse', 'Warehouse')
+    Reserve = apps.get_model('warehouse', 'Reserve')
+
+    balance = (
+        Warehouse.objects.filter(product=OuterRef('product_id'))
+        .order_by()
+        .values('product')
+        .annotate(total=Sum('total_balance'))
+        .values('total')
+    )
+    reserved = (
+        Reserve.objects.filter(reserved_item=OuterRef('product_id'), is_active=True)
+        .order_by()
+        .values('reserved_item')
+        .annotate(total=Sum('quantity'))
+        .values('total')
+    )
+    ProductListing.objects.update(
+        available_quantity=Greatest(
+            Coalesce(Subquery(balance, output_field=IntegerField()), Value(0))
+            - Coalesce(Subquery(reserved, output_field=IntegerField()), Value(0)),
+            Value(0),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0021_product_listing_characteristics'),
+        ('warehouse', '0006_alter_transaction_order_item_alter_warehouse_product'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productlisting',
+            name='available_quantity',
+            field=models.IntegerField(default=0, help_text='Warehouse balance of the product that is not reserved by orders', verbose_name='Available quantity'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(condition=models.Q(('available_quantity__gt', 0)), fields=['created_at', 'product'], name='idx_listing_in_stock'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(condition=models.Q(('available_quantity__gt', 0)), fields=['category', 'created_at', 'product'], name='idx_listing_cat_in_stock'),
+        ),
+        migrations.RunPython(populate_available_quantity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0022_product_listing_available_quantity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductCoPurchaseBuild',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('built_until', models.DateTimeField(help_text='Creation date of the last counted order item', verbose_name='Built until')),
+                ('is_full', models.BooleanField(default=False, verbose_name='Full rebuild')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Creation date')),
+            ],
+            options={
+                'verbose_name': 'Co-purchase index build',
+                'verbose_name_plural': 'Co-purchase index builds',
+                'db_table': 'product_co_purchase_build',
+                'ordering': ['-created_at'],
+                'get_latest_by': 'created_at',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductCoPurchase',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('orders_count', models.PositiveIntegerField(help_text='Number of orders with both products', verbose_name='Orders count')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='co_purchases', to='product.product', verbose_name='Product')),
+                ('related_product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='product.product', verbose_name='Related product')),
+            ],
+            options={
+                'verbose_name': 'Product co-purchase',
+                'verbose_name_plural': 'Product co-purchases',
+                'db_table': 'product_co_purchase',
+                'indexes': [models.Index(fields=['product', '-orders_count', 'related_product'], name='idx_co_purchase_rank')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='productcopurchase',
+            constraint=models.UniqueConstraint(fields=('product', 'related_product'), name='unique_product_co_purchase'),
+        ),
+    ]
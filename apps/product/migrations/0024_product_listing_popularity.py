@@ -0,0 +1,55 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:34
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_popularity(apps, schema_editor):
+    ProductListing = apps.get_model('product', 'ProductListing')
+    OrderItem = apps.get_model('order', 'OrderItem')
+
+    half_life = getattr(settings, 'POPULARITY_HALF_LIFE', timedelta(days=7))
+    landmark = getattr(
+        settings, 'POPULARITY_LANDMARK', datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+    scores = Counter()
+    for product_id, quantity, created_at in OrderItem.objects.values_list(
+        'product_id', 'quantity', 'created_at'
+    ).iterator(chunk_size=2000):
+        scores[product_id] += quantity * 2 ** ((created_at - landmark) / half_life)
+    ProductListing.objects.bulk_update(
+        [
+            ProductListing(product_id=product_id, popularity=score)
+            for product_id, score in scores.items()
+        ],
+        ['popularity'],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0023_product_co_purchase'),
+        ('order', '0015_alter_order_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productlisting',
+            name='popularity',
+            field=models.FloatField(default=0, help_text='Sold items weighted by the date of sale, see services.popularity', verbose_name='Popularity'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['popularity', 'product'], name='idx_listing_popularity_id'),
+        ),
+        migrations.AddIndex(
+            model_name='productlisting',
+            index=models.Index(fields=['category', 'popularity', 'product'], name='idx_listing_cat_popularity_id'),
+        ),
+        migrations.RunPython(populate_popularity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def populate_price_history(apps, schema_editor):
+    Product = apps.get_model('product', 'Product')
+    ProductPriceHistory = apps.get_model('product', 'ProductPriceHistory')
+
+    ProductPriceHistory.objects.bulk_create(
+        (
+            ProductPriceHistory(
+                product_id=product_id,
+                price=price,
+                price_discount=price_discount,
+                changed_at=updated_at,
+            )
+            for product_id, price, price_discount, updated_at in Product.objects.values_list(
+                'id', 'price', 'price_discount', 'updated_at'
+            ).iterator(chunk_size=2000)
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0024_product_listing_popularity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductPriceHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='Price')),
+                ('price_discount', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='Promotional price')),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Change date')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='price_history', to='product.product', verbose_name='Product')),
+            ],
+            options={
+                'verbose_name': 'Product price history',
+                'verbose_name_plural': 'Product price history',
+                'db_table': 'product_price_history',
+                'ordering': ['product', 'changed_at'],
+                'indexes': [models.Index(fields=['product', 'changed_at'], name='idx_price_history_product')],
+            },
+        ),
+        migrations.RunPython(populate_price_history, migrations.RunPython.noop),
+    ]
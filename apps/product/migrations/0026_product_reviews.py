@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:48
+
+from django.conf import settings
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('product', '0025_product_price_history'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Number of reviews'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Sum of review ratings'),
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='rating',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Average rating of reviews, maintained from reviews.', max_digits=3, validators=[django.core.validators.MinValueValidator(0, message='Rating cannot be less than 0'), django.core.validators.MaxValueValidator(5, message='Rating cannot be more than 5')], verbose_name='Rating'),
+        ),
+        migrations.CreateModel(
+            name='ProductReview',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+                ('rating', models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1, message='Rating cannot be less than 1'), django.core.validators.MaxValueValidator(5, message='Rating cannot be more than 5')], verbose_name='Rating')),
+                ('text', models.TextField(blank=True, default='', verbose_name='Text')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='product.product', verbose_name='Product')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_reviews', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Product review',
+                'verbose_name_plural': 'Product reviews',
+                'db_table': 'product_reviews',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['product', '-created_at'], name='idx_review_product_created')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='productreview',
+            constraint=models.UniqueConstraint(fields=('product', 'user'), name='unique_product_review'),
+        ),
+        migrations.AddConstraint(
+            model_name='productreview',
+            constraint=models.CheckConstraint(check=models.Q(('rating__gte', 1), ('rating__lte', 5)), name='review_rating_from_1_to_5', violation_error_message='Rating must be from 1 to 5.'),
+        ),
+    ]
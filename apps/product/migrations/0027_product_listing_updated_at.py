@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:31
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0026_product_reviews'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productlisting',
+            name='updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='Date of the last refresh of the row from its product', verbose_name='Listing update date'),
+        ),
+    ]
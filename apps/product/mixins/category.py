@@ -3,9 +3,9 @@ This module contains custom Category-related mixins.
 """
 from typing import Tuple
 
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 
-from apps.product.models import Category
+from apps.product.services.category_tree import CategoryNode, get_category_tree
 
 
 class CategoryMixin:
@@ -13,22 +13,29 @@ class CategoryMixin:
     A mixin for views handling hierarchical categories.
 
     This mixin provides a method to retrieve category, subcategory, and lower-level category
-    objects based on slugs provided in the URL kwargs.
+    nodes based on slugs provided in the URL kwargs.
     """
 
-    def get_categories(self) -> Tuple[Category, Category, Category]:
+    def get_categories(self) -> Tuple[CategoryNode, CategoryNode, CategoryNode]:
         """
-        Retrieve category, subcategory, and lower-level category objects based on URL kwargs.
+        Retrieve category, subcategory, and lower-level category nodes based on URL kwargs.
 
-        :return: A tuple containing category, subcategory, and lower-level category objects.
+        Categories are resolved from the in-process category tree snapshot without
+        querying the database.
+
+        :return: A tuple containing category, subcategory, and lower-level category nodes.
         If any category is not found, a 404 response is raised.
         """
         category_slug = self.kwargs.get("category_slug")
         subcategory_slug = self.kwargs.get("subcategory_slug")
         lower_category_slug = self.kwargs.get("lower_category_slug")
 
-        category = get_object_or_404(Category, slug=category_slug)
-        subcategory = get_object_or_404(Category, parent=category, slug=subcategory_slug)
-        lower_category = get_object_or_404(Category, parent=subcategory, slug=lower_category_slug)
+        tree = get_category_tree()
+        category = tree.resolve(category_slug)
+        subcategory = tree.resolve(category_slug, subcategory_slug)
+        lower_category = tree.resolve(category_slug, subcategory_slug, lower_category_slug)
+
+        if lower_category is None:
+            raise Http404("No Category matches the given query.")
 
         return category, subcategory, lower_category
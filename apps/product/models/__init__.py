@@ -1,6 +1,23 @@
-from apps.product.models.category import Category
+from apps.product.models.category import Category, CategoryClosure
+from apps.product.models.co_purchase import ProductCoPurchase, ProductCoPurchaseBuild
 from apps.product.models.image import ProductImage
+from apps.product.models.listing import ProductListing
 from apps.product.models.manufacturer import Manufacturer
+from apps.product.models.price_history import ProductPriceHistory
 from apps.product.models.product import Product
+from apps.product.models.review import ProductReview
+from apps.product.models.search import ProductSearchDocument
 
-__all__ = ["Product", "Category", "ProductImage", "Manufacturer"]
+__all__ = [
+    "Product",
+    "Category",
+    "CategoryClosure",
+    "ProductImage",
+    "Manufacturer",
+    "ProductSearchDocument",
+    "ProductListing",
+    "ProductCoPurchase",
+    "ProductCoPurchaseBuild",
+    "ProductPriceHistory",
+    "ProductReview",
+]
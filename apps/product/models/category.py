@@ -2,9 +2,11 @@
 Module defines Category model for product app.
 """
 from typing import Type, List
+from uuid import UUID
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 
 from apps.base.models import BaseDate, BaseID
@@ -71,40 +73,50 @@ class Category(BaseID, BaseDate):
                 {"parent": _("Category level must be lower than its parent's category level.")}
             )
 
-    def get_ancestors(self) -> list:
+    def get_ancestors(self) -> QuerySet:
         """
         Retrieve the ancestors of the category.
 
-        This method doesn't involve additional queries, as it simply traverses the parent
-        hierarchy.
+        Ancestors are resolved with a single query over the category closure table.
 
-        :return: Category objects representing the ancestors.
+        :return: QuerySet of Category objects representing the ancestors, nearest parent first.
         """
-        ancestors = []
-        current = self.parent
+        return Category.objects.filter(
+            descendant_links__descendant=self, descendant_links__depth__gt=0
+        ).order_by("descendant_links__depth")
 
-        # Traverse the parent hierarchy to collect ancestors.
-        while current:
-            ancestors.append(current)
-            current = current.parent
+    def get_descendants(self) -> QuerySet:
+        """
+        Retrieve the descendants of the category.
 
-        return ancestors
+        Descendants are resolved with a single query over the category closure table,
+        regardless of the depth of the hierarchy.
 
-    def get_descendants(self) -> list:
+        :return: QuerySet of Category objects representing the descendants.
         """
-        Retrieve the descendants of the category.
+        return Category.objects.filter(ancestor_links__ancestor=self, ancestor_links__depth__gt=0)
 
-        Note that deep hierarchies or a large number of descendants may cause performance issues
+    def get_products(self) -> QuerySet:
+        """
+        Retrieve all products that belong to the category or any of its descendants.
 
-        :return: Category objects representing the descendants.
+        :return: QuerySet of Product objects.
         """
-        descendants = list(self.subcategories.all())
+        from apps.product.models.product import Product
+
+        return Product.objects.filter(categories__in=Category.get_subtree_ids(self.pk))
 
-        # Recursively fetch descendants for each subcategory.
-        for descendant in descendants:
-            descendants.extend(descendant.get_descendants())
+    @staticmethod
+    def get_subtree_ids(category_id: UUID) -> QuerySet:
+        """
+        Retrieve ids of the category and all of its descendants.
 
-        return descendants
+        The result is meant to be used as a subquery, e.g. `filter(categories__in=...)`.
+
+        :param category_id: id of the root category of the subtree.
+        :return: values QuerySet with ids of the subtree categories.
+        """
+        return CategoryClosure.objects.filter(ancestor_id=category_id).values("descendant_id")
 
     @classmethod
     def get_descendants_by_level(
@@ -122,3 +134,42 @@ class Category(BaseID, BaseDate):
         if level in {i for i in range(3)}:
             return cls.objects.filter(parent__slug=slug, level=level)
         return cls.objects.none()
+
+
+class CategoryClosure(models.Model):
+    """
+    Represents an ancestor/descendant pair of the category tree (closure table).
+
+    Every category is linked to itself with depth 0 and to each of its ancestors with
+    the distance between them, so subtrees and paths are resolved with one indexed query.
+    The table is maintained by signals on Category save/delete.
+    """
+
+    ancestor = models.ForeignKey(
+        Category, on_delete=models.CASCADE, related_name="descendant_links"
+    )
+    descendant = models.ForeignKey(
+        Category, on_delete=models.CASCADE, related_name="ancestor_links"
+    )
+    depth = models.PositiveSmallIntegerField(verbose_name=_("Depth"))
+
+    class Meta:
+        db_table = "category_closure"
+        verbose_name = _("Category closure")
+        verbose_name_plural = _("Category closures")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["ancestor", "descendant"], name="unique_category_closure_pair"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["descendant", "depth"], name="idx_category_closure_desc"),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the CategoryClosure model.
+
+        :return: ids of the linked categories and the distance between them.
+        """
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
@@ -0,0 +1,87 @@
+"""
+Module: co_purchase.py.
+
+This module defines models of the "frequently bought together" index for the product app.
+"""
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.product.models.product import Product
+
+
+class ProductCoPurchase(models.Model):
+    """
+    Model representing a product frequently bought together with another product.
+
+    Only top neighbours of every product are stored, ranked by the number of orders with
+    both products. Rows are built by the `build_co_purchases` management command.
+    """
+
+    product = models.ForeignKey(
+        to=Product,
+        on_delete=models.CASCADE,
+        related_name="co_purchases",
+        verbose_name=_("Product"),
+    )
+    related_product = models.ForeignKey(
+        to=Product,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("Related product"),
+    )
+    orders_count = models.PositiveIntegerField(
+        verbose_name=_("Orders count"),
+        help_text=_("Number of orders with both products"),
+    )
+
+    class Meta:
+        db_table = "product_co_purchase"
+        verbose_name = _("Product co-purchase")
+        verbose_name_plural = _("Product co-purchases")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "related_product"], name="unique_product_co_purchase"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["product", "-orders_count", "related_product"],
+                name="idx_co_purchase_rank",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """This method is automatically called when you use the `str()` function.
+
+        Or when the object needs to be represented as a string
+        """
+        return f"{self.product_id} - {self.related_product_id}: {self.orders_count}"
+
+
+class ProductCoPurchaseBuild(models.Model):
+    """
+    Model representing a build of the co-purchase index.
+
+    Incremental builds count order items created after the last build.
+    """
+
+    built_until = models.DateTimeField(
+        verbose_name=_("Built until"),
+        help_text=_("Creation date of the last counted order item"),
+    )
+    is_full = models.BooleanField(default=False, verbose_name=_("Full rebuild"))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Creation date"))
+
+    class Meta:
+        ordering = ["-created_at"]
+        get_latest_by = "created_at"
+        db_table = "product_co_purchase_build"
+        verbose_name = _("Co-purchase index build")
+        verbose_name_plural = _("Co-purchase index builds")
+
+    def __str__(self) -> str:
+        """This method is automatically called when you use the `str()` function.
+
+        Or when the object needs to be represented as a string
+        """
+        return f"{self.created_at}: until {self.built_until}"
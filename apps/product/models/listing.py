@@ -0,0 +1,137 @@
+"""
+Module: listing.py.
+
+This module defines the ProductListing model for the product app.
+"""
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.product.models.category import Category
+from apps.product.models.manufacturer import Manufacturer
+from apps.product.models.product import Product
+
+
+class ProductListing(models.Model):
+    """
+    Model representing the denormalized listing row of a product.
+
+    The row holds exactly the payload of product lists, so a page is read with a single
+    indexed query without joins or prefetches. Rows are kept in sync by signals.
+    """
+
+    product = models.OneToOneField(
+        to=Product,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="listing",
+        verbose_name=_("Product"),
+    )
+    category = models.ForeignKey(
+        to=Category,
+        on_delete=models.CASCADE,
+        related_name="product_listings",
+        verbose_name=_("Category"),
+    )
+    manufacturer = models.ForeignKey(
+        to=Manufacturer,
+        on_delete=models.CASCADE,
+        related_name="product_listings",
+        verbose_name=_("Manufacturer"),
+    )
+    slug = models.SlugField(max_length=256)
+    name = models.CharField(max_length=256, verbose_name=_("Name"))
+    product_code = models.CharField(max_length=256, verbose_name=_("Product code"))
+    description_short = models.CharField(
+        max_length=256, null=True, blank=True, verbose_name=_("Short description")
+    )
+    price = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True, verbose_name=_("Price")
+    )
+    price_discount = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name=_("Promotional price"),
+    )
+    discount_percentage = models.DecimalField(
+        max_digits=5, decimal_places=2, default=0, verbose_name=_("Discount percentage")
+    )
+    rating = models.DecimalField(
+        max_digits=3, decimal_places=2, default=0, verbose_name=_("Rating")
+    )
+    image = models.ImageField(upload_to="product/%Y/%m/%d", verbose_name=_("Image path"))
+    category_slug = models.SlugField(max_length=256, verbose_name=_("Category slug"))
+    manufacturer_brand = models.CharField(max_length=256, verbose_name=_("Manufacturer brand"))
+    types_product = models.JSONField(
+        default=list, blank=True, verbose_name=_("Types of product characteristics")
+    )
+    characteristics = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_("Characteristics"),
+        help_text=_("Names of characteristics mapped to their types"),
+    )
+    available_quantity = models.IntegerField(
+        default=0,
+        verbose_name=_("Available quantity"),
+        help_text=_("Warehouse balance of the product that is not reserved by orders"),
+    )
+    popularity = models.FloatField(
+        default=0,
+        verbose_name=_("Popularity"),
+        help_text=_("Sold items weighted by the date of sale, see services.popularity"),
+    )
+    created_at = models.DateTimeField(verbose_name=_("Product creation date"))
+    updated_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("Listing update date"),
+        help_text=_("Date of the last refresh of the row from its product"),
+    )
+
+    class Meta:
+        ordering = ["-created_at"]
+        db_table = "product_listing"
+        verbose_name = _("Product listing")
+        verbose_name_plural = _("Product listings")
+        indexes = [
+            # Keyset pagination seeks by the ordering field with the id as a tiebreak.
+            models.Index(fields=["created_at", "product"], name="idx_listing_created_id"),
+            models.Index(fields=["price", "product"], name="idx_listing_price_id"),
+            models.Index(fields=["rating", "product"], name="idx_listing_rating_id"),
+            models.Index(fields=["price_discount", "product"], name="idx_listing_discount_id"),
+            models.Index(fields=["popularity", "product"], name="idx_listing_popularity_id"),
+            models.Index(
+                fields=["category", "created_at", "product"], name="idx_listing_cat_created_id"
+            ),
+            models.Index(fields=["category", "price", "product"], name="idx_listing_cat_price_id"),
+            models.Index(
+                fields=["category", "rating", "product"], name="idx_listing_cat_rating_id"
+            ),
+            models.Index(
+                fields=["category", "price_discount", "product"],
+                name="idx_listing_cat_discount_id",
+            ),
+            models.Index(
+                fields=["category", "popularity", "product"], name="idx_listing_cat_popularity_id"
+            ),
+            # Lists of products in stock only index rows with a free balance.
+            models.Index(
+                fields=["created_at", "product"],
+                condition=models.Q(available_quantity__gt=0),
+                name="idx_listing_in_stock",
+            ),
+            models.Index(
+                fields=["category", "created_at", "product"],
+                condition=models.Q(available_quantity__gt=0),
+                name="idx_listing_cat_in_stock",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """This method is automatically called when you use the `str()` function.
+
+        Or when the object needs to be represented as a string
+        """
+        return f"{self.name}-{self.product_code}"
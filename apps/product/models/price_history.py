@@ -0,0 +1,52 @@
+"""
+Module: price_history.py.
+
+This module defines the price history model for the product app.
+"""
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.product.models.product import Product
+
+
+class ProductPriceHistory(models.Model):
+    """
+    Model representing prices of a product since a change of the price or the discount.
+
+    Rows are only appended, a row is valid until the next row of the product.
+    """
+
+    product = models.ForeignKey(
+        to=Product,
+        on_delete=models.CASCADE,
+        related_name="price_history",
+        verbose_name=_("Product"),
+    )
+    price = models.DecimalField(
+        verbose_name=_("Price"), max_digits=10, decimal_places=2, null=True, blank=True
+    )
+    price_discount = models.DecimalField(
+        verbose_name=_("Promotional price"),
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+    )
+    changed_at = models.DateTimeField(default=timezone.now, verbose_name=_("Change date"))
+
+    class Meta:
+        ordering = ["product", "changed_at"]
+        db_table = "product_price_history"
+        verbose_name = _("Product price history")
+        verbose_name_plural = _("Product price history")
+        indexes = [
+            models.Index(fields=["product", "changed_at"], name="idx_price_history_product"),
+        ]
+
+    def __str__(self) -> str:
+        """This method is automatically called when you use the `str()` function.
+
+        Or when the object needs to be represented as a string
+        """
+        return f"{self.product_id}: {self.price_discount} since {self.changed_at}"
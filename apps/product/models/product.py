@@ -3,9 +3,12 @@ Module: product.py.
 
 This module defines the Product model for the product app.
 """
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional
+
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.utils.translation import gettext_lazy as _
 
 from apps.base.models import BaseDate, BaseID
@@ -14,6 +17,24 @@ from apps.product.models.category import Category
 from apps.product.models.manufacturer import Manufacturer
 
 
+def calculate_price_discount(price, discount_percentage) -> Optional[Decimal]:
+    """
+    Calculate the promotional price rounded to cents, half up like cart and order totals.
+
+    :param price: price of the product.
+    :param discount_percentage: discount percentage of the product.
+    :return: promotional price or None if the product has no price.
+    """
+    if price is None:
+        return None
+    price_discount = Decimal(str(price)) * (100 - Decimal(str(discount_percentage))) / 100
+    return price_discount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+# Fields maintained by reviews, see `services.reviews`.
+RATING_FIELDS = ("rating", "rating_sum", "rating_count")
+
+
 class Product(BaseID, BaseDate):
     """Model representing a product."""
 
@@ -40,7 +61,13 @@ class Product(BaseID, BaseDate):
             MinValueValidator(0, message="Rating cannot be less than 0"),
             MaxValueValidator(5, message="Rating cannot be more than 5"),
         ],
-        help_text=_("Enter a rating between 0 and 5."),
+        help_text=_("Average rating of reviews, maintained from reviews."),
+    )
+    rating_sum = models.PositiveIntegerField(
+        verbose_name=_("Sum of review ratings"), default=0, editable=False
+    )
+    rating_count = models.PositiveIntegerField(
+        verbose_name=_("Number of reviews"), default=0, editable=False
     )
     discount_percentage = models.DecimalField(
         max_digits=5,
@@ -59,6 +86,15 @@ class Product(BaseID, BaseDate):
         blank=True,
         help_text=_("This field allows empty value"),
     )
+    price_discount = models.DecimalField(
+        verbose_name=_("Promotional price"),
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("Price with the discount, calculated on save"),
+    )
     product_code = models.CharField(
         max_length=256,
         verbose_name=_("Product code"),
@@ -126,13 +162,25 @@ class Product(BaseID, BaseDate):
     #             product characteristic.")
     #         )
 
-    @property
-    def price_discount(self):
-        """Method for calculating promotional price."""
-        if self.price:
-            return self.price * ((100 - self.discount_percentage) / 100)
-        else:
-            return None
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save the product with the promotional price calculated from price and discount.
+
+        Bulk updates of price or discount have to set `price_discount` themselves. Rating
+        aggregates are updated by reviews in place, so saving an existing product doesn't
+        overwrite them with values read before concurrent reviews.
+        """
+        self.price_discount = calculate_price_discount(self.price, self.discount_percentage)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None and not self._state.adding and not kwargs.get("force_insert"):
+            update_fields = kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in RATING_FIELDS
+            ]
+        if update_fields is not None and {"price", "discount_percentage"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "price_discount"}
+        super().save(*args, **kwargs)
 
     def delete(self, *args, **kwargs):
         """TODO: describe this method when the app warehouse will be ready.
@@ -203,3 +251,20 @@ class TypeProductCharacteristics(BaseID, BaseDate):
         Or when the object needs to be represented as a string.
         """
         return f"{self.name}"
+
+
+def get_types_product_prefetch() -> Prefetch:
+    """
+    Prefetch types of characteristics of products together with their characteristics.
+
+    Types of all prefetched products are loaded with a single query, ordered by the name of
+    the characteristic and the type.
+
+    :return: prefetch of `types_product`.
+    """
+    return Prefetch(
+        "types_product",
+        queryset=TypeProductCharacteristics.objects.select_related(
+            "product_characteristics"
+        ).order_by("product_characteristics__name", "name"),
+    )
@@ -0,0 +1,67 @@
+"""
+Module: review.py.
+
+This module defines the review model for the product app.
+"""
+from django.conf import settings
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+
+from apps.base.models import BaseDate, BaseID
+from apps.product.models.product import Product
+
+
+class ProductReview(BaseID, BaseDate):
+    """
+    Model representing a review of a product by a user.
+
+    Ratings of reviews are added to the rating aggregates of the product when reviews are
+    saved or deleted, see `services.reviews`.
+    """
+
+    product = models.ForeignKey(
+        to=Product,
+        on_delete=models.CASCADE,
+        related_name="reviews",
+        verbose_name=_("Product"),
+    )
+    user = models.ForeignKey(
+        to=settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="product_reviews",
+        verbose_name=_("User"),
+    )
+    rating = models.PositiveSmallIntegerField(
+        verbose_name=_("Rating"),
+        validators=[
+            MinValueValidator(1, message=_("Rating cannot be less than 1")),
+            MaxValueValidator(5, message=_("Rating cannot be more than 5")),
+        ],
+    )
+    text = models.TextField(blank=True, default="", verbose_name=_("Text"))
+
+    class Meta:
+        ordering = ["-created_at"]
+        db_table = "product_reviews"
+        verbose_name = _("Product review")
+        verbose_name_plural = _("Product reviews")
+        constraints = [
+            models.UniqueConstraint(fields=["product", "user"], name="unique_product_review"),
+            models.CheckConstraint(
+                name="review_rating_from_1_to_5",
+                check=Q(rating__gte=1) & Q(rating__lte=5),
+                violation_error_message=_("Rating must be from 1 to 5."),
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["product", "-created_at"], name="idx_review_product_created"),
+        ]
+
+    def __str__(self) -> str:
+        """This method is automatically called when you use the `str()` function.
+
+        Or when the object needs to be represented as a string
+        """
+        return f"{self.product_id} - {self.user_id}: {self.rating}"
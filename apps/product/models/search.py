@@ -0,0 +1,46 @@
+"""
+Module: search.py.
+
+This module defines the ProductSearchDocument model for the product app.
+"""
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.product.models.product import Product
+
+
+class ProductSearchDocument(models.Model):
+    """
+    Model representing the searchable text of a product.
+
+    The document is denormalized from the product, its manufacturer and characteristics and
+    kept in sync by signals. On PostgreSQL `search_vector` is covered by a GIN index and
+    `document` by a trigram GIN index, both created in the migration.
+    """
+
+    product = models.OneToOneField(
+        to=Product,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+        verbose_name=_("Product"),
+    )
+    name = models.CharField(max_length=256, verbose_name=_("Name"))
+    brand = models.CharField(max_length=256, blank=True, verbose_name=_("Brand"))
+    code = models.CharField(max_length=256, verbose_name=_("Product code"))
+    characteristics = models.TextField(blank=True, verbose_name=_("Characteristics"))
+    document = models.TextField(verbose_name=_("Document"))
+    search_vector = SearchVectorField(null=True, verbose_name=_("Search vector"))
+
+    class Meta:
+        db_table = "product_search_documents"
+        verbose_name = _("Product search document")
+        verbose_name_plural = _("Product search documents")
+
+    def __str__(self) -> str:
+        """This method is automatically called when you use the `str()` function.
+
+        Or when the object needs to be represented as a string
+        """
+        return f"{self.name}-{self.code}"
@@ -0,0 +1,24 @@
+"""
+Contains serializers for autocomplete suggestions.
+"""
+
+from rest_framework import serializers
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validation of autocomplete query parameters.
+    """
+
+    q = serializers.CharField(max_length=256, allow_blank=True, default="")
+    limit = serializers.IntegerField(min_value=1, default=5)
+
+
+class SuggestionSerializer(serializers.Serializer):
+    """
+    Serializer for representation of a suggestion, brands have no slug.
+    """
+
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    slug = serializers.SlugField(read_only=True, allow_null=True)
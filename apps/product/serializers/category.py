@@ -1,11 +1,12 @@
 """
 Contains serializers for Category-related models.
 """
-from typing import List
+from typing import Iterable, List
 
 from rest_framework import serializers
 
 from apps.product.models import Category
+from apps.product.services.category_tree import CategoryNode, CategoryTree, get_category_tree
 
 
 class SubcategorySerializer(serializers.ModelSerializer):
@@ -50,9 +51,31 @@ class CategoryListSerializer(serializers.ModelSerializer):
         """
         Retrieve and serialize the subcategories for a given category instance.
 
+        Subcategories are taken from the category tree snapshot provided in the serializer
+        context (or the current snapshot of the process), so no queries are made per node.
+
         :param instance: Category instance for which subcategories are to be retrieved.
         :return: list of serialized subcategories related to the provided category instance.
         """
-        subcategories_qs = Category.objects.filter(parent_id=instance.id)
-        serializer = CategoryListSerializer(subcategories_qs, many=True)
-        return serializer.data
+        tree = self.context.get("category_tree") or get_category_tree()
+        return self.serialize_nodes(tree, tree.get_children(instance.id))
+
+    @classmethod
+    def serialize_nodes(cls, tree: CategoryTree, nodes: Iterable[CategoryNode]) -> List[dict]:
+        """
+        Serialize category tree nodes with all of their descendants.
+
+        :param tree: category tree the nodes belong to.
+        :param nodes: category nodes to serialize.
+        :return: list of serialized categories.
+        """
+        return [
+            {
+                "id": str(node.id),
+                "name": node.name,
+                "slug": node.slug,
+                "level": node.level,
+                "subcategories": cls.serialize_nodes(tree, tree.get_children(node.id)),
+            }
+            for node in nodes
+        ]
@@ -16,3 +16,11 @@ class ManufacturerSerializer(serializers.ModelSerializer):
         model = Manufacturer
         exclude = ["created_at", "updated_at"]
         read_only_fields = ["id"]
+
+
+class ManufacturerListSerializer(ManufacturerSerializer):
+    """
+    Serializer for the manufacturer directory, with the number of active products.
+    """
+
+    productsCount = serializers.IntegerField(source="products_count", read_only=True)
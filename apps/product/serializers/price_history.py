@@ -0,0 +1,32 @@
+"""
+Contains serializers for the price history of products.
+"""
+
+from rest_framework import serializers
+
+from apps.product.models import ProductPriceHistory
+from apps.product.services.price_history import LOWEST_PRICE_DAYS
+
+
+class PriceHistoryQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validation of price history query parameters.
+    """
+
+    days = serializers.IntegerField(min_value=1, max_value=366, default=LOWEST_PRICE_DAYS)
+
+
+class PriceHistorySerializer(serializers.ModelSerializer):
+    """
+    Serializer for representation of prices valid since a change.
+    """
+
+    priceDiscount = serializers.DecimalField(
+        source="price_discount", max_digits=10, decimal_places=2, read_only=True
+    )
+    changedAt = serializers.DateTimeField(source="changed_at", read_only=True)
+
+    class Meta:
+        model = ProductPriceHistory
+        fields = ["price", "priceDiscount", "changedAt"]
+        read_only_fields = fields
@@ -3,11 +3,12 @@ Serializers related to Product model.
 """
 from rest_framework import serializers
 
-from apps.base.serializers import BaseDateSerializer
-from apps.product.models import Product
+from apps.base.serializers import BaseDateSerializer, ValuesListSerializer
+from apps.product.models import Product, ProductListing
 from apps.product.models.product import TypeProductCharacteristics
 from apps.product.serializers.image import ImageSerializer
 from apps.product.serializers.manufacturer import ManufacturerSerializer
+from apps.product.services.listing import build_characteristics
 
 
 class TypeProductCharacteristicsSerializer(serializers.ModelSerializer):
@@ -49,6 +50,11 @@ class ProductListSerializer(BaseDateSerializer, serializers.ModelSerializer):
         read_only=True,
         slug_field="slug",
     )
+    characteristics = serializers.SerializerMethodField()
+    availableQuantity = serializers.IntegerField(
+        source="listing.available_quantity", read_only=True
+    )
+    inStock = serializers.BooleanField(source="listing.available_quantity", read_only=True)
 
     class Meta:
         model = Product
@@ -63,11 +69,55 @@ class ProductListSerializer(BaseDateSerializer, serializers.ModelSerializer):
             "categories",
             "discountPercentage",
             "typesProduct",
+            "characteristics",
             "image",
             "rating",
+            "availableQuantity",
+            "inStock",
         ]
         read_only_fields = ["id", "priceDiscount"]
 
+    def get_characteristics(self, obj) -> dict:
+        """
+        Map names of characteristics to names of their types.
+
+        Types should be prefetched with `get_types_product_prefetch` to avoid a query per type.
+        """
+        return build_characteristics(obj.types_product.all())
+
+
+class ProductListingSerializer(serializers.ModelSerializer):
+    """
+    Serializer for list of products read from the denormalized listing rows.
+
+    The output is the same as the output of `ProductListSerializer`. Lists of rows returned
+    by `.values()` are serialized with the fast path of `ValuesListSerializer`.
+    """
+
+    id = serializers.UUIDField(source="product_id", read_only=True)
+    productCode = serializers.CharField(source="product_code", read_only=True)
+    descriptionShort = serializers.CharField(source="description_short", read_only=True)
+    priceDiscount = serializers.DecimalField(
+        source="price_discount", max_digits=10, decimal_places=2, read_only=True
+    )
+    categories = serializers.CharField(source="category_slug", read_only=True)
+    discountPercentage = serializers.DecimalField(
+        source="discount_percentage",
+        max_digits=4,
+        decimal_places=2,
+        read_only=True,
+    )
+    typesProduct = serializers.JSONField(source="types_product", read_only=True)
+    characteristics = serializers.JSONField(read_only=True)
+    availableQuantity = serializers.IntegerField(source="available_quantity", read_only=True)
+    inStock = serializers.BooleanField(source="available_quantity", read_only=True)
+
+    class Meta:
+        model = ProductListing
+        fields = ProductListSerializer.Meta.fields
+        read_only_fields = fields
+        list_serializer_class = ValuesListSerializer
+
 
 class ProductDetailSerializer(ProductListSerializer):
     """Serializer for detail product."""
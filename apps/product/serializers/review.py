@@ -0,0 +1,21 @@
+"""
+Contains serializers for reviews of products.
+"""
+
+from rest_framework import serializers
+
+from apps.base.serializers import BaseDateSerializer
+from apps.product.models import ProductReview
+
+
+class ProductReviewSerializer(BaseDateSerializer, serializers.ModelSerializer):
+    """
+    Serializer for reviews, the product and the author are taken from the request.
+    """
+
+    firstName = serializers.CharField(source="user.first_name", read_only=True)
+
+    class Meta:
+        model = ProductReview
+        fields = ["id", "firstName", "rating", "text", "createdAt", "updatedAt"]
+        read_only_fields = ["id"]
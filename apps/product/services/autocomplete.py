@@ -0,0 +1,231 @@
+"""
+Autocomplete of product names, brands and categories.
+
+Suggestions are served from an in-process index of sorted keys, so a prefix is looked up
+with a binary search instead of an `ILIKE` query per keystroke. Every suggestion is indexed
+by its normalized name and by every suffix starting at a word, so "salm" completes
+"Brit Salmon Adult". Ranked results of prefixes matching many keys are computed when the
+index is built, so a lookup never ranks more than `HEAVY_PREFIX_SIZE` keys.
+"""
+from bisect import bisect_left
+from heapq import nsmallest
+from dataclasses import dataclass, field, replace
+from typing import Iterable, NamedTuple, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import Count, Q
+
+from apps.base.snapshot import VersionedSnapshot
+from apps.product.models import Category, Manufacturer, Product, ProductListing
+from apps.product.services.search import tokenize
+
+AUTOCOMPLETE_VERSION_KEY = "snapshot:product_autocomplete"
+AUTOCOMPLETE_MAX_LIMIT = getattr(settings, "PRODUCT_AUTOCOMPLETE_MAX_LIMIT", 20)
+HEAVY_PREFIX_SIZE = 256
+# Sorts after any character, so `prefix + MAX_CHAR` bounds keys starting with the prefix.
+MAX_CHAR = chr(0x10FFFF)
+
+PRODUCT = "products"
+BRAND = "brands"
+CATEGORY = "categories"
+KINDS = (PRODUCT, BRAND, CATEGORY)
+
+
+class Suggestion(NamedTuple):
+    """Immutable representation of a suggestion in the autocomplete index."""
+
+    kind: str
+    id: UUID
+    name: str
+    slug: Optional[str]
+    score: float
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text the same way as search queries are.
+
+    :param text: text to normalize.
+    :return: lowercase tokens separated by single spaces.
+    """
+    return " ".join(tokenize(text))
+
+
+@dataclass(frozen=True)
+class AutocompleteIndex:
+    """
+    Immutable in-process index of suggestions.
+
+    `keys` are sorted and `postings` hold, for the key at the same position, the position
+    of its suggestion and whether the key is the whole name rather than a later word.
+    """
+
+    suggestions: list[Suggestion] = field(default_factory=list)
+    keys: list[str] = field(default_factory=list)
+    postings: list[tuple[int, bool]] = field(default_factory=list)
+    heavy_prefixes: dict[str, dict[str, tuple[int, ...]]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, suggestions: Iterable[Suggestion]) -> "AutocompleteIndex":
+        """
+        Build the index from suggestions.
+
+        Suggestions are sorted by rank, higher scores and then names in alphabetical order
+        first, so matches are ranked by comparing their positions.
+
+        :param suggestions: suggestions of all kinds.
+        :return: autocomplete index.
+        """
+        suggestions = sorted(suggestions, key=lambda item: (-item.score, item.name.lower()))
+        entries = []
+        for position, suggestion in enumerate(suggestions):
+            words = normalize(suggestion.name).split(" ")
+            for start in range(len(words)):
+                key = " ".join(words[start:])
+                if key:
+                    entries.append((key, position, start == 0))
+        entries.sort()
+
+        index = cls(
+            suggestions=suggestions,
+            keys=[key for key, _, _ in entries],
+            postings=[(position, is_name) for _, position, is_name in entries],
+        )
+        return replace(index, heavy_prefixes=index.rank_heavy_prefixes())
+
+    def rank_heavy_prefixes(self) -> dict[str, dict[str, tuple[int, ...]]]:
+        """
+        Rank suggestions of prefixes matching more than `HEAVY_PREFIX_SIZE` keys.
+
+        Prefixes are extended one character at a time only within ranges of heavy prefixes,
+        so any prefix which is not heavy matches at most `HEAVY_PREFIX_SIZE` keys.
+
+        :return: positions of ranked suggestions by kind by prefix.
+        """
+        heavy_prefixes = {}
+        ranges = [(0, len(self.keys))]
+        length = 1
+        while ranges:
+            heavy_ranges = []
+            for start, end in ranges:
+                while start < end:
+                    if len(self.keys[start]) < length:
+                        start += 1
+                        continue
+                    prefix = self.keys[start][:length]
+                    prefix_end = bisect_left(self.keys, prefix + MAX_CHAR, start, end)
+                    if prefix_end - start > HEAVY_PREFIX_SIZE:
+                        heavy_prefixes[prefix] = self.rank(
+                            self.postings[start:prefix_end], AUTOCOMPLETE_MAX_LIMIT
+                        )
+                        heavy_ranges.append((start, prefix_end))
+                    start = prefix_end
+            ranges = heavy_ranges
+            length += 1
+        return heavy_prefixes
+
+    def rank(self, postings: Iterable[tuple[int, bool]], limit: int) -> dict[str, tuple[int, ...]]:
+        """
+        Rank matched suggestions of every kind.
+
+        Suggestions with names starting with the prefix come first, then suggestions in
+        the order of the index.
+
+        :param postings: matched positions of suggestions and whether the name matched.
+        :param limit: maximum number of suggestions of every kind.
+        :return: positions of ranked suggestions by kind.
+        """
+        matched = {kind: {} for kind in KINDS}
+        for position, is_name in postings:
+            kind_matched = matched[self.suggestions[position].kind]
+            kind_matched[position] = kind_matched.get(position, False) or is_name
+        return {
+            kind: tuple(
+                position
+                for _, position in nsmallest(
+                    limit, ((not is_name, position) for position, is_name in items.items())
+                )
+            )
+            for kind, items in matched.items()
+        }
+
+    def complete(self, query: str, limit: int) -> dict[str, list[Suggestion]]:
+        """
+        Find suggestions completing the query.
+
+        :param query: typed prefix.
+        :param limit: maximum number of suggestions of every kind.
+        :return: suggestions by kind.
+        """
+        prefix = normalize(query)
+        if not prefix:
+            ranked = {}
+        elif prefix in self.heavy_prefixes:
+            ranked = self.heavy_prefixes[prefix]
+        else:
+            start = bisect_left(self.keys, prefix)
+            end = bisect_left(self.keys, prefix + MAX_CHAR, start)
+            ranked = self.rank(self.postings[start:end], limit)
+
+        return {
+            kind: [self.suggestions[position] for position in ranked.get(kind, ())[:limit]]
+            for kind in KINDS
+        }
+
+
+def build_autocomplete_index() -> AutocompleteIndex:
+    """
+    Build the autocomplete index from products, manufacturers and categories.
+
+    Products are ranked by popularity as of the build, brands by the number of products.
+
+    :return: autocomplete index.
+    """
+    products = (
+        ProductListing.objects.exclude(
+            product__stock=Product.ProductStockChoices.WITHDRAWN_FROM_SALE
+        )
+        .values_list("product_id", "name", "slug", "popularity")
+        .iterator()
+    )
+    brands = Manufacturer.objects.annotate(
+        products_count=Count(
+            "products",
+            filter=~Q(products__stock=Product.ProductStockChoices.WITHDRAWN_FROM_SALE),
+        )
+    ).values_list("id", "trade_brand", "products_count")
+    categories = Category.objects.values_list("id", "name", "slug", "level")
+
+    return AutocompleteIndex.build(
+        [
+            *(Suggestion(PRODUCT, *row) for row in products),
+            *(Suggestion(BRAND, pk, name, None, count) for pk, name, count in brands),
+            # Broader categories come first.
+            *(
+                Suggestion(CATEGORY, pk, name, slug, -level)
+                for pk, name, slug, level in categories
+            ),
+        ]
+    )
+
+
+autocomplete_snapshot = VersionedSnapshot(AUTOCOMPLETE_VERSION_KEY, build_autocomplete_index)
+
+
+def autocomplete(query: str, limit: int) -> dict[str, list[Suggestion]]:
+    """
+    Find product names, brands and categories completing the query.
+
+    :param query: typed prefix.
+    :param limit: maximum number of suggestions of every kind.
+    :return: suggestions by kind.
+    """
+    return autocomplete_snapshot.get().complete(query, min(limit, AUTOCOMPLETE_MAX_LIMIT))
+
+
+def invalidate_autocomplete() -> None:
+    """
+    Invalidate autocomplete indexes of all processes, e.g. after a catalog change.
+    """
+    autocomplete_snapshot.invalidate()
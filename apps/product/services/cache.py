@@ -0,0 +1,82 @@
+"""
+Cache tags of product app responses.
+
+Responses are tagged with the products, categories and manufacturers they are built from,
+so a change invalidates only the responses it affects.
+"""
+from typing import Iterable
+from uuid import UUID
+
+from apps.base.cache import invalidate_tags
+from apps.product.models import Product
+
+CATEGORY_TREE_TAG = "category_tree"
+MANUFACTURER_LIST_TAG = "manufacturer_list"
+
+
+def get_product_tag(product_id: UUID) -> str:
+    """
+    Build the cache tag of the product.
+
+    :param product_id: id of the product.
+    :return: cache tag.
+    """
+    return f"product:{product_id}"
+
+
+def get_category_tag(category_id: UUID) -> str:
+    """
+    Build the cache tag of products of the category.
+
+    :param category_id: id of the category.
+    :return: cache tag.
+    """
+    return f"category:{category_id}"
+
+
+def get_manufacturer_tag(manufacturer_id: UUID) -> str:
+    """
+    Build the cache tag of the manufacturer.
+
+    :param manufacturer_id: id of the manufacturer.
+    :return: cache tag.
+    """
+    return f"manufacturer:{manufacturer_id}"
+
+
+def get_manufacturer_products_tag(manufacturer_id: UUID) -> str:
+    """
+    Build the cache tag of the manufacturer products, e.g. for counts in the directory.
+
+    :param manufacturer_id: id of the manufacturer.
+    :return: cache tag.
+    """
+    return f"manufacturer_products:{manufacturer_id}"
+
+
+def invalidate_product_cache(product_ids: Iterable[UUID]) -> None:
+    """
+    Invalidate cached responses of the products and lists of their categories and manufacturers.
+
+    :param product_ids: ids of changed products.
+    """
+    product_ids = list(product_ids)
+    tags = [get_product_tag(product_id) for product_id in product_ids]
+    for category_id, manufacturer_id in (
+        Product.objects.filter(pk__in=product_ids)
+        .values_list("categories_id", "manufacturer_id")
+        .distinct()
+    ):
+        tags += [get_category_tag(category_id), get_manufacturer_products_tag(manufacturer_id)]
+    invalidate_tags(tags)
+
+
+def invalidate_category_cache(category_ids: Iterable[UUID]) -> None:
+    """
+    Invalidate cached responses of the category tree and products of the categories.
+
+    :param category_ids: ids of changed categories.
+    """
+    invalidate_tags(
+        [CATEGORY_TREE_TAG] + [get_category_tag(category_id) for category_id in category_ids]
+    )
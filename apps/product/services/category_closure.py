@@ -0,0 +1,119 @@
+"""
+Functions responsible for maintaining the category closure table.
+"""
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.db import transaction
+
+from apps.product.models import Category, CategoryClosure
+
+ClosureRow = tuple[UUID, UUID, int]
+
+
+def build_closure_rows(hierarchy: Iterable[tuple[UUID, Optional[UUID]]]) -> set[ClosureRow]:
+    """
+    Compute closure rows for the given category hierarchy.
+
+    :param hierarchy: pairs of category id and its parent id.
+    :return: set of (ancestor_id, descendant_id, depth) tuples.
+    """
+    parents = dict(hierarchy)
+    rows = set()
+
+    for category_id in parents:
+        current, depth, visited = category_id, 0, set()
+        # Walk up to the root, guarding against cycles in inconsistent data.
+        while current is not None and current not in visited:
+            visited.add(current)
+            rows.add((current, category_id, depth))
+            current, depth = parents.get(current), depth + 1
+
+    return rows
+
+
+def insert_category(category: Category) -> None:
+    """
+    Add closure rows for a newly created category.
+
+    :param category: category that has just been created.
+    """
+    links = [CategoryClosure(ancestor_id=category.pk, descendant_id=category.pk, depth=0)]
+
+    if category.parent_id:
+        parent_links = CategoryClosure.objects.filter(descendant_id=category.parent_id)
+        links.extend(
+            CategoryClosure(ancestor_id=ancestor_id, descendant_id=category.pk, depth=depth + 1)
+            for ancestor_id, depth in parent_links.values_list("ancestor_id", "depth")
+        )
+
+    CategoryClosure.objects.bulk_create(links)
+
+
+@transaction.atomic
+def move_category(category: Category) -> None:
+    """
+    Relink the subtree of the category after its parent has changed.
+
+    Links between the subtree and its former ancestors are removed and links to the
+    new ancestors are created, while links inside the subtree are kept as they are.
+
+    :param category: category whose parent has changed.
+    """
+    subtree = list(
+        CategoryClosure.objects.filter(ancestor_id=category.pk).values_list(
+            "descendant_id", "depth"
+        )
+    )
+    subtree_ids = [descendant_id for descendant_id, _ in subtree]
+
+    CategoryClosure.objects.filter(descendant_id__in=subtree_ids).exclude(
+        ancestor_id__in=subtree_ids
+    ).delete()
+
+    if not category.parent_id:
+        return
+
+    parent_links = CategoryClosure.objects.filter(descendant_id=category.parent_id)
+    CategoryClosure.objects.bulk_create(
+        CategoryClosure(
+            ancestor_id=ancestor_id,
+            descendant_id=descendant_id,
+            depth=ancestor_depth + descendant_depth + 1,
+        )
+        for ancestor_id, ancestor_depth in parent_links.values_list("ancestor_id", "depth")
+        for descendant_id, descendant_depth in subtree
+    )
+
+
+@transaction.atomic
+def rebuild_category_closure() -> int:
+    """
+    Rebuild the whole closure table from the parent hierarchy.
+
+    :return: number of created closure rows.
+    """
+    rows = build_closure_rows(Category.objects.values_list("id", "parent_id"))
+
+    CategoryClosure.objects.all().delete()
+    CategoryClosure.objects.bulk_create(
+        (
+            CategoryClosure(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=depth)
+            for ancestor_id, descendant_id, depth in rows
+        ),
+        batch_size=1000,
+    )
+    return len(rows)
+
+
+def check_category_closure() -> tuple[set[ClosureRow], set[ClosureRow]]:
+    """
+    Compare the closure table with the parent hierarchy.
+
+    :return: rows missing from the closure table and rows that should not be there.
+    """
+    expected = build_closure_rows(Category.objects.values_list("id", "parent_id"))
+    actual = set(
+        CategoryClosure.objects.values_list("ancestor_id", "descendant_id", "depth").iterator()
+    )
+    return expected - actual, actual - expected
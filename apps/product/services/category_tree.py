@@ -0,0 +1,131 @@
+"""
+In-process snapshot of the category tree.
+"""
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from apps.base.cache import get_tag_version_key
+from apps.base.snapshot import VersionedSnapshot
+from apps.product.models import Category
+from apps.product.services.cache import CATEGORY_TREE_TAG
+
+# The snapshot shares the version of the cache tag, so cached category responses and
+# the snapshot are invalidated together.
+CATEGORY_TREE_VERSION_KEY = get_tag_version_key(CATEGORY_TREE_TAG)
+
+
+class CategoryNode(NamedTuple):
+    """Immutable representation of a category in the tree snapshot."""
+
+    id: UUID
+    name: str
+    slug: str
+    level: int
+    parent_id: Optional[UUID]
+
+
+@dataclass(frozen=True)
+class CategoryTree:
+    """
+    Immutable snapshot of the whole category tree.
+
+    Categories are indexed by id and by the path of slugs from the root, children are kept
+    in the default category ordering.
+    """
+
+    nodes: dict[UUID, CategoryNode] = field(default_factory=dict)
+    paths: dict[tuple[str, ...], CategoryNode] = field(default_factory=dict)
+    children: dict[Optional[UUID], tuple[CategoryNode, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, categories: list[CategoryNode]) -> "CategoryTree":
+        """
+        Build the tree from categories sorted in the default category ordering.
+
+        :param categories: list of category nodes.
+        :return: category tree.
+        """
+        nodes = {node.id: node for node in categories}
+        children = {}
+        for node in categories:
+            children.setdefault(node.parent_id, []).append(node)
+
+        paths = {}
+        stack = [((node.slug,), node) for node in reversed(children.get(None, []))]
+        while stack:
+            path, node = stack.pop()
+            # Slugs are not unique, the first category in the default ordering wins.
+            paths.setdefault(path, node)
+            stack.extend(
+                (path + (child.slug,), child) for child in reversed(children.get(node.id, []))
+            )
+
+        return cls(
+            nodes=nodes,
+            paths=paths,
+            children={parent_id: tuple(items) for parent_id, items in children.items()},
+        )
+
+    @property
+    def roots(self) -> tuple[CategoryNode, ...]:
+        """
+        Top level categories of the tree.
+        """
+        return self.children.get(None, ())
+
+    def resolve(self, *slugs: str) -> Optional[CategoryNode]:
+        """
+        Find the category by the path of slugs from the root.
+
+        :param slugs: slugs of the categories starting from the top level one.
+        :return: category node or None if the path doesn't exist.
+        """
+        return self.paths.get(slugs)
+
+    def get_children(self, category_id: UUID) -> tuple[CategoryNode, ...]:
+        """
+        Retrieve direct subcategories of the category.
+
+        :param category_id: id of the parent category.
+        :return: tuple of category nodes.
+        """
+        return self.children.get(category_id, ())
+
+    def get_path(self, category_id: UUID) -> tuple[CategoryNode, ...]:
+        """
+        Retrieve the category and its ancestors.
+
+        :param category_id: id of the category.
+        :return: tuple of category nodes starting from the top level one.
+        """
+        path = []
+        node = self.nodes.get(category_id)
+        while node is not None:
+            path.append(node)
+            node = self.nodes.get(node.parent_id)
+        return tuple(reversed(path))
+
+
+def build_category_tree() -> CategoryTree:
+    """
+    Build the category tree snapshot with a single query.
+
+    :return: category tree.
+    """
+    categories = Category.objects.order_by("level", "name", "id").values_list(
+        "id", "name", "slug", "level", "parent_id"
+    )
+    return CategoryTree.build([CategoryNode(*row) for row in categories])
+
+
+category_tree_snapshot = VersionedSnapshot(CATEGORY_TREE_VERSION_KEY, build_category_tree)
+
+
+def get_category_tree() -> CategoryTree:
+    """
+    Retrieve the current category tree snapshot of this process.
+
+    :return: category tree.
+    """
+    return category_tree_snapshot.get()
@@ -0,0 +1,139 @@
+"""
+Co-purchase index of "frequently bought together" products.
+
+Order items are streamed ordered by order, so items of an order are read together, and
+every order adds one to the count of each pair of its distinct products. Counts are kept
+in a sparse matrix of counters per product and only top neighbours of every product are
+stored. Incremental builds count only pairs with products of order items created after
+the previous build, so counts of neighbours which are not stored are lost until the next
+full rebuild.
+"""
+from collections import Counter, defaultdict
+from datetime import datetime
+from heapq import nsmallest
+from itertools import chain, combinations, groupby
+from operator import itemgetter
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.db import transaction
+
+from apps.order.models.order_item import OrderItem
+from apps.product.models import ProductCoPurchase, ProductCoPurchaseBuild
+
+DEFAULT_TOP = 20
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def count_co_purchases(rows: Iterable[tuple[UUID, UUID, bool]]) -> dict[UUID, Counter]:
+    """
+    Count orders with pairs of products.
+
+    Pairs of two previously counted products are skipped, so a pair is counted once
+    per order however its items were added.
+
+    :param rows: order id, product id and whether the item is new, ordered by order id.
+    :return: counters of orders with the product and its neighbours by product id.
+    """
+    counts = defaultdict(Counter)
+    for _, items in groupby(rows, key=itemgetter(0)):
+        new, old = set(), set()
+        for _, product_id, is_new in items:
+            (new if is_new else old).add(product_id)
+        new -= old
+        for first, second in chain(
+            combinations(new, 2), ((first, second) for first in new for second in old)
+        ):
+            counts[first][second] += 1
+            counts[second][first] += 1
+    return counts
+
+
+def get_top_neighbours(counter: Counter, top: int) -> list[tuple[UUID, int]]:
+    """
+    Select neighbours of a product with the most orders, ties are ranked by id.
+
+    :param counter: counter of orders by neighbour id.
+    :param top: number of neighbours.
+    :return: pairs of neighbour id and number of orders.
+    """
+    return nsmallest(top, counter.items(), key=lambda item: (-item[1], item[0]))
+
+
+@transaction.atomic
+def store_co_purchases(counts: dict[UUID, Counter], top: int, *, replace: bool) -> int:
+    """
+    Store top neighbours of the counted products.
+
+    :param counts: counters of orders by product id.
+    :param top: number of stored neighbours of every product.
+    :param replace: whether to replace the whole index, otherwise counts are added
+        to the stored neighbours of the counted products.
+    :return: number of stored rows.
+    """
+    if replace:
+        ProductCoPurchase.objects.all().delete()
+    else:
+        stored = ProductCoPurchase.objects.filter(product_id__in=list(counts))
+        for product_id, related_product_id, orders_count in stored.values_list(
+            "product_id", "related_product_id", "orders_count"
+        ):
+            counts[product_id][related_product_id] += orders_count
+        stored.delete()
+
+    return len(
+        ProductCoPurchase.objects.bulk_create(
+            (
+                ProductCoPurchase(
+                    product_id=product_id,
+                    related_product_id=related_product_id,
+                    orders_count=orders_count,
+                )
+                for product_id, counter in counts.items()
+                for related_product_id, orders_count in get_top_neighbours(counter, top)
+            ),
+            batch_size=1000,
+        )
+    )
+
+
+def build_co_purchases(
+    top: int = DEFAULT_TOP, *, incremental: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> tuple[int, int]:
+    """
+    Build the co-purchase index from order items.
+
+    :param top: number of stored neighbours of every product.
+    :param incremental: whether to count only order items created after the last build.
+    :param chunk_size: number of order items read from the database at once.
+    :return: number of counted products and number of stored rows.
+    """
+    last_build = ProductCoPurchaseBuild.objects.first() if incremental else None
+    since: Optional[datetime] = last_build.built_until if last_build else None
+
+    items = OrderItem.objects.order_by("order_id")
+    if since is not None:
+        items = items.filter(
+            order_id__in=OrderItem.objects.filter(created_at__gt=since).values("order_id")
+        )
+
+    built_until = since
+
+    def stream_rows():
+        nonlocal built_until
+        for order_id, product_id, created_at in items.values_list(
+            "order_id", "product_id", "created_at"
+        ).iterator(chunk_size=chunk_size):
+            is_new = since is None or created_at > since
+            if is_new and (built_until is None or created_at > built_until):
+                built_until = created_at
+            yield order_id, product_id, is_new
+
+    counts = count_co_purchases(stream_rows())
+    if since is not None and built_until == since:
+        return 0, 0
+
+    stored = store_co_purchases(counts, top, replace=since is None)
+    if built_until is not None:
+        ProductCoPurchaseBuild.objects.create(built_until=built_until, is_full=since is None)
+    return len(counts), stored
@@ -0,0 +1,244 @@
+"""
+Facet counts of product filters.
+
+Every category has an in-process facet index: products of the category are numbered and
+each filter option (manufacturer, type of characteristic, price bucket) is stored as a bitset
+of product positions, so counts for all options are computed with a few integer operations.
+Counts are disjunctive: options of a facet are counted with filters of all other facets.
+"""
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.conf import settings
+
+from apps.base.snapshot import KeyedVersionedSnapshot
+from apps.product.models import Product
+from apps.product.models.product import TypeProductCharacteristics
+
+FACETS_VERSION_KEY_PREFIX = "snapshot:product_facets"
+# Upper bounds of price buckets, the last bucket has no upper bound.
+PRICE_BUCKETS = getattr(settings, "PRODUCT_FACET_PRICE_BUCKETS", [100, 250, 500, 1000, 2500])
+
+
+def positions_to_bits(positions: Iterable[int]) -> int:
+    """
+    Build a bitset from positions of products.
+
+    :param positions: positions of products in the index.
+    :return: bitset.
+    """
+    bits = 0
+    for position in positions:
+        bits |= 1 << position
+    return bits
+
+
+@dataclass(frozen=True)
+class FacetIndex:
+    """
+    Immutable facet index of products of a single category.
+    """
+
+    product_ids: tuple[UUID, ...]
+    positions: dict[UUID, int]
+    manufacturers: dict[str, tuple[str, int]]
+    types: dict[str, tuple[str, str, int]]
+    prices: tuple[Decimal, ...]
+    price_positions: tuple[int, ...]
+    price_buckets: tuple[tuple[Decimal, Optional[Decimal], int], ...]
+
+    @property
+    def all_bits(self) -> int:
+        """
+        Bitset of all products of the index.
+        """
+        return (1 << len(self.product_ids)) - 1
+
+    @classmethod
+    def build(cls, products: Iterable[tuple], types: Iterable[tuple]) -> "FacetIndex":
+        """
+        Build the index from products and their types of characteristics.
+
+        :param products: tuples of product id, price and manufacturer brand.
+        :param types: tuples of product id, type name and characteristic name.
+        :return: facet index.
+        """
+        products = list(products)
+        positions = {product_id: position for position, (product_id, *_) in enumerate(products)}
+
+        # Filters match options case-insensitively, so options are grouped the same way.
+        manufacturer_positions = {}
+        for position, (_, _, brand) in enumerate(products):
+            manufacturer_positions.setdefault(brand.lower(), (brand, []))[1].append(position)
+
+        type_positions = {}
+        for product_id, name, characteristic in types:
+            if product_id in positions:
+                type_positions.setdefault(name.lower(), (characteristic, name, []))[2].append(
+                    positions[product_id]
+                )
+
+        priced = sorted(
+            (price, position)
+            for position, (_, price, _) in enumerate(products)
+            if price is not None
+        )
+        prices = tuple(price for price, _ in priced)
+        price_positions = tuple(position for _, position in priced)
+
+        bounds = [Decimal(0)] + [Decimal(bound) for bound in PRICE_BUCKETS] + [None]
+        price_buckets = []
+        for lower, upper in zip(bounds, bounds[1:]):
+            start = bisect_left(prices, lower)
+            end = len(prices) if upper is None else bisect_left(prices, upper)
+            price_buckets.append((lower, upper, positions_to_bits(price_positions[start:end])))
+
+        return cls(
+            product_ids=tuple(product_id for product_id, *_ in products),
+            positions=positions,
+            manufacturers={
+                key: (brand, positions_to_bits(items))
+                for key, (brand, items) in manufacturer_positions.items()
+            },
+            types={
+                key: (characteristic, name, positions_to_bits(items))
+                for key, (characteristic, name, items) in type_positions.items()
+            },
+            prices=prices,
+            price_positions=price_positions,
+            price_buckets=tuple(price_buckets),
+        )
+
+    def get_price_bits(self, min_price: Optional[Decimal], max_price: Optional[Decimal]) -> int:
+        """
+        Build the bitset of products with price in the range.
+
+        :param min_price: minimum price, inclusive.
+        :param max_price: maximum price, inclusive.
+        :return: bitset.
+        """
+        if min_price is None and max_price is None:
+            return self.all_bits
+
+        start = 0 if min_price is None else bisect_left(self.prices, min_price)
+        end = len(self.prices) if max_price is None else bisect_right(self.prices, max_price)
+        return positions_to_bits(self.price_positions[start:end])
+
+    def get_facets(
+        self,
+        *,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        manufacturer: Optional[str] = None,
+        type_characteristic: Optional[str] = None,
+        product_ids: Optional[Iterable[UUID]] = None,
+    ) -> dict:
+        """
+        Count products for every option of every facet.
+
+        :param min_price: selected minimum price.
+        :param max_price: selected maximum price.
+        :param manufacturer: selected manufacturer brand, case-insensitive.
+        :param type_characteristic: selected type of characteristic, case-insensitive.
+        :param product_ids: ids of products matching filters not covered by facets (e.g. search).
+        :return: facet counts.
+        """
+        base_bits = self.all_bits
+        if product_ids is not None:
+            base_bits = positions_to_bits(
+                self.positions[product_id]
+                for product_id in product_ids
+                if product_id in self.positions
+            )
+
+        price_bits = self.get_price_bits(min_price, max_price)
+        manufacturer_bits = base_bits
+        if manufacturer:
+            manufacturer_bits = self.manufacturers.get(manufacturer.lower(), (None, 0))[1]
+        type_bits = base_bits
+        if type_characteristic:
+            type_bits = self.types.get(type_characteristic.lower(), (None, None, 0))[2]
+
+        return {
+            "manufacturer": [
+                {"value": brand, "count": (bits & base_bits & price_bits & type_bits).bit_count()}
+                for brand, bits in sorted(self.manufacturers.values())
+            ],
+            "typeCharacteristic": [
+                {
+                    "productCharacteristics": characteristic,
+                    "value": name,
+                    "count": (bits & base_bits & price_bits & manufacturer_bits).bit_count(),
+                }
+                for characteristic, name, bits in sorted(self.types.values())
+            ],
+            "price": [
+                {
+                    # Bounds are formatted the same way as prices of products.
+                    "min": f"{lower:.2f}",
+                    "max": None if upper is None else f"{upper:.2f}",
+                    "count": (bits & base_bits & manufacturer_bits & type_bits).bit_count(),
+                }
+                for lower, upper, bits in self.price_buckets
+            ],
+        }
+
+
+def build_facet_index(category_id: UUID) -> FacetIndex:
+    """
+    Build the facet index of the category with two queries.
+
+    :param category_id: id of the category.
+    :return: facet index.
+    """
+    products = (
+        Product.objects.filter(categories_id=category_id)
+        .order_by("pk")
+        .values_list("pk", "price", "manufacturer__trade_brand")
+    )
+    types = TypeProductCharacteristics.product.through.objects.filter(
+        product__categories_id=category_id
+    ).values_list(
+        "product_id",
+        "typeproductcharacteristics__name",
+        "typeproductcharacteristics__product_characteristics__name",
+    )
+    return FacetIndex.build(products, types)
+
+
+facet_index_snapshots = KeyedVersionedSnapshot(FACETS_VERSION_KEY_PREFIX, build_facet_index)
+
+
+def get_facet_index(category_id: UUID) -> FacetIndex:
+    """
+    Retrieve the current facet index of the category.
+
+    :param category_id: id of the category.
+    :return: facet index.
+    """
+    return facet_index_snapshots.get(category_id)
+
+
+def invalidate_category_facets(category_ids: Iterable[UUID]) -> None:
+    """
+    Invalidate facet indexes of the categories.
+
+    :param category_ids: ids of the categories.
+    """
+    facet_index_snapshots.invalidate(category_ids)
+
+
+def invalidate_product_facets(product_ids: Iterable[UUID]) -> None:
+    """
+    Invalidate facet indexes of categories of the products.
+
+    :param product_ids: ids of the products.
+    """
+    invalidate_category_facets(
+        Product.objects.filter(pk__in=list(product_ids))
+        .values_list("categories_id", flat=True)
+        .distinct()
+    )
@@ -0,0 +1,208 @@
+"""
+Streamed sitemaps and product feeds of the whole catalog.
+
+Documents are generated as chunks of text from listing rows read with server-side cursors
+(`.iterator(chunk_size=...)`), so memory use doesn't depend on the catalog size. Category
+paths are taken from the category tree snapshot instead of joins per product. Sitemaps are
+split into pages of at most `SITEMAP_MAX_URLS` URLs listed by a sitemap index.
+"""
+import json
+from decimal import Decimal
+from typing import Iterator, Optional
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.urls import reverse
+
+from apps.product.models import Product, ProductListing
+from apps.product.services.category_tree import CategoryTree, get_category_tree
+
+SITEMAP_MAX_URLS = 50000
+FEED_CHUNK_SIZE = getattr(settings, "PRODUCT_FEED_CHUNK_SIZE", 2000)
+FEED_FORMATS = ("xml", "jsonl")
+# Product pages are nested in exactly three levels of categories.
+PRODUCT_CATEGORY_LEVELS = 3
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def get_feed_queryset():
+    """
+    Retrieve listing rows of products offered in feeds, in a stable order.
+
+    :return: queryset of listing rows.
+    """
+    return ProductListing.objects.exclude(
+        product__stock=Product.ProductStockChoices.WITHDRAWN_FROM_SALE
+    ).order_by("product_id")
+
+
+def iter_listing_rows(fields: list[str], start: int = 0, stop: Optional[int] = None) -> Iterator:
+    """
+    Read listing rows of feeds with a server-side cursor.
+
+    :param fields: names of the read fields.
+    :param start: number of skipped rows.
+    :param stop: position of the row after the last read one, all rows if None.
+    :return: iterator of rows as dictionaries.
+    """
+    rows = get_feed_queryset().values(*fields)[start:stop]
+    return rows.iterator(chunk_size=FEED_CHUNK_SIZE)
+
+
+def get_product_path(tree: CategoryTree, prefix: str, category_id, slug: str) -> Optional[str]:
+    """
+    Build the path of the product page.
+
+    URLs aren't reversed per product, as it is slow on large catalogs.
+
+    :param tree: category tree snapshot.
+    :param prefix: path of the category list.
+    :param category_id: id of the product category.
+    :param slug: slug of the product.
+    :return: path or None if the product is not in a lower level category.
+    """
+    categories = tree.get_path(category_id)
+    if len(categories) != PRODUCT_CATEGORY_LEVELS:
+        return None
+    return f"{prefix}{'/'.join(category.slug for category in categories)}/{slug}/"
+
+
+def get_sitemap_pages_count() -> int:
+    """
+    Count pages of the sitemap.
+
+    :return: number of pages, at least one.
+    """
+    return max(1, -(-get_feed_queryset().count() // SITEMAP_MAX_URLS))
+
+
+def iter_sitemap_index(base_url: str, page_urls: list[str]) -> Iterator[str]:
+    """
+    Generate the sitemap index.
+
+    :param base_url: scheme and host, e.g. "https://example.com".
+    :param page_urls: paths of sitemap pages.
+    :return: iterator of XML chunks.
+    """
+    yield XML_DECLARATION
+    yield f'<sitemapindex xmlns="{SITEMAP_NAMESPACE}">\n'
+    for url in page_urls:
+        yield f"<sitemap><loc>{escape(base_url + url)}</loc></sitemap>\n"
+    yield "</sitemapindex>\n"
+
+
+def iter_sitemap(base_url: str, page: int) -> Iterator[str]:
+    """
+    Generate a page of the sitemap with product pages.
+
+    :param base_url: scheme and host, e.g. "https://example.com".
+    :param page: number of the page starting from 1.
+    :return: iterator of XML chunks.
+    """
+    tree = get_category_tree()
+    prefix = reverse("product:categories-list")
+    start = (page - 1) * SITEMAP_MAX_URLS
+    rows = iter_listing_rows(
+        ["category_id", "slug", "updated_at"], start, start + SITEMAP_MAX_URLS
+    )
+
+    yield XML_DECLARATION
+    yield f'<urlset xmlns="{SITEMAP_NAMESPACE}">\n'
+    for row in rows:
+        path = get_product_path(tree, prefix, row["category_id"], row["slug"])
+        if path is not None:
+            yield (
+                f"<url><loc>{escape(base_url + path)}</loc>"
+                f"<lastmod>{row['updated_at'].date().isoformat()}</lastmod></url>\n"
+            )
+    yield "</urlset>\n"
+
+
+def iter_feed_items(base_url: str) -> Iterator[dict]:
+    """
+    Generate items of the product feed.
+
+    :param base_url: scheme and host, e.g. "https://example.com".
+    :return: iterator of items as dictionaries.
+    """
+    tree = get_category_tree()
+    prefix = reverse("product:categories-list")
+    storage = ProductListing._meta.get_field("image").storage
+    rows = iter_listing_rows(
+        [
+            "product_id",
+            "category_id",
+            "slug",
+            "name",
+            "product_code",
+            "description_short",
+            "price",
+            "price_discount",
+            "manufacturer_brand",
+            "image",
+            "available_quantity",
+        ]
+    )
+    for row in rows:
+        path = get_product_path(tree, prefix, row["category_id"], row["slug"])
+        if path is None:
+            continue
+        yield {
+            "id": str(row["product_id"]),
+            "title": row["name"],
+            "description": row["description_short"] or "",
+            "link": base_url + path,
+            "image_link": base_url + storage.url(row["image"]) if row["image"] else None,
+            "brand": row["manufacturer_brand"],
+            "mpn": row["product_code"],
+            "category": " > ".join(node.name for node in tree.get_path(row["category_id"])),
+            "price": row["price"],
+            "sale_price": row["price_discount"],
+            "availability": "in stock" if row["available_quantity"] > 0 else "out of stock",
+        }
+
+
+def format_feed_value(value) -> Optional[str]:
+    """
+    Convert a value of a feed item into a string.
+
+    :param value: value of the item.
+    :return: string or None.
+    """
+    if isinstance(value, Decimal):
+        return f"{value:.2f}"
+    return value
+
+
+def iter_product_feed(base_url: str, feed_format: str) -> Iterator[str]:
+    """
+    Generate the product feed.
+
+    :param base_url: scheme and host, e.g. "https://example.com".
+    :param feed_format: "xml" or "jsonl" (a JSON object per line).
+    :return: iterator of text chunks.
+    """
+    if feed_format not in FEED_FORMATS:
+        raise ValueError(f"Unsupported feed format: {feed_format!r}.")
+
+    if feed_format == "xml":
+        yield XML_DECLARATION
+        yield "<products>\n"
+    for item in iter_feed_items(base_url):
+        item = {name: format_feed_value(value) for name, value in item.items()}
+        if feed_format == "jsonl":
+            yield json.dumps(item, ensure_ascii=False) + "\n"
+        else:
+            yield (
+                "<product>"
+                + "".join(
+                    f"<{name}>{escape(value)}</{name}>"
+                    for name, value in item.items()
+                    if value is not None
+                )
+                + "</product>\n"
+            )
+    if feed_format == "xml":
+        yield "</products>\n"
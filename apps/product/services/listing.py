@@ -0,0 +1,183 @@
+"""
+Product listing read model.
+
+Listing rows are denormalized from products, their manufacturers, categories and types of
+characteristics, so list endpoints read a page with a single indexed query.
+"""
+from typing import Iterable
+from uuid import UUID
+
+from django.db.models import IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from apps.product.models import Category, Product, ProductListing
+from apps.product.models.product import TypeProductCharacteristics, get_types_product_prefetch
+from apps.warehouse.models import Reserve, Warehouse
+
+LISTING_FIELDS = [
+    "category",
+    "manufacturer",
+    "slug",
+    "name",
+    "product_code",
+    "description_short",
+    "price",
+    "price_discount",
+    "discount_percentage",
+    "rating",
+    "image",
+    "category_slug",
+    "manufacturer_brand",
+    "types_product",
+    "characteristics",
+    "created_at",
+]
+
+
+def build_characteristics(types_product: Iterable[TypeProductCharacteristics]) -> dict:
+    """
+    Build the map of characteristic names to names of their types.
+
+    :param types_product: types of characteristics with their characteristics loaded.
+    :return: characteristics map, e.g. {"Taste": ["Salmon"], "Weight": ["1.5 kg", "3 kg"]}.
+    """
+    characteristics = {}
+    for type_characteristic in types_product:
+        characteristics.setdefault(type_characteristic.product_characteristics.name, []).append(
+            type_characteristic.name
+        )
+    return characteristics
+
+
+def build_product_listing(product: Product) -> ProductListing:
+    """
+    Build the listing row of the product.
+
+    The product is expected to have manufacturer, category and types of characteristics
+    loaded, see `get_types_product_prefetch`.
+
+    :param product: product instance.
+    :return: unsaved listing row.
+    """
+    types_product = product.types_product.all()
+    return ProductListing(
+        product_id=product.pk,
+        category_id=product.categories_id,
+        manufacturer_id=product.manufacturer_id,
+        slug=product.slug,
+        name=product.name,
+        product_code=product.product_code,
+        description_short=product.description_short,
+        price=product.price,
+        price_discount=product.price_discount,
+        discount_percentage=product.discount_percentage,
+        rating=product.rating,
+        image=product.image.name,
+        category_slug=product.categories.slug,
+        manufacturer_brand=product.manufacturer.trade_brand,
+        types_product=[
+            {
+                "productCharacteristics": type_characteristic.product_characteristics.name,
+                "typeCharacteristic": type_characteristic.name,
+            }
+            for type_characteristic in types_product
+        ],
+        characteristics=build_characteristics(types_product),
+        created_at=product.created_at,
+    )
+
+
+def refresh_product_listings(product_ids: Iterable[UUID]) -> int:
+    """
+    Create or update listing rows of the given products.
+
+    Refreshed rows get the current update date, e.g. for last modification dates of sitemaps.
+
+    :param product_ids: ids of the products.
+    :return: number of refreshed products.
+    """
+    products = (
+        Product.objects.filter(pk__in=list(product_ids))
+        .select_related("manufacturer", "categories")
+        .prefetch_related(get_types_product_prefetch())
+    )
+    listings = [build_product_listing(product) for product in products]
+    if not listings:
+        return 0
+
+    updated_at = timezone.now()
+    for listing in listings:
+        listing.updated_at = updated_at
+    ProductListing.objects.bulk_create(
+        listings,
+        update_conflicts=True,
+        unique_fields=["product"],
+        update_fields=[*LISTING_FIELDS, "updated_at"],
+    )
+    refresh_listing_availability([listing.product_id for listing in listings])
+    return len(listings)
+
+
+def _sum_subquery(queryset, product_field: str, field: str) -> Coalesce:
+    """
+    Build a subquery of the sum of the field over rows of the product of the listing row.
+
+    :param queryset: model rows.
+    :param product_field: name of the product foreign key of the rows.
+    :param field: name of the summed field.
+    :return: expression, 0 if the product has no rows.
+    """
+    total = (
+        queryset.filter(**{product_field: OuterRef("product_id")})
+        .order_by()
+        .values(product_field)
+        .annotate(total=Sum(field))
+        .values("total")
+    )
+    return Coalesce(Subquery(total, output_field=IntegerField()), Value(0))
+
+
+def refresh_listing_availability(product_ids: Iterable[UUID]) -> int:
+    """
+    Update quantities of the products available for order in their listing rows.
+
+    The quantity is the warehouse balance less active reserves, the same as
+    `Warehouse.free_balance`, and is computed for all rows with a single UPDATE.
+
+    :param product_ids: ids of the products.
+    :return: number of updated rows.
+    """
+    balance = _sum_subquery(Warehouse.objects.all(), "product", "total_balance")
+    reserved = _sum_subquery(Reserve.objects.filter(is_active=True), "reserved_item", "quantity")
+    return ProductListing.objects.filter(product_id__in=list(product_ids)).update(
+        available_quantity=Greatest(balance - reserved, Value(0))
+    )
+
+
+def rebuild_product_listings(batch_size: int = 1000) -> int:
+    """
+    Rebuild listing rows of all products.
+
+    :param batch_size: number of products refreshed at once.
+    :return: number of refreshed products.
+    """
+    product_ids = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+    return sum(
+        refresh_product_listings(product_ids[i : i + batch_size])
+        for i in range(0, len(product_ids), batch_size)
+    )
+
+
+def update_category_listings(category: Category) -> int:
+    """
+    Update the category slug stored in listing rows of the category products.
+
+    :param category: saved category.
+    :return: number of updated rows.
+    """
+    return (
+        ProductListing.objects.filter(category=category)
+        .exclude(category_slug=category.slug)
+        .update(category_slug=category.slug)
+    )
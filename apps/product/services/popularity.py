@@ -0,0 +1,88 @@
+"""
+Popularity ranking of products by decayed sales.
+
+Every sold item adds its quantity weighted by `2 ** ((sold_at - landmark) / half_life)`
+to the score of the product. Weights of all sales shrink by the same factor as time
+passes, so ranking by the stored score equals ranking by sales decayed to the current
+moment, and a new sale only adds to the score without rescoring previous sales.
+Scores grow with time since the landmark, a float holds about 1000 half-lives, so the
+landmark should be moved forward with a rebuild long before that.
+"""
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from apps.order.models.order_item import OrderItem
+from apps.product.models import ProductListing
+
+POPULARITY_HALF_LIFE = getattr(settings, "POPULARITY_HALF_LIFE", timedelta(days=7))
+POPULARITY_LANDMARK = getattr(
+    settings, "POPULARITY_LANDMARK", datetime(2024, 1, 1, tzinfo=timezone.utc)
+)
+
+
+def get_sales_weight(sold_at: datetime) -> float:
+    """
+    Calculate the weight of a sale in popularity scores.
+
+    :param sold_at: date of the sale.
+    :return: weight, it doubles every half-life after the landmark.
+    """
+    return 2 ** ((sold_at - POPULARITY_LANDMARK) / POPULARITY_HALF_LIFE)
+
+
+def add_product_sales(product_id: UUID, quantity: int, sold_at: datetime) -> int:
+    """
+    Add sold items to the popularity score of the product, negative quantities remove them.
+
+    :param product_id: id of the product.
+    :param quantity: number of sold items.
+    :param sold_at: date of the sale.
+    :return: number of updated listing rows.
+    """
+    return ProductListing.objects.filter(product_id=product_id).update(
+        popularity=F("popularity") + quantity * get_sales_weight(sold_at)
+    )
+
+
+def calculate_popularity(sales: Iterable[tuple[UUID, int, datetime]]) -> Counter:
+    """
+    Calculate popularity scores of products.
+
+    :param sales: product id, quantity and date of sold items.
+    :return: scores by product id.
+    """
+    scores = Counter()
+    for product_id, quantity, sold_at in sales:
+        scores[product_id] += quantity * get_sales_weight(sold_at)
+    return scores
+
+
+@transaction.atomic
+def rebuild_product_popularity(chunk_size: int = 2000) -> int:
+    """
+    Recalculate popularity scores of all products from order items.
+
+    :param chunk_size: number of order items read from the database at once.
+    :return: number of products with sales.
+    """
+    scores = calculate_popularity(
+        OrderItem.objects.values_list("product_id", "quantity", "created_at").iterator(
+            chunk_size=chunk_size
+        )
+    )
+    ProductListing.objects.exclude(popularity=0).update(popularity=0)
+    ProductListing.objects.bulk_update(
+        [
+            ProductListing(product_id=product_id, popularity=score)
+            for product_id, score in scores.items()
+        ],
+        ["popularity"],
+        batch_size=1000,
+    )
+    return len(scores)
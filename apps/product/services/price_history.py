@@ -0,0 +1,116 @@
+"""
+Price history of products.
+
+Prices are appended to the history when the price or the discount of a product changes,
+a row is valid until the next row of the product. The lowest price over a period is the
+lowest promotional price of rows changed within the period and of the row valid at its
+start, so lowest prices of a whole page of products are read with a single query of
+correlated subqueries backed by the (product, changed_at) index.
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import DecimalField, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Least
+from django.utils import timezone
+
+from apps.product.models import Product, ProductPriceHistory
+
+LOWEST_PRICE_DAYS = getattr(settings, "PRODUCT_LOWEST_PRICE_DAYS", 30)
+
+
+def record_price_changes(product_ids: Iterable[UUID]) -> int:
+    """
+    Append current prices of products which differ from their last recorded prices.
+
+    :param product_ids: ids of products which may have changed.
+    :return: number of appended rows.
+    """
+    last = ProductPriceHistory.objects.filter(product=OuterRef("pk")).order_by("-changed_at")
+    products = (
+        Product.objects.filter(pk__in=list(product_ids))
+        .annotate(
+            last_price=Subquery(last.values("price")[:1]),
+            last_price_discount=Subquery(last.values("price_discount")[:1]),
+            has_history=Subquery(last.values("pk")[:1]),
+        )
+        .values_list(
+            "pk", "price", "price_discount", "last_price", "last_price_discount", "has_history"
+        )
+    )
+    changed_at = timezone.now()
+    rows = ProductPriceHistory.objects.bulk_create(
+        ProductPriceHistory(
+            product_id=pk, price=price, price_discount=price_discount, changed_at=changed_at
+        )
+        for pk, price, price_discount, last_price, last_price_discount, has_history in products
+        if has_history is None or (price, price_discount) != (last_price, last_price_discount)
+    )
+    return len(rows)
+
+
+def get_period_start(days: int) -> datetime:
+    """
+    Calculate the start of the period ending now.
+
+    :param days: length of the period in days.
+    :return: start of the period.
+    """
+    return timezone.now() - timedelta(days=days)
+
+
+def get_lowest_prices(
+    product_ids: Iterable[UUID], days: int = LOWEST_PRICE_DAYS
+) -> dict[UUID, Optional[Decimal]]:
+    """
+    Find the lowest promotional prices of products over the last days with a single query.
+
+    :param product_ids: ids of products.
+    :param days: length of the period in days.
+    :return: lowest prices by ids of products, None for products without prices.
+    """
+    since = get_period_start(days)
+    history = ProductPriceHistory.objects.filter(product=OuterRef("pk")).order_by()
+    output_field = DecimalField(max_digits=10, decimal_places=2)
+    changed = Subquery(
+        history.filter(changed_at__gte=since)
+        .values("product")
+        .annotate(lowest=Min("price_discount"))
+        .values("lowest"),
+        output_field=output_field,
+    )
+    valid_at_start = Subquery(
+        history.filter(changed_at__lt=since).order_by("-changed_at").values("price_discount")[:1],
+        output_field=output_field,
+    )
+    # LEAST propagates NULL on some databases, so missing values are replaced with the other.
+    lowest = Least(
+        Coalesce(changed, valid_at_start),
+        Coalesce(valid_at_start, changed),
+        output_field=output_field,
+    )
+    return dict(
+        Product.objects.filter(pk__in=list(product_ids))
+        .annotate(lowest_price=lowest)
+        .values_list("pk", "lowest_price")
+    )
+
+
+def get_price_history(
+    product_id: UUID, days: int = LOWEST_PRICE_DAYS
+) -> list[ProductPriceHistory]:
+    """
+    Retrieve prices of the product over the last days.
+
+    :param product_id: id of the product.
+    :param days: length of the period in days.
+    :return: rows changed within the period, preceded by the row valid at its start.
+    """
+    since = get_period_start(days)
+    history = ProductPriceHistory.objects.filter(product_id=product_id)
+    valid_at_start = history.filter(changed_at__lt=since).order_by("-changed_at").first()
+    changed = list(history.filter(changed_at__gte=since).order_by("changed_at"))
+    return [valid_at_start, *changed] if valid_at_start else changed
@@ -0,0 +1,166 @@
+"""
+Rating aggregates of products maintained from reviews.
+
+Products store the sum and the number of ratings of their reviews. Every written or deleted
+review adds its rating to them with a single `UPDATE` of F() expressions, so concurrent
+reviews of a product never lose updates and ratings are never re-aggregated from all
+reviews. The average `rating` is recalculated in the same statement from the new
+aggregates and copied to the listing row, which list endpoints read.
+"""
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Iterable
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    F,
+    FloatField,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Round
+from django.db.models.lookups import GreaterThan
+
+from apps.product.models import Product, ProductListing, ProductReview
+from apps.product.models.product import RATING_FIELDS
+from apps.product.services.cache import invalidate_product_cache
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def calculate_rating(rating_sum: int, rating_count: int) -> Decimal:
+    """
+    Calculate the average rating rounded to hundredths.
+
+    :param rating_sum: sum of ratings of reviews.
+    :param rating_count: number of reviews.
+    :return: average rating, 0 for products without reviews.
+    """
+    if not rating_count:
+        return Decimal("0.00")
+    return (Decimal(rating_sum) / rating_count).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def get_rating_expression(rating_sum, rating_count) -> Case:
+    """
+    Build the database expression of the average rating, see `calculate_rating`.
+
+    :param rating_sum: expression of the sum of ratings.
+    :param rating_count: expression of the number of reviews.
+    :return: expression.
+    """
+    # Integers are divided as floats, SQLite would truncate them.
+    average = Cast(
+        Cast(rating_sum, FloatField()) / rating_count,
+        DecimalField(max_digits=7, decimal_places=4),
+    )
+    return Case(
+        When(GreaterThan(rating_count, 0), then=Round(average, 2)),
+        default=Value(Decimal("0.00")),
+        output_field=DecimalField(max_digits=3, decimal_places=2),
+    )
+
+
+def copy_listing_ratings(product_ids: Iterable[UUID]) -> int:
+    """
+    Copy average ratings of products to their listing rows.
+
+    :param product_ids: ids of products.
+    :return: number of updated listing rows.
+    """
+    return ProductListing.objects.filter(product_id__in=list(product_ids)).update(
+        rating=Subquery(Product.objects.filter(pk=OuterRef("product_id")).values("rating")[:1])
+    )
+
+
+@transaction.atomic
+def add_product_rating(product_id: UUID, rating: int, count: int = 1) -> int:
+    """
+    Add ratings of reviews to the rating aggregates of the product.
+
+    :param product_id: id of the product.
+    :param rating: sum of added ratings, negative to remove ratings.
+    :param count: number of added reviews, negative to remove reviews.
+    :return: number of updated products.
+    """
+    rating_sum = F("rating_sum") + rating
+    rating_count = F("rating_count") + count
+    # Assignments of an UPDATE read the stored values, so the average uses new aggregates.
+    updated = Product.objects.filter(pk=product_id).update(
+        rating_sum=rating_sum,
+        rating_count=rating_count,
+        rating=get_rating_expression(rating_sum, rating_count),
+    )
+    copy_listing_ratings([product_id])
+    invalidate_product_cache([product_id])
+    return updated
+
+
+def reconcile_chunk(product_ids: list[UUID]) -> list[UUID]:
+    """
+    Recalculate rating aggregates of products from their reviews.
+
+    Products are locked while aggregates are compared, so reviews written meanwhile aren't
+    overwritten with stale aggregates.
+
+    :param product_ids: ids of products.
+    :return: ids of corrected products.
+    """
+    with transaction.atomic():
+        stored = Product.objects.select_for_update().filter(pk__in=product_ids)
+        stored = list(stored.values_list("pk", "rating", "rating_sum", "rating_count"))
+        aggregates = {
+            product_id: (rating_sum, rating_count)
+            for product_id, rating_sum, rating_count in ProductReview.objects.filter(
+                product_id__in=product_ids
+            )
+            .order_by()
+            .values("product_id")
+            .annotate(rating_sum=Sum("rating"), rating_count=Count("pk"))
+            .values_list("product_id", "rating_sum", "rating_count")
+        }
+        changed = []
+        for product_id, rating, stored_sum, stored_count in stored:
+            rating_sum, rating_count = aggregates.get(product_id, (0, 0))
+            expected = calculate_rating(rating_sum, rating_count)
+            if (rating, stored_sum, stored_count) != (expected, rating_sum, rating_count):
+                changed.append(
+                    Product(
+                        pk=product_id,
+                        rating=expected,
+                        rating_sum=rating_sum,
+                        rating_count=rating_count,
+                    )
+                )
+        Product.objects.bulk_update(changed, RATING_FIELDS)
+        copy_listing_ratings(product.pk for product in changed)
+
+    changed_ids = [product.pk for product in changed]
+    invalidate_product_cache(changed_ids)
+    return changed_ids
+
+
+def reconcile_product_ratings(chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Recalculate rating aggregates of all products from their reviews.
+
+    Products are processed in chunks ordered by id, every chunk is aggregated with a single
+    query and only products with wrong aggregates are updated. Products without reviews
+    are rated 0.
+
+    :param chunk_size: number of products processed at once.
+    :return: number of corrected products.
+    """
+    corrected = 0
+    products = Product.objects.order_by("pk").values_list("pk", flat=True)
+    chunk = list(products[:chunk_size])
+    while chunk:
+        corrected += len(reconcile_chunk(chunk))
+        chunk = list(products.filter(pk__gt=chunk[-1])[:chunk_size])
+    return corrected
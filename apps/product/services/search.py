@@ -0,0 +1,355 @@
+"""
+Product search engine.
+
+Every product has a denormalized search document (name, brand, code and characteristics).
+On PostgreSQL documents are searched with full-text search over a weighted `tsvector` and
+trigram word similarity for typos, other databases (e.g. SQLite in tests) use an in-process
+inverted index with prefix and trigram matching.
+"""
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import F, Q, QuerySet
+
+from apps.base.snapshot import VersionedSnapshot
+from apps.product.models import Product, ProductSearchDocument
+
+SEARCH_CONFIG = "simple"
+SEARCH_MAX_RESULTS = getattr(settings, "PRODUCT_SEARCH_MAX_RESULTS", 1000)
+SEARCH_INDEX_VERSION_KEY = "snapshot:product_search"
+TRIGRAM_THRESHOLD = 0.3
+
+# Relative weights of the document fields, matching tsvector weights A, A, B and C.
+FIELD_WEIGHTS = {"name": 1.0, "code": 1.0, "brand": 0.4, "characteristics": 0.2}
+PREFIX_FACTOR = 0.8
+FUZZY_FACTOR = 0.6
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into normalized lowercase tokens.
+
+    :param text: text to split.
+    :return: list of tokens.
+    """
+    return TOKEN_RE.findall(unicodedata.normalize("NFKC", text or "").lower())
+
+
+def trigrams(token: str) -> set[str]:
+    """
+    Split the token into trigrams the same way as pg_trgm does.
+
+    :param token: normalized token.
+    :return: set of trigrams.
+    """
+    padded = f"  {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def build_search_document(product: Product) -> ProductSearchDocument:
+    """
+    Build the search document of the product.
+
+    The product is expected to have manufacturer, characteristics and types of
+    characteristics loaded.
+
+    :param product: product instance.
+    :return: unsaved search document.
+    """
+    characteristics = [
+        characteristic.name for characteristic in product.product_characteristics.all()
+    ]
+    for type_characteristic in product.types_product.all():
+        characteristics.append(
+            f"{type_characteristic.product_characteristics.name} {type_characteristic.name}"
+        )
+
+    fields = {
+        "name": product.name,
+        "brand": product.manufacturer.trade_brand,
+        "code": product.product_code,
+        "characteristics": " ".join(characteristics),
+    }
+    return ProductSearchDocument(
+        product_id=product.pk,
+        document=" ".join(token for value in fields.values() for token in tokenize(value)),
+        **fields,
+    )
+
+
+def refresh_search_documents(product_ids: Iterable[UUID]) -> int:
+    """
+    Create or update search documents of the given products.
+
+    :param product_ids: ids of the products to index.
+    :return: number of indexed products.
+    """
+    products = (
+        Product.objects.filter(pk__in=list(product_ids))
+        .select_related("manufacturer")
+        .prefetch_related("product_characteristics", "types_product__product_characteristics")
+    )
+    documents = [build_search_document(product) for product in products]
+    if not documents:
+        return 0
+
+    ProductSearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["product"],
+        update_fields=["name", "brand", "code", "characteristics", "document"],
+    )
+    if connection.vendor == "postgresql":
+        ProductSearchDocument.objects.filter(
+            product_id__in=[document.product_id for document in documents]
+        ).update(search_vector=get_search_vector())
+
+    search_index_snapshot.invalidate()
+    return len(documents)
+
+
+def rebuild_search_documents(batch_size: int = 1000) -> int:
+    """
+    Rebuild search documents of all products.
+
+    :param batch_size: number of products indexed at once.
+    :return: number of indexed products.
+    """
+    product_ids = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+    return sum(
+        refresh_search_documents(product_ids[i : i + batch_size])
+        for i in range(0, len(product_ids), batch_size)
+    )
+
+
+def get_search_vector() -> SearchVector:
+    """
+    Build the weighted search vector expression of the search document.
+
+    :return: search vector expression.
+    """
+    return (
+        SearchVector("name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("code", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("brand", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("characteristics", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+class PostgresSearchBackend:
+    """
+    Search backend using PostgreSQL full-text search and trigram word similarity.
+    """
+
+    def search(
+        self, query: str, scope: Optional[QuerySet] = None, limit: int = SEARCH_MAX_RESULTS
+    ) -> list[UUID]:
+        """
+        Find products matching the query.
+
+        Every term has to match as a word prefix, or the whole query has to be similar to
+        a word sequence of the document, which tolerates typos.
+
+        :param query: search query.
+        :param scope: queryset of products to search in.
+        :param limit: maximum number of results.
+        :return: ids of matching products, most relevant first.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        ts_query = SearchQuery(
+            " & ".join(f"{term}:*" for term in terms), search_type="raw", config=SEARCH_CONFIG
+        )
+        normalized = " ".join(terms)
+        documents = ProductSearchDocument.objects.filter(
+            Q(search_vector=ts_query) | Q(document__trigram_word_similar=normalized)
+        )
+        if scope is not None:
+            documents = documents.filter(product_id__in=scope.values("pk"))
+
+        return list(
+            documents.annotate(
+                score=SearchRank(F("search_vector"), ts_query)
+                + TrigramWordSimilarity(normalized, "document")
+            )
+            .order_by("-score", "product_id")
+            .values_list("product_id", flat=True)[:limit]
+        )
+
+
+@dataclass(frozen=True)
+class InvertedIndex:
+    """
+    Immutable in-process inverted index of search documents.
+    """
+
+    postings: dict[str, dict[UUID, float]] = field(default_factory=dict)
+    vocabulary: list[str] = field(default_factory=list)
+    trigram_tokens: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, documents: Iterable[tuple]) -> "InvertedIndex":
+        """
+        Build the index from the search documents.
+
+        :param documents: tuples of product id, name, brand, code and characteristics.
+        :return: inverted index.
+        """
+        postings = defaultdict(dict)
+        for product_id, name, brand, code, characteristics in documents:
+            values = {
+                "name": name,
+                "brand": brand,
+                "code": code,
+                "characteristics": characteristics,
+            }
+            for field_name, value in values.items():
+                weight = FIELD_WEIGHTS[field_name]
+                for token in tokenize(value):
+                    if postings[token].get(product_id, 0) < weight:
+                        postings[token][product_id] = weight
+
+        trigram_tokens = defaultdict(list)
+        for token in postings:
+            for trigram in trigrams(token):
+                trigram_tokens[trigram].append(token)
+
+        return cls(
+            postings=dict(postings),
+            vocabulary=sorted(postings),
+            trigram_tokens={trigram: tuple(tokens) for trigram, tokens in trigram_tokens.items()},
+        )
+
+    def match(self, term: str) -> dict[UUID, float]:
+        """
+        Score products matching a single query term.
+
+        Exact tokens score the most, then tokens starting with the term and tokens
+        similar to the term by trigrams.
+
+        :param term: normalized query term.
+        :return: mapping of product ids to their scores.
+        """
+        candidates = {term: 1.0} if term in self.postings else {}
+
+        position = bisect_left(self.vocabulary, term)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(term):
+            candidates.setdefault(self.vocabulary[position], PREFIX_FACTOR)
+            position += 1
+
+        term_trigrams = trigrams(term)
+        shared = defaultdict(int)
+        for trigram in term_trigrams:
+            for token in self.trigram_tokens.get(trigram, ()):
+                shared[token] += 1
+        for token, count in shared.items():
+            similarity = count / (len(term_trigrams) + len(trigrams(token)) - count)
+            if similarity >= TRIGRAM_THRESHOLD:
+                candidates.setdefault(token, FUZZY_FACTOR * similarity)
+
+        scores = {}
+        for token, factor in candidates.items():
+            for product_id, weight in self.postings[token].items():
+                score = factor * weight
+                if scores.get(product_id, 0) < score:
+                    scores[product_id] = score
+        return scores
+
+
+def build_search_index() -> InvertedIndex:
+    """
+    Build the in-process inverted index from all search documents.
+
+    :return: inverted index.
+    """
+    return InvertedIndex.build(
+        ProductSearchDocument.objects.values_list(
+            "product_id", "name", "brand", "code", "characteristics"
+        ).iterator()
+    )
+
+
+search_index_snapshot = VersionedSnapshot(SEARCH_INDEX_VERSION_KEY, build_search_index)
+
+
+class InMemorySearchBackend:
+    """
+    Search backend using the in-process inverted index, used when PostgreSQL is unavailable.
+    """
+
+    def search(
+        self, query: str, scope: Optional[QuerySet] = None, limit: int = SEARCH_MAX_RESULTS
+    ) -> list[UUID]:
+        """
+        Find products matching the query.
+
+        Every term has to match a token of the document exactly, as a prefix or by trigram
+        similarity. Scores of the terms are summed up.
+
+        :param query: search query.
+        :param scope: queryset of products to search in.
+        :param limit: maximum number of results.
+        :return: ids of matching products, most relevant first.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        index = search_index_snapshot.get()
+        scores = index.match(terms[0])
+        for term in terms[1:]:
+            term_scores = index.match(term)
+            scores = {
+                product_id: score + term_scores[product_id]
+                for product_id, score in scores.items()
+                if product_id in term_scores
+            }
+
+        if scope is not None and scores:
+            allowed = set(scope.filter(pk__in=list(scores)).values_list("pk", flat=True))
+            scores = {product_id: scores[product_id] for product_id in allowed}
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], str(item[0])))
+        return [product_id for product_id, _ in ranked[:limit]]
+
+
+def get_search_backend() -> PostgresSearchBackend | InMemorySearchBackend:
+    """
+    Retrieve the search backend suitable for the database in use.
+
+    :return: search backend instance.
+    """
+    if connection.vendor == "postgresql":
+        return PostgresSearchBackend()
+    return InMemorySearchBackend()
+
+
+def search_products(
+    query: str, scope: Optional[QuerySet] = None, limit: int = SEARCH_MAX_RESULTS
+) -> list[UUID]:
+    """
+    Find products matching the query with the suitable search backend.
+
+    :param query: search query.
+    :param scope: queryset of products to search in.
+    :param limit: maximum number of results.
+    :return: ids of matching products, most relevant first.
+    """
+    return get_search_backend().search(query, scope=scope, limit=limit)
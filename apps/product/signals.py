@@ -1,12 +1,30 @@
 """
 Module to define signals for the product app.
 """
-from django.db.models.signals import pre_save, post_save, post_delete
-from django.core.cache import cache
+from django.db.models.signals import m2m_changed, pre_save, post_save, post_delete
+from django.db.models import Q
 from django.dispatch import receiver
 from django.utils.text import slugify
 
-from apps.product.models import Category, Product
+from apps.base.cache import invalidate_tags
+from apps.product.models import Category, Manufacturer, Product, ProductReview
+from apps.product.models.product import ProductCharacteristics, TypeProductCharacteristics
+from apps.product.services.autocomplete import invalidate_autocomplete
+from apps.product.services.cache import (
+    MANUFACTURER_LIST_TAG,
+    get_category_tag,
+    get_manufacturer_products_tag,
+    get_manufacturer_tag,
+    get_product_tag,
+    invalidate_category_cache,
+    invalidate_product_cache,
+)
+from apps.product.services.category_closure import insert_category, move_category
+from apps.product.services.facets import invalidate_category_facets, invalidate_product_facets
+from apps.product.services.listing import refresh_product_listings, update_category_listings
+from apps.product.services.price_history import record_price_changes
+from apps.product.services.reviews import add_product_rating
+from apps.product.services.search import refresh_search_documents
 
 
 @receiver(pre_save, sender=Category)
@@ -26,21 +44,250 @@ def generate_slug(sender, instance, **kwargs) -> None:
         instance.slug = slugify(instance.name)
 
 
+@receiver(pre_save, sender=Category)
+def remember_previous_parent(sender, instance, **kwargs) -> None:
+    """
+    Signal receiver function to remember the stored parent of a Category before saving.
+
+    The value is used after saving to detect whether the subtree has been moved.
+    """
+    if instance._state.adding:
+        return
+
+    instance._previous_parent_id = (
+        Category.objects.filter(pk=instance.pk).values_list("parent_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Category)
+def update_category_closure(sender, instance, created, raw=False, **kwargs) -> None:
+    """
+    Signal receiver function to keep the category closure table in sync with the hierarchy.
+
+    Rows of deleted categories are removed by the database cascade.
+    """
+    if raw:
+        return
+
+    if created:
+        insert_category(instance)
+    elif getattr(instance, "_previous_parent_id", None) != instance.parent_id:
+        move_category(instance)
+
+
+@receiver(post_save, sender=Category)
+def update_category_product_listings(sender, instance, raw=False, **kwargs) -> None:
+    """
+    Signal receiver function to keep the category slug of product listings up to date.
+    """
+    if not raw:
+        update_category_listings(instance)
+
+
 @receiver(post_save, sender=Category)
 @receiver(post_delete, sender=Category)
 def clear_category_cache(sender, instance, **kwargs) -> None:
     """
     Signal receiver function to update category cache when a Category instance is saved or deleted.
+
+    Paths of descendant categories contain the slug, so their product lists are invalidated too.
+    The category tree snapshot shares the version of the category tree tag.
     """
-    cache_key_pattern = "category*"
-    cache.delete_pattern(cache_key_pattern)
+    category_ids = {instance.pk}
+    if kwargs.get("signal") is post_save:
+        subtree_ids = Category.get_subtree_ids(instance.pk)
+        category_ids.update(subtree_ids.values_list("descendant_id", flat=True))
+    invalidate_category_cache(category_ids)
+    invalidate_autocomplete()
 
 
-@receiver(post_save, sender=Product)
 @receiver(post_delete, sender=Product)
 def clear_product_cache(sender, instance, **kwargs) -> None:
     """
-    Signal receiver function to clear product cache when a Product instance is saved or deleted.
+    Signal receiver function to clear product cache when a Product instance is deleted.
+
+    Saved products are handled together with their indexes.
+    """
+    invalidate_category_facets([instance.categories_id])
+    invalidate_tags(
+        [
+            get_product_tag(instance.pk),
+            get_category_tag(instance.categories_id),
+            get_manufacturer_products_tag(instance.manufacturer_id),
+        ]
+    )
+    invalidate_autocomplete()
+
+
+@receiver(post_save, sender=Manufacturer)
+@receiver(post_delete, sender=Manufacturer)
+def clear_manufacturer_cache(sender, instance, **kwargs) -> None:
+    """
+    Signal receiver function to clear manufacturer cache when a Manufacturer is saved or deleted.
+
+    The directory is sorted by brand, so any change may move manufacturers between its pages.
+    """
+    invalidate_tags([get_manufacturer_tag(instance.pk), MANUFACTURER_LIST_TAG])
+    invalidate_autocomplete()
+
+
+def update_product_indexes(product_ids) -> None:
+    """
+    Update listing rows, search and autocomplete indexes, facets and cached responses.
+
+    :param product_ids: ids of changed products.
+    """
+    product_ids = list(product_ids)
+    refresh_product_listings(product_ids)
+    refresh_search_documents(product_ids)
+    invalidate_product_facets(product_ids)
+    invalidate_product_cache(product_ids)
+    invalidate_autocomplete()
+
+
+@receiver(pre_save, sender=Product)
+def remember_previous_category(sender, instance, raw=False, **kwargs) -> None:
+    """
+    Signal receiver function to remember the stored category and manufacturer of a Product.
+
+    The values are used after saving to update indexes and cached responses of the category
+    and manufacturer the product has left.
+    """
+    if raw or instance._state.adding:
+        return
+
+    instance._previous_categories_id, instance._previous_manufacturer_id = Product.objects.filter(
+        pk=instance.pk
+    ).values_list("categories_id", "manufacturer_id").first() or (None, None)
+
+
+@receiver(post_save, sender=Product)
+def update_product_indexes_on_save(sender, instance, raw=False, **kwargs) -> None:
+    """
+    Signal receiver function to update product indexes when a Product instance is saved.
+    """
+    if raw:
+        return
+
+    update_product_indexes([instance.pk])
+    previous_categories_id = getattr(instance, "_previous_categories_id", None)
+    if previous_categories_id and previous_categories_id != instance.categories_id:
+        invalidate_category_facets([previous_categories_id])
+        invalidate_tags([get_category_tag(previous_categories_id)])
+    previous_manufacturer_id = getattr(instance, "_previous_manufacturer_id", None)
+    if previous_manufacturer_id and previous_manufacturer_id != instance.manufacturer_id:
+        invalidate_tags([get_manufacturer_products_tag(previous_manufacturer_id)])
+
+
+@receiver(post_save, sender=Product)
+def record_product_price(sender, instance, raw=False, **kwargs) -> None:
+    """
+    Signal receiver function to append changed prices of a Product to the price history.
+    """
+    if raw:
+        return
+
+    record_price_changes([instance.pk])
+
+
+@receiver(post_save, sender=Manufacturer)
+@receiver(post_save, sender=ProductCharacteristics)
+@receiver(post_save, sender=TypeProductCharacteristics)
+def update_related_product_indexes(sender, instance, raw=False, **kwargs) -> None:
+    """
+    Signal receiver function to update indexes of products related to a saved object.
+
+    The object is a manufacturer, product characteristic or type of product characteristic.
+    """
+    if raw:
+        return
+
+    if sender is Manufacturer:
+        products = instance.products.all()
+    elif sender is ProductCharacteristics:
+        # Names of characteristics are also shown next to their types.
+        products = Product.objects.filter(
+            Q(product_characteristics=instance)
+            | Q(types_product__product_characteristics=instance)
+        )
+    else:
+        products = instance.product.all()
+    update_product_indexes(products.values_list("pk", flat=True).distinct())
+
+
+@receiver(post_save, sender=ProductCharacteristics.product.through)
+@receiver(post_delete, sender=ProductCharacteristics.product.through)
+@receiver(post_save, sender=TypeProductCharacteristics.product.through)
+@receiver(post_delete, sender=TypeProductCharacteristics.product.through)
+def update_linked_product_indexes(sender, instance, raw=False, **kwargs) -> None:
+    """
+    Signal receiver function to update product indexes when a characteristic is relinked.
+
+    Handles rows of the m2m table saved or deleted directly, e.g. by admin inlines.
+    """
+    if not raw:
+        update_product_indexes([instance.product_id])
+
+
+@receiver(m2m_changed, sender=ProductCharacteristics.product.through)
+@receiver(m2m_changed, sender=TypeProductCharacteristics.product.through)
+def update_characteristics_product_indexes(
+    sender, instance, action, reverse, pk_set, **kwargs
+) -> None:
+    """
+    Signal receiver function to update product indexes when characteristics are changed.
+
+    Handles changes made via the m2m managers from both sides of the relation.
+    """
+    if reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            update_product_indexes([instance.pk])
+    elif action == "pre_clear":
+        instance._cleared_product_ids = list(instance.product.values_list("pk", flat=True))
+    elif action == "post_clear":
+        update_product_indexes(getattr(instance, "_cleared_product_ids", []))
+    elif action in ("post_add", "post_remove"):
+        update_product_indexes(pk_set)
+
+
+@receiver(pre_save, sender=ProductReview)
+def remember_previous_rating(sender, instance, raw=False, **kwargs) -> None:
+    """
+    Signal receiver function to remember the stored product and rating of a ProductReview.
+    """
+    if raw or instance._state.adding:
+        return
+
+    instance._previous_rating = (
+        ProductReview.objects.filter(pk=instance.pk).values_list("product_id", "rating").first()
+    )
+
+
+@receiver(post_save, sender=ProductReview)
+def update_rating_on_save(sender, instance, raw=False, **kwargs) -> None:
+    """
+    Signal receiver function to add the rating of a saved review to the product aggregates.
+
+    Changed reviews replace their previous rating.
+    """
+    if raw:
+        return
+
+    previous_rating = getattr(instance, "_previous_rating", None)
+    if previous_rating is not None:
+        previous_product_id, rating = previous_rating
+        if previous_product_id == instance.product_id:
+            if rating != instance.rating:
+                add_product_rating(instance.product_id, instance.rating - rating, count=0)
+            return
+        add_product_rating(previous_product_id, -rating, count=-1)
+
+    add_product_rating(instance.product_id, instance.rating)
+
+
+@receiver(post_delete, sender=ProductReview)
+def update_rating_on_delete(sender, instance, **kwargs) -> None:
+    """
+    Signal receiver function to remove the rating of a deleted review from the product aggregates.
     """
-    cache_key_pattern = "product*"
-    cache.delete_pattern(cache_key_pattern)
+    add_product_rating(instance.product_id, -instance.rating, count=-1)
@@ -0,0 +1,130 @@
+"""
+Test module for autocomplete of product names, brands and categories.
+"""
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.product.models import Manufacturer, Product, ProductListing
+from apps.product.services.autocomplete import (
+    HEAVY_PREFIX_SIZE,
+    PRODUCT,
+    AutocompleteIndex,
+    Suggestion,
+)
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class AutocompleteTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for the autocomplete endpoint and its in-process index.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.brand = Manufacturer.objects.create(
+            trade_brand="Brit", country="Czech", country_brand_registration="Czech"
+        )
+        self.salmon = self.create_product(
+            "brit-care-salmon", name="Brit Care Salmon Adult", manufacturer=self.brand
+        )
+        self.lamb = self.create_product(
+            "brit-premium-lamb", name="Brit Premium Lamb", manufacturer=self.brand
+        )
+        self.url = reverse("product:autocomplete")
+
+    def tearDown(self) -> None:
+        """Clear cached versions of the index."""
+        cache.clear()
+
+    def get_names(self, query: str, **params) -> dict:
+        """Utility method to map kinds of suggestions to their names."""
+        response = self.client.get(self.url, {"q": query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {kind: [item["name"] for item in items] for kind, items in response.data.items()}
+
+    def test_autocomplete(self):
+        """Test completing names, later words of names and every kind of suggestions."""
+        self.assertEqual(
+            self.get_names("BRIT"),
+            {
+                "products": ["Brit Care Salmon Adult", "Brit Premium Lamb"],
+                "brands": ["Brit"],
+                "categories": [],
+            },
+        )
+        self.assertEqual(self.get_names("brit  care s")["products"], ["Brit Care Salmon Adult"])
+        self.assertEqual(self.get_names("salm")["products"], ["Brit Care Salmon Adult"])
+        self.assertEqual(self.get_names("lower")["categories"], ["Lower Level Category"])
+        self.assertEqual(self.get_names("te")["brands"], ["Test Brand"])
+        self.assertEqual(self.get_names("unknown")["products"], [])
+        self.assertEqual(self.get_names("")["products"], [])
+
+        response = self.client.get(self.url, {"q": "brit care"})
+        self.assertEqual(response.data["products"][0]["slug"], "brit-care-salmon")
+        self.assertEqual(response.data["products"][0]["id"], str(self.salmon.pk))
+
+    def test_autocomplete_ranking(self):
+        """Test that names starting with the prefix and popular products are ranked first."""
+        self.create_product("salmon-oil", name="Salmon Oil", manufacturer=self.brand)
+        ProductListing.objects.filter(pk=self.lamb.pk).update(popularity=10)
+        cache.clear()
+
+        self.assertEqual(
+            self.get_names("salmon")["products"], ["Salmon Oil", "Brit Care Salmon Adult"]
+        )
+        self.assertEqual(
+            self.get_names("b")["products"],
+            ["Brit Premium Lamb", "Brit Care Salmon Adult"],
+        )
+        self.assertEqual(self.get_names("b", limit=1)["products"], ["Brit Premium Lamb"])
+        self.assertEqual(self.get_names("brit", limit=1)["products"], ["Brit Premium Lamb"])
+
+        response = self.client.get(self.url, {"q": "brit", "limit": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_autocomplete_index_refresh(self):
+        """Test that the index is read without queries and refreshed on catalog changes."""
+        self.get_names("brit")
+        with self.assertNumQueries(0):
+            self.get_names("brit")
+
+        self.create_product("brit-fresh-beef", name="Brit Fresh Beef", manufacturer=self.brand)
+        self.assertIn("Brit Fresh Beef", self.get_names("brit fr")["products"])
+
+        self.lamb.stock = Product.ProductStockChoices.WITHDRAWN_FROM_SALE
+        self.lamb.save()
+        self.assertNotIn("Brit Premium Lamb", self.get_names("brit")["products"])
+
+        self.brand.trade_brand = "Brit Care"
+        self.brand.save()
+        self.assertEqual(self.get_names("brit c")["brands"], ["Brit Care"])
+
+    def test_heavy_prefixes(self):
+        """Test that ranked results of heavy prefixes equal results of ranking all matches."""
+        index = AutocompleteIndex.build(
+            Suggestion(PRODUCT, uuid4(), f"Food {'dry' if i % 2 else 'wet'} {i}", None, i % 7)
+            for i in range(HEAVY_PREFIX_SIZE * 3)
+        )
+        self.assertIn("food", index.heavy_prefixes)
+        self.assertIn("food d", index.heavy_prefixes)
+        self.assertNotIn("food dry 1", index.heavy_prefixes)
+
+        for query in ("f", "food", "food d", "food dry 1", "dry"):
+            matches = [
+                posting
+                for key, posting in zip(index.keys, index.postings)
+                if key.startswith(query)
+            ]
+            expected = index.rank(matches, 5)[PRODUCT]
+            self.assertEqual(
+                index.complete(query, 5)[PRODUCT],
+                [index.suggestions[position] for position in expected],
+            )
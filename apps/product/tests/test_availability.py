@@ -0,0 +1,110 @@
+"""
+Test module for stock availability of products in listings.
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.order.models.order import Order
+from apps.product.models import Product, ProductListing
+from apps.product.tests.test_product import ProductSetupMixin
+from apps.warehouse.models import Reserve, Warehouse
+
+
+class ProductAvailabilityTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for available quantities maintained from warehouse balances and reserves.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.other_product = Product.objects.create(
+            name="Other Product",
+            slug="other-product",
+            price=200,
+            product_code="OTHER1",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="product/default.jpg",
+        )
+        self.order = Order.objects.create(order_number="1001", status=Order.OrderStatusChoices.NEW)
+
+        self.warehouse = Warehouse.objects.get(product=self.product)
+        self.warehouse.total_balance = 10
+        self.warehouse.save()
+
+        self.url = reverse(
+            "product:product-list-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+            },
+        )
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def get_available(self, response) -> dict:
+        """Utility method to map slugs of listed products to their availability."""
+        return {
+            product["slug"]: (product["availableQuantity"], product["inStock"])
+            for product in response.data["results"]
+        }
+
+    def test_available_quantity(self):
+        """Test that the available quantity is the balance less active reserves."""
+        reserve = Reserve.objects.create(order=self.order, reserved_item=self.product, quantity=4)
+        self.assertEqual(ProductListing.objects.get(pk=self.product.pk).available_quantity, 6)
+        self.assertEqual(self.warehouse.free_balance, 6)
+
+        reserve.quantity = 12
+        reserve.save()
+        self.assertEqual(ProductListing.objects.get(pk=self.product.pk).available_quantity, 0)
+
+        reserve.is_active = False
+        reserve.save()
+        self.assertEqual(ProductListing.objects.get(pk=self.product.pk).available_quantity, 10)
+
+        # Saving the product rebuilds its listing row without losing the availability.
+        self.product.price = 150
+        self.product.save()
+        self.assertEqual(ProductListing.objects.get(pk=self.product.pk).available_quantity, 10)
+
+    def test_list_availability(self):
+        """Test that listed products carry their availability and can be filtered by it."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.get_available(response),
+            {"test-product": (10, True), "other-product": (0, False)},
+        )
+
+        response = self.client.get(self.url, {"in_stock_only": "true"})
+        self.assertEqual(self.get_available(response), {"test-product": (10, True)})
+
+        Reserve.objects.create(order=self.order, reserved_item=self.product, quantity=10)
+        response = self.client.get(self.url, {"in_stock_only": "true"})
+        self.assertEqual(self.get_available(response), {})
+
+    def test_detail_availability(self):
+        """Test that the product detail carries its availability."""
+        url = reverse(
+            "product:product-detail-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+                "product_slug": self.product.slug,
+            },
+        )
+        response = self.client.get(url)
+
+        self.assertEqual(response.data["availableQuantity"], 10)
+        self.assertTrue(response.data["inStock"])
@@ -0,0 +1,119 @@
+"""
+Test module for tag-based invalidation of cached product responses.
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.base.cache import get_tag_versions, get_tagged, invalidate_tags, set_tagged
+from apps.product.models import Category, Product
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class ProductCacheTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for tagged cache entries of product and category endpoints.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.other_category = Category.objects.create(
+            name="Other Lower Category", parent=self.medium_level_category, level=2
+        )
+        self.other_product = Product.objects.create(
+            name="Other Product",
+            slug="other-product",
+            price=200,
+            product_code="OTHER1",
+            manufacturer=self.manufacturer,
+            categories=self.other_category,
+            image="product/default.jpg",
+        )
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def get_list_url(self, category: Category) -> str:
+        """Utility method to build the product list url of a lower level category."""
+        return reverse(
+            "product:product-list-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": category.slug,
+            },
+        )
+
+    def get_detail_url(self, product: Product) -> str:
+        """Utility method to build the product detail url."""
+        return reverse(
+            "product:product-detail-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": product.categories.slug,
+                "product_slug": product.slug,
+            },
+        )
+
+    def test_tagged_entry(self):
+        """Test that an entry is stale once any of its tags is invalidated."""
+        set_tagged("key", {"value": 1}, get_tag_versions(["first", "second"]))
+        self.assertEqual(get_tagged("key"), {"value": 1})
+
+        invalidate_tags(["other"])
+        self.assertEqual(get_tagged("key"), {"value": 1})
+
+        invalidate_tags(["second"])
+        self.assertIsNone(get_tagged("key"))
+
+        cache.set("plain", {"value": 1})
+        self.assertIsNone(get_tagged("plain"))
+
+    def test_product_change_keeps_unrelated_pages(self):
+        """Test that saving a product invalidates only responses built from it."""
+        for url in (
+            self.get_list_url(self.lower_level_category),
+            self.get_list_url(self.other_category),
+            self.get_detail_url(self.product),
+            self.get_detail_url(self.other_product),
+        ):
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        self.product.price = 150
+        self.product.save()
+
+        with self.assertNumQueries(0):
+            self.client.get(self.get_list_url(self.other_category))
+            self.client.get(self.get_detail_url(self.other_product))
+
+        response = self.client.get(self.get_list_url(self.lower_level_category))
+        self.assertEqual(response.data["results"][0]["price"], "150.00")
+        response = self.client.get(self.get_detail_url(self.product))
+        self.assertEqual(response.data["price"], "150.00")
+
+    def test_related_changes_invalidate_responses(self):
+        """Test that manufacturer and category changes invalidate cached responses."""
+        detail_url = self.get_detail_url(self.other_product)
+        self.client.get(detail_url)
+        self.client.get(reverse("product:categories-list"))
+
+        self.manufacturer.trade_brand = "Brit"
+        self.manufacturer.save()
+        response = self.client.get(detail_url)
+        self.assertEqual(response.data["manufacturer"]["trade_brand"], "Brit")
+
+        self.other_category.name = "Renamed Category"
+        self.other_category.slug = "renamed-category"
+        self.other_category.save()
+        self.assertEqual(self.client.get(detail_url).status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(self.get_detail_url(self.other_product))
+        self.assertEqual(response.data["categories"], "renamed-category")
+        response = self.client.get(reverse("product:categories-list"))
+        self.assertIn("Renamed Category", str(response.data))
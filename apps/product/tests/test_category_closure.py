@@ -0,0 +1,108 @@
+"""
+Test module for the category closure table.
+"""
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from apps.product.models import Category, CategoryClosure
+from apps.product.services.category_closure import check_category_closure
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class CategoryClosureTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for the category closure table, its maintenance and hierarchy lookups.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+    def assert_closure_consistent(self):
+        """Utility method to assert the closure table matches the parent hierarchy."""
+        self.assertEqual(check_category_closure(), (set(), set()))
+
+    def test_closure_rows_on_create(self):
+        """Test closure rows are created for new categories."""
+        self.assertEqual(CategoryClosure.objects.count(), 6)
+        self.assertEqual(
+            CategoryClosure.objects.get(
+                ancestor=self.top_level_category, descendant=self.lower_level_category
+            ).depth,
+            2,
+        )
+        self.assert_closure_consistent()
+
+    def test_get_descendants(self):
+        """Test retrieving descendants of a category with a single query."""
+        with self.assertNumQueries(1):
+            descendants = list(self.top_level_category.get_descendants())
+
+        self.assertCountEqual(descendants, [self.medium_level_category, self.lower_level_category])
+        self.assertFalse(self.lower_level_category.get_descendants().exists())
+
+    def test_get_ancestors(self):
+        """Test retrieving ancestors of a category, nearest parent first."""
+        with self.assertNumQueries(1):
+            ancestors = list(self.lower_level_category.get_ancestors())
+
+        self.assertEqual(ancestors, [self.medium_level_category, self.top_level_category])
+        self.assertFalse(self.top_level_category.get_ancestors().exists())
+
+    def test_get_products(self):
+        """Test retrieving products of the whole subtree of a category."""
+        self.assertEqual(list(self.top_level_category.get_products()), [self.product])
+        self.assertEqual(list(self.lower_level_category.get_products()), [self.product])
+
+        other_root = Category.objects.create(name="Other Category", level=0)
+        self.assertFalse(other_root.get_products().exists())
+
+    def test_move_subtree(self):
+        """Test moving a category relinks its whole subtree."""
+        other_root = Category.objects.create(name="Other Category", level=0)
+
+        self.medium_level_category.parent = other_root
+        self.medium_level_category.save()
+
+        self.assert_closure_consistent()
+        self.assertEqual(
+            list(self.lower_level_category.get_ancestors()),
+            [self.medium_level_category, other_root],
+        )
+        self.assertFalse(self.top_level_category.get_descendants().exists())
+        self.assertEqual(list(other_root.get_products()), [self.product])
+
+    def test_update_without_move(self):
+        """Test updating a category without changing its parent keeps the closure rows."""
+        self.lower_level_category.name = "Updated Lower Level Category"
+        self.lower_level_category.save()
+
+        self.assertEqual(CategoryClosure.objects.count(), 6)
+        self.assert_closure_consistent()
+
+    def test_delete_category(self):
+        """Test deleting a category removes closure rows of its subtree."""
+        self.medium_level_category.delete()
+
+        self.assertEqual(CategoryClosure.objects.count(), 1)
+        self.assert_closure_consistent()
+
+    def test_check_and_rebuild_commands(self):
+        """Test the check command detects inconsistencies and the rebuild command fixes them."""
+        call_command("check_category_closure", stdout=StringIO())
+
+        CategoryClosure.objects.filter(depth=2).delete()
+        with self.assertRaises(CommandError):
+            call_command("check_category_closure", stdout=StringIO())
+
+        call_command("rebuild_category_closure", stdout=StringIO())
+        self.assert_closure_consistent()
+
+        CategoryClosure.objects.filter(depth=0).delete()
+        call_command("check_category_closure", "--fix", stdout=StringIO())
+        self.assert_closure_consistent()
@@ -0,0 +1,116 @@
+"""
+Test module for the in-process category tree snapshot.
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.product.models import Category
+from apps.product.services.category_tree import get_category_tree
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class CategoryTreeTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for the category tree snapshot and slug path resolution.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+    def test_resolve_paths(self):
+        """Test resolving categories by the path of slugs from the root."""
+        tree = get_category_tree()
+
+        node = tree.resolve("top-level-category", "medium-level-category", "lower-level-category")
+        self.assertEqual(node.id, self.lower_level_category.id)
+        self.assertEqual(node.parent_id, self.medium_level_category.id)
+        self.assertEqual(node.level, 2)
+        self.assertEqual(tree.resolve("top-level-category").id, self.top_level_category.id)
+
+        self.assertIsNone(tree.resolve("medium-level-category"))
+        self.assertIsNone(tree.resolve("top-level-category", "lower-level-category"))
+
+    def test_warm_snapshot_does_not_query_database(self):
+        """Test that resolving categories from a warm snapshot doesn't hit the database."""
+        get_category_tree()
+
+        with self.assertNumQueries(0):
+            node = get_category_tree().resolve("top-level-category", "medium-level-category")
+
+        self.assertEqual(node.id, self.medium_level_category.id)
+
+    def test_snapshot_refreshed_on_category_change(self):
+        """Test that the snapshot is rebuilt after categories are changed."""
+        get_category_tree()
+
+        category = Category.objects.create(
+            name="New Medium Category", parent=self.top_level_category, level=1
+        )
+        self.assertEqual(
+            get_category_tree().resolve("top-level-category", "new-medium-category").id,
+            category.id,
+        )
+
+        category.slug = "renamed-medium-category"
+        category.save()
+        tree = get_category_tree()
+        self.assertIsNone(tree.resolve("top-level-category", "new-medium-category"))
+        self.assertEqual(
+            tree.resolve("top-level-category", "renamed-medium-category").id, category.id
+        )
+
+        category.delete()
+        self.assertIsNone(
+            get_category_tree().resolve("top-level-category", "renamed-medium-category")
+        )
+
+    def test_children_ordering(self):
+        """Test that children of a category follow the default category ordering."""
+        Category.objects.create(name="A Medium Category", parent=self.top_level_category, level=1)
+
+        names = [
+            node.name for node in get_category_tree().get_children(self.top_level_category.id)
+        ]
+
+        self.assertEqual(names, ["A Medium Category", "Medium Level Category"])
+        self.assertEqual(
+            [node.id for node in get_category_tree().roots], [self.top_level_category.id]
+        )
+
+    def get_category_list_queries(self) -> int:
+        """Utility method to count queries of the category list endpoint with a cold cache."""
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("product:categories-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def test_category_list_constant_queries(self):
+        """Test that the category list makes the same number of queries for any tree size."""
+        initial_queries = self.get_category_list_queries()
+
+        for i in range(5):
+            top = Category.objects.create(name=f"Top {i}", level=0)
+            for j in range(3):
+                medium = Category.objects.create(name=f"Medium {i}-{j}", parent=top, level=1)
+                for k in range(3):
+                    Category.objects.create(name=f"Lower {i}-{j}-{k}", parent=medium, level=2)
+
+        self.assertEqual(self.get_category_list_queries(), initial_queries)
+
+        response = self.client.get(reverse("product:categories-list"))
+        top = response.data["results"][0]
+        self.assertEqual(top["name"], "Top 0")
+        self.assertEqual(len(top["subcategories"]), 3)
+        self.assertEqual(
+            [category["name"] for category in top["subcategories"][0]["subcategories"]],
+            ["Lower 0-0-0", "Lower 0-0-1", "Lower 0-0-2"],
+        )
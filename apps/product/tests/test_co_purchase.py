@@ -0,0 +1,117 @@
+"""
+Test module for the "frequently bought together" index of products.
+"""
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.order.models.order import Order
+from apps.order.models.order_item import OrderItem
+from apps.product.models import Product, ProductCoPurchase
+from apps.product.services.co_purchase import build_co_purchases
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class ProductCoPurchaseTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for building the co-purchase index and reading it by the endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.second_product = self.create_product("second-product")
+        self.third_product = self.create_product("third-product")
+        self.orders = []
+
+        # Pairs: product-second in 2 orders, product-third in 3 orders, second-third in 1.
+        self.create_order(self.product, self.second_product)
+        self.create_order(self.product, self.second_product, self.third_product)
+        self.create_order(self.product, self.third_product, self.third_product)
+        self.create_order(self.third_product, self.product)
+
+    def create_order(self, *products: Product) -> Order:
+        """Utility method to create an order with items of the products."""
+        order = Order.objects.create(order_number=1000 + len(self.orders))
+        self.orders.append(order)
+        for product in products:
+            self.create_order_item(order, product)
+        return order
+
+    def create_order_item(self, order: Order, product: Product) -> OrderItem:
+        """Utility method to add an item of the product to the order."""
+        return OrderItem.objects.create(order=order, product=product, price=product.price)
+
+    def get_counts(self) -> dict:
+        """Utility method to map pairs of product slugs to stored numbers of orders."""
+        return {
+            (row.product.slug, row.related_product.slug): row.orders_count
+            for row in ProductCoPurchase.objects.select_related("product", "related_product")
+        }
+
+    def test_build_co_purchases(self):
+        """Test that orders with both products are counted once per order."""
+        output = StringIO()
+        call_command("build_co_purchases", stdout=output)
+
+        self.assertIn("3 products, 6 neighbours stored", output.getvalue())
+        self.assertEqual(
+            self.get_counts(),
+            {
+                ("test-product", "second-product"): 2,
+                ("second-product", "test-product"): 2,
+                ("test-product", "third-product"): 3,
+                ("third-product", "test-product"): 3,
+                ("second-product", "third-product"): 1,
+                ("third-product", "second-product"): 1,
+            },
+        )
+
+        build_co_purchases(top=1)
+        self.assertEqual(
+            self.get_counts(),
+            {
+                ("test-product", "third-product"): 3,
+                ("second-product", "test-product"): 2,
+                ("third-product", "test-product"): 3,
+            },
+        )
+
+    def test_build_co_purchases_incremental(self):
+        """Test that incremental builds add pairs of new order items only."""
+        build_co_purchases()
+        self.assertEqual(build_co_purchases(incremental=True), (0, 0))
+
+        self.create_order(self.second_product, self.third_product)
+        self.create_order_item(self.orders[0], self.third_product)
+        self.create_order_item(self.orders[1], self.second_product)
+        build_co_purchases(incremental=True)
+
+        counts = self.get_counts()
+        self.assertEqual(counts[("test-product", "third-product")], 4)
+        self.assertEqual(counts[("test-product", "second-product")], 2)
+        self.assertEqual(counts[("second-product", "third-product")], 3)
+        self.assertEqual(counts[("third-product", "second-product")], 3)
+
+        build_co_purchases()
+        self.assertEqual(self.get_counts(), counts)
+
+    def test_bought_together_list(self):
+        """Test that neighbours are listed by the number of orders with both products."""
+        build_co_purchases()
+        url = reverse("product:product-bought-together", kwargs={"product_id": self.product.pk})
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [product["slug"] for product in response.data], ["third-product", "second-product"]
+        )
+        self.assertEqual(response.data[0]["id"], str(self.third_product.pk))
@@ -0,0 +1,161 @@
+"""
+Test module for facet counts of product filters.
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.product.models import Manufacturer, Product
+from apps.product.models.product import ProductCharacteristics, TypeProductCharacteristics
+from apps.product.services.facets import get_facet_index
+from apps.product.tests.test_product import ProductSetupMixin
+from apps.warehouse.models import Warehouse
+
+
+class ProductFacetsTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for the facet index and facets section of the category product list.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.other_manufacturer = Manufacturer.objects.create(
+            trade_brand="Brit", country="Czech", country_brand_registration="Czech"
+        )
+        taste = ProductCharacteristics.objects.create(name="Taste")
+        self.salmon = TypeProductCharacteristics.objects.create(
+            name="Salmon", product_characteristics=taste
+        )
+        self.chicken = TypeProductCharacteristics.objects.create(
+            name="Chicken", product_characteristics=taste
+        )
+
+        self.brit_salmon = self.create_product(
+            "brit-salmon", name="Brit Salmon", price=80, manufacturer=self.other_manufacturer
+        )
+        self.brit_chicken = self.create_product(
+            "brit-chicken", name="Brit Chicken", price=300, manufacturer=self.other_manufacturer
+        )
+        self.test_salmon = self.create_product("test-salmon", name="Test Salmon", price=3000)
+        self.salmon.product.add(self.brit_salmon, self.test_salmon)
+        self.chicken.product.add(self.brit_chicken)
+
+        self.url = reverse(
+            "product:product-list-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+            },
+        )
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def get_facets(self, **params) -> dict:
+        """Utility method to request facets of the category product list."""
+        response = self.client.get(self.url, {"facets": "true", **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["facets"]
+
+    @staticmethod
+    def counts(options: list[dict]) -> dict:
+        """Utility method to map facet options to their counts."""
+        return {option["value"]: option["count"] for option in options}
+
+    def test_facets_without_filters(self):
+        """Test counts of all options when nothing is selected."""
+        facets = self.get_facets()
+
+        self.assertEqual(self.counts(facets["manufacturer"]), {"Brit": 2, "Test Brand": 2})
+        self.assertEqual(self.counts(facets["typeCharacteristic"]), {"Chicken": 1, "Salmon": 2})
+        self.assertEqual(facets["typeCharacteristic"][0]["productCharacteristics"], "Taste")
+        self.assertEqual(
+            [(bucket["min"], bucket["max"], bucket["count"]) for bucket in facets["price"]],
+            [
+                ("0.00", "100.00", 1),
+                ("100.00", "250.00", 1),
+                ("250.00", "500.00", 1),
+                ("500.00", "1000.00", 0),
+                ("1000.00", "2500.00", 0),
+                ("2500.00", None, 1),
+            ],
+        )
+
+    def test_facets_are_disjunctive(self):
+        """Test that options of a facet are counted without its own selection."""
+        facets = self.get_facets(manufacturer="brit", type_characteristic="salmon")
+
+        self.assertEqual(self.counts(facets["manufacturer"]), {"Brit": 1, "Test Brand": 1})
+        self.assertEqual(self.counts(facets["typeCharacteristic"]), {"Chicken": 1, "Salmon": 1})
+        self.assertEqual(sum(bucket["count"] for bucket in facets["price"]), 1)
+
+        facets = self.get_facets(min_price=200, max_price=500)
+        self.assertEqual(self.counts(facets["manufacturer"]), {"Brit": 1, "Test Brand": 0})
+
+    def test_facets_with_search(self):
+        """Test that facets count only products matching the search query."""
+        facets = self.get_facets(search="salmon")
+
+        self.assertEqual(self.counts(facets["manufacturer"]), {"Brit": 1, "Test Brand": 1})
+        self.assertEqual(self.counts(facets["typeCharacteristic"]), {"Chicken": 0, "Salmon": 2})
+
+    def test_facets_in_stock_only(self):
+        """Test that facets count only available products when they are requested."""
+        warehouse = Warehouse.objects.get(product=self.brit_salmon)
+        warehouse.total_balance = 5
+        warehouse.save()
+
+        facets = self.get_facets(in_stock_only="true")
+        self.assertEqual(self.counts(facets["manufacturer"]), {"Brit": 1, "Test Brand": 0})
+        self.assertEqual(self.counts(facets["typeCharacteristic"]), {"Chicken": 0, "Salmon": 1})
+
+    def test_facets_with_discounted_price(self):
+        """Test that facets count only products with discounted prices in the range."""
+        facets = self.get_facets(max_price_discount=100)
+        self.assertEqual(self.counts(facets["manufacturer"]), {"Brit": 1, "Test Brand": 1})
+
+        facets = self.get_facets(min_price_discount=200, max_price_discount=500)
+        self.assertEqual(self.counts(facets["manufacturer"]), {"Brit": 1, "Test Brand": 0})
+        self.assertEqual(self.counts(facets["typeCharacteristic"]), {"Chicken": 1, "Salmon": 0})
+
+    def test_facets_not_requested(self):
+        """Test that facets are returned only on request."""
+        response = self.client.get(self.url)
+
+        self.assertNotIn("facets", response.data)
+
+    def test_index_updated_on_changes(self):
+        """Test that the facet index follows product and characteristic changes."""
+        get_facet_index(self.lower_level_category.id)
+        with self.assertNumQueries(0):
+            get_facet_index(self.lower_level_category.id)
+
+        self.brit_chicken.price = 50
+        self.brit_chicken.save()
+        self.chicken.product.add(self.test_salmon)
+
+        index = get_facet_index(self.lower_level_category.id)
+        facets = index.get_facets()
+        self.assertEqual(facets["price"][0]["count"], 2)
+        self.assertEqual(self.counts(facets["typeCharacteristic"]), {"Chicken": 2, "Salmon": 2})
+
+        self.brit_chicken.categories = self.medium_level_category
+        self.brit_chicken.save()
+        facets = get_facet_index(self.lower_level_category.id).get_facets()
+        self.assertEqual(self.counts(facets["manufacturer"]), {"Brit": 1, "Test Brand": 2})
+
+    def test_index_updated_on_delete(self):
+        """Test that deleted products aren't counted, also when deleted with a bulk query."""
+        self.get_facets()
+        Product.objects.filter(pk=self.brit_chicken.pk).delete()
+
+        facets = self.get_facets()
+        self.assertEqual(self.counts(facets["manufacturer"]), {"Brit": 1, "Test Brand": 2})
+        self.assertEqual(facets["price"][2]["count"], 0)
@@ -0,0 +1,169 @@
+"""
+Test module for sitemaps and product feeds.
+"""
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime, timezone as tz
+from io import StringIO
+from unittest import mock
+from xml.etree import ElementTree
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.product.models import Product
+from apps.product.tests.test_product import ProductSetupMixin
+
+SITEMAP = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+class FeedsTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for streamed sitemaps and product feeds.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.other_product = Product.objects.create(
+            name="Other <Product> & Co",
+            slug="other-product",
+            price=200,
+            product_code="OTHER1",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="product/default.jpg",
+        )
+        Product.objects.create(
+            name="Withdrawn Product",
+            slug="withdrawn-product",
+            price=300,
+            product_code="WITHDRAWN1",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="product/default.jpg",
+            stock=Product.ProductStockChoices.WITHDRAWN_FROM_SALE,
+        )
+        self.product_url = "http://testserver" + reverse(
+            "product:product-detail-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+                "product_slug": self.product.slug,
+            },
+        )
+
+    def tearDown(self) -> None:
+        """Clear the cached category tree."""
+        cache.clear()
+
+    def get_content(self, url: str) -> bytes:
+        """Utility method to read a streamed response."""
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content)
+
+    def get_locations(self, content: bytes) -> list[str]:
+        """Utility method to list locations of a sitemap or a sitemap index."""
+        return [node.text for node in ElementTree.fromstring(content).iter(f"{SITEMAP}loc")]
+
+    def test_sitemap(self):
+        """Test that the sitemap lists pages of offered products."""
+        index = self.get_locations(self.get_content(reverse("product:sitemap-index")))
+        self.assertEqual(index, ["http://testserver" + reverse("product:sitemap-page", args=[1])])
+
+        locations = self.get_locations(self.get_content(index[0]))
+        self.assertEqual(len(locations), 2)
+        self.assertIn(self.product_url, locations)
+
+        response = self.client.get(reverse("product:sitemap-page", args=[2]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_sitemap_lastmod(self):
+        """Test that the last modification date is the last update of the listed product."""
+        Product.objects.filter(pk=self.product.pk).update(
+            created_at=datetime(2020, 1, 1, tzinfo=tz.utc)
+        )
+        self.product.refresh_from_db()
+        self.product.price = 150
+        self.product.save()
+
+        content = self.get_content(reverse("product:sitemap-page", args=[1]))
+        lastmods = {
+            node.findtext(f"{SITEMAP}loc"): node.findtext(f"{SITEMAP}lastmod")
+            for node in ElementTree.fromstring(content).iter(f"{SITEMAP}url")
+        }
+        self.assertEqual(lastmods[self.product_url], timezone.now().date().isoformat())
+
+    @mock.patch("apps.product.services.feeds.SITEMAP_MAX_URLS", 1)
+    def test_sitemap_split(self):
+        """Test that the sitemap is split into pages listed by the index."""
+        index = self.get_locations(self.get_content(reverse("product:sitemap-index")))
+        self.assertEqual(len(index), 2)
+
+        locations = [self.get_locations(self.get_content(url)) for url in index]
+        self.assertEqual([len(page) for page in locations], [1, 1])
+        self.assertIn(self.product_url, locations[0] + locations[1])
+
+    def test_product_feed(self):
+        """Test that XML and JSON Lines feeds list offered products."""
+        items = [
+            json.loads(line)
+            for line in self.get_content(
+                reverse("product:product-feed", args=["jsonl"])
+            ).splitlines()
+        ]
+        item = next(item for item in items if item["id"] == str(self.product.pk))
+        self.assertEqual(len(items), 2)
+        self.assertEqual(item["link"], self.product_url)
+        self.assertEqual(item["price"], "100.00")
+        self.assertEqual(item["brand"], "Test Brand")
+        self.assertEqual(
+            item["category"], "Top Level Category > Medium Level Category > Lower Level Category"
+        )
+
+        products = ElementTree.fromstring(
+            self.get_content(reverse("product:product-feed", args=["xml"]))
+        )
+        self.assertEqual(
+            sorted(product.findtext("title") for product in products),
+            ["Other <Product> & Co", "Test Product"],
+        )
+
+        response = self.client.get(reverse("product:product-feed", args=["csv"]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_generate_feeds(self):
+        """Test that the command writes gzipped documents equal to the streamed ones."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            call_command(
+                "generate_feeds",
+                output_dir=output_dir,
+                base_url="http://testserver/",
+                stdout=StringIO(),
+            )
+            self.assertEqual(
+                sorted(os.listdir(output_dir)),
+                ["feed.jsonl.gz", "feed.xml.gz", "sitemap-1.xml.gz", "sitemap.xml.gz"],
+            )
+            with gzip.open(os.path.join(output_dir, "sitemap-1.xml.gz")) as file:
+                self.assertEqual(
+                    file.read(),
+                    self.get_content(reverse("product:sitemap-page", args=[1])),
+                )
+            with gzip.open(os.path.join(output_dir, "sitemap.xml.gz")) as file:
+                self.assertEqual(
+                    self.get_locations(file.read()),
+                    ["http://testserver/media/feeds/sitemap-1.xml.gz"],
+                )
@@ -0,0 +1,221 @@
+"""
+Test module for the product listing read model.
+"""
+from io import StringIO
+
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from apps.product.admin import ProductAdmin
+from apps.product.models import Product, ProductListing
+from apps.product.models.product import (
+    ProductCharacteristics,
+    TypeProductCharacteristics,
+    get_types_product_prefetch,
+)
+from apps.product.serializers.product import ProductListingSerializer, ProductListSerializer
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class ProductListingTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for listing rows, their synchronization and list endpoints reading them.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        characteristic = ProductCharacteristics.objects.create(name="Taste")
+        self.salmon = TypeProductCharacteristics.objects.create(
+            name="Salmon", product_characteristics=characteristic
+        )
+        self.other_product = Product.objects.create(
+            name="Other Product",
+            slug="other-product",
+            price="99.99",
+            discount_percentage=15,
+            product_code="OTHER1",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="product/default.jpg",
+        )
+        self.salmon.product.add(self.product, self.other_product)
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def serialize(self, products) -> list:
+        """Utility method to serialize products with the regular list serializer."""
+        request = RequestFactory().get("/")
+        products = products.select_related("categories", "listing").prefetch_related(
+            get_types_product_prefetch()
+        )
+        return ProductListSerializer(products, many=True, context={"request": request}).data
+
+    def serialize_listings(self, listings) -> list:
+        """Utility method to serialize listing rows."""
+        request = RequestFactory().get("/")
+        return ProductListingSerializer(listings, many=True, context={"request": request}).data
+
+    def test_listing_matches_product_serializer(self):
+        """Test that listing rows are serialized exactly as products are."""
+        products = Product.objects.order_by("pk")
+        listings = ProductListing.objects.order_by("pk")
+
+        self.assertEqual(self.serialize_listings(listings), self.serialize(products))
+        self.assertEqual(str(listings.get(pk=self.other_product.pk).price_discount), "84.99")
+
+    def test_values_fast_path_is_byte_identical(self):
+        """Test that rows from `.values()` render to the same JSON as products."""
+        weight = ProductCharacteristics.objects.create(name="Weight")
+        for name in ("3 kg", "1.5 kg"):
+            TypeProductCharacteristics.objects.create(
+                name=name, product_characteristics=weight
+            ).product.add(self.product)
+        Product.objects.create(
+            name="Unpriced Product",
+            slug="unpriced-product",
+            product_code="UNPRICED1",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="",
+        )
+        renderer = JSONRenderer()
+        products = renderer.render(self.serialize(Product.objects.order_by("pk")))
+        rows = renderer.render(
+            self.serialize_listings(ProductListing.objects.order_by("pk").values())
+        )
+
+        self.assertEqual(rows, products)
+        self.assertIn(b'"priceDiscount":null', rows)
+        self.assertIn(b'"characteristics":{"Taste":["Salmon"],"Weight":["1.5 kg","3 kg"]}', rows)
+
+    def test_characteristics_query_count(self):
+        """Test that characteristics of a page are resolved with a constant number of queries."""
+        weight = ProductCharacteristics.objects.create(name="Weight")
+        heavy = TypeProductCharacteristics.objects.create(
+            name="10 kg", product_characteristics=weight
+        )
+        for i in range(98):
+            product = Product.objects.create(
+                name=f"Product {i}",
+                slug=f"product-{i}",
+                price=10,
+                product_code=f"CODE{i}",
+                manufacturer=self.manufacturer,
+                categories=self.lower_level_category,
+                image="product/default.jpg",
+            )
+            product.types_product.add(self.salmon, heavy)
+
+        url = reverse("product:product-list")
+        for page_size in (10, 50, 100):
+            with self.subTest(page_size=page_size):
+                with self.assertNumQueries(2):
+                    response = self.client.get(url, {"page_size": page_size})
+                self.assertEqual(len(response.data["results"]), page_size)
+                self.assertEqual(
+                    response.data["results"][0]["characteristics"],
+                    {"Taste": ["Salmon"], "Weight": ["10 kg"]},
+                )
+
+                # The page of products and types of characteristics of the whole page.
+                with self.assertNumQueries(2):
+                    self.serialize(Product.objects.all()[:page_size])
+
+    def test_listing_follows_related_changes(self):
+        """Test that listing rows follow changes of products and related objects."""
+        self.manufacturer.trade_brand = "Brit"
+        self.manufacturer.save()
+        self.lower_level_category.slug = "renamed-category"
+        self.lower_level_category.save()
+        self.salmon.name = "Tuna"
+        self.salmon.save()
+        self.salmon.product.remove(self.other_product)
+
+        listing = ProductListing.objects.get(pk=self.product.pk)
+        self.assertEqual(listing.manufacturer_brand, "Brit")
+        self.assertEqual(listing.category_slug, "renamed-category")
+        self.assertEqual(
+            listing.types_product,
+            [{"productCharacteristics": "Taste", "typeCharacteristic": "Tuna"}],
+        )
+        self.assertEqual(ProductListing.objects.get(pk=self.other_product.pk).types_product, [])
+
+    def test_admin_remove_discount_refreshes_listing(self):
+        """Test that the bulk admin action refreshes listing rows."""
+        request = RequestFactory().post("/")
+        request.user = self.admin_user
+        admin = ProductAdmin(Product, AdminSite())
+        admin.message_user = lambda *args, **kwargs: None
+
+        admin.remove_discount(request, Product.objects.filter(pk=self.product.pk))
+
+        listing = ProductListing.objects.get(pk=self.product.pk)
+        self.assertEqual(listing.discount_percentage, 0)
+        self.assertEqual(listing.price_discount, 100)
+
+    def test_admin_remove_discount_filtered_by_discount(self):
+        """Test that the action refreshes products of a changelist filtered by the discount."""
+        request = RequestFactory().post("/")
+        request.user = self.admin_user
+        admin = ProductAdmin(Product, AdminSite())
+        admin.message_user = lambda *args, **kwargs: None
+        history_count = self.product.price_history.count()
+
+        admin.remove_discount(request, Product.objects.filter(discount_percentage=10))
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.price_discount, 100)
+        self.assertEqual(ProductListing.objects.get(pk=self.product.pk).price_discount, 100)
+        self.assertEqual(self.product.price_history.count(), history_count + 1)
+
+    def test_list_endpoints_read_listing(self):
+        """Test that list endpoints serve listing rows with a single page query."""
+        url = reverse("product:product-list")
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"][1]["typesProduct"],
+            [{"productCharacteristics": "Taste", "typeCharacteristic": "Salmon"}],
+        )
+
+        category_url = reverse(
+            "product:product-list-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+            },
+        )
+        response = self.client.get(category_url, {"type_characteristic": "salmon"})
+        self.assertEqual(response.data["count"], 2)
+        response = self.client.get(category_url, {"ordering": "price", "max_price": 99.99})
+        self.assertEqual(
+            [product["id"] for product in response.data["results"]], [str(self.other_product.pk)]
+        )
+
+    def test_rebuild_command(self):
+        """Test rebuilding listing rows of all products."""
+        ProductListing.objects.all().delete()
+
+        call_command("rebuild_product_listings", stdout=StringIO())
+        self.assertEqual(ProductListing.objects.count(), 2)
+
+    def test_benchmark_command(self):
+        """Test running the serializer benchmark, its data is rolled back."""
+        out = StringIO()
+        call_command("benchmark_product_serializers", products=20, repeat=1, stdout=out)
+
+        self.assertIn("values fast path", out.getvalue())
+        self.assertEqual(ProductListing.objects.count(), 2)
@@ -3,12 +3,14 @@ Test module for manufacturer related functionality.
 """
 import logging
 
+from django.core.cache import cache
+from django.db.models import Count
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
 
-from apps.product.models import Manufacturer
-from apps.product.serializers.manufacturer import ManufacturerSerializer
+from apps.product.models import Category, Manufacturer, Product
+from apps.product.serializers.manufacturer import ManufacturerListSerializer
 from apps.product.tests.test_product import ProductSetupMixin
 
 
@@ -28,42 +30,133 @@ class ManufacturerTestCase(ProductSetupMixin, TestCase):
         self.previous_level = logger.getEffectiveLevel()
         logger.setLevel(logging.ERROR)
 
+        self.url = reverse("product:manufacturer-list")
+
     def tearDown(self) -> None:
-        """Reset the log level back to normal."""
+        """Reset the log level back to normal and clear cached responses."""
         logger = logging.getLogger("django.request")
         logger.setLevel(self.previous_level)
+        cache.clear()
+
+    def get_counts(self, response) -> dict:
+        """Utility method to map brands of the response to their product counts."""
+        return {row["trade_brand"]: row["productsCount"] for row in response.data["results"]}
 
     def test_get_manufacturer_list(self):
         """
         Test to verify that the ManufacturerListView returns a list of manufacturers.
         """
-        url = reverse("product:manufacturer-list")
-        response = self.client.get(url)
+        response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), Manufacturer.objects.count())
+        self.assertEqual(len(response.data["results"]), Manufacturer.objects.count())
 
     def test_get_manufacturer_list_content(self):
         """
         Test to verify the content of the ManufacturerListView response.
         """
-        url = reverse("product:manufacturer-list")
-        response = self.client.get(url)
+        response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), Manufacturer.objects.count())
+        self.assertEqual(len(response.data["results"]), Manufacturer.objects.count())
 
         # Check if the response data matches the serialized data
-        serialized_data = ManufacturerSerializer(Manufacturer.objects.all(), many=True).data
-        self.assertEqual(response.data, serialized_data)
+        serialized_data = ManufacturerListSerializer(
+            Manufacturer.objects.annotate(products_count=Count("products")), many=True
+        ).data
+        self.assertEqual(response.data["results"], serialized_data)
 
     def test_get_manufacturer_list_empty(self):
         """
         Test that ManufacturerListView returns an empty list when there are no manufacturers.
         """
         Manufacturer.objects.all().delete()
-        url = reverse("product:manufacturer-list")
-        response = self.client.get(url)
+        response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data["results"]), 0)
+
+    def test_get_manufacturer_list_counts(self):
+        """
+        Test that only products which are not withdrawn from sale are counted.
+        """
+        other = Manufacturer.objects.create(
+            trade_brand="Another Brand", country="Country", country_brand_registration="Country"
+        )
+        self.create_product("in-stock", manufacturer=other)
+        self.create_product(
+            "withdrawn", manufacturer=other, stock=Product.ProductStockChoices.WITHDRAWN_FROM_SALE
+        )
+        Manufacturer.objects.create(
+            trade_brand="Empty Brand", country="Country", country_brand_registration="Country"
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            [row["trade_brand"] for row in response.data["results"]],
+            ["Another Brand", "Empty Brand", "Test Brand"],
+        )
+        self.assertEqual(
+            self.get_counts(response), {"Another Brand": 1, "Empty Brand": 0, "Test Brand": 1}
+        )
+
+    def test_get_manufacturer_list_by_category(self):
+        """
+        Test that counts are scoped to the category and its subcategories.
+        """
+        other_category = Category.objects.create(name="Other Top Category", level=0)
+        other = Manufacturer.objects.create(
+            trade_brand="Another Brand", country="Country", country_brand_registration="Country"
+        )
+        self.create_product("other-category", manufacturer=other, categories=other_category)
+        self.create_product("lower-category")
+
+        response = self.client.get(self.url, {"category": self.top_level_category.pk})
+        self.assertEqual(self.get_counts(response), {"Test Brand": 2})
+
+        response = self.client.get(self.url, {"category": other_category.pk})
+        self.assertEqual(self.get_counts(response), {"Another Brand": 1})
+
+        response = self.client.get(self.url, {"category": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_manufacturer_list_by_category_cache(self):
+        """
+        Test that cached lists of a category are invalidated by categories added to its subtree.
+        """
+        other = Manufacturer.objects.create(
+            trade_brand="Another Brand", country="Country", country_brand_registration="Country"
+        )
+        self.client.get(self.url, {"category": self.top_level_category.pk})
+
+        new_category = Category.objects.create(
+            name="New Lower Category",
+            slug="new-lower-category",
+            parent=self.medium_level_category,
+            level=2,
+        )
+        self.create_product("new-category", manufacturer=other, categories=new_category)
+        response = self.client.get(self.url, {"category": self.top_level_category.pk})
+        self.assertEqual(self.get_counts(response), {"Another Brand": 1, "Test Brand": 1})
+
+    def test_get_manufacturer_list_cache(self):
+        """
+        Test that cached pages are invalidated only by products of the listed manufacturers.
+        """
+        other = Manufacturer.objects.create(
+            trade_brand="Another Brand", country="Country", country_brand_registration="Country"
+        )
+        other_product = self.create_product("other-product", manufacturer=other)
+        self.client.get(self.url, {"page_size": 1})
+
+        self.product.price = 150
+        self.product.save()
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"page_size": 1})
+        self.assertEqual(self.get_counts(response), {"Another Brand": 1})
+
+        other_product.stock = Product.ProductStockChoices.WITHDRAWN_FROM_SALE
+        other_product.save()
+        response = self.client.get(self.url, {"page_size": 1})
+        self.assertEqual(self.get_counts(response), {"Another Brand": 0})
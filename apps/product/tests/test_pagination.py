@@ -0,0 +1,141 @@
+"""
+Test module for keyset pagination of product lists.
+"""
+import logging
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.product.models import Product
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class ProductKeysetPaginationTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for cursor pagination of product list endpoints.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        # Prices include duplicates and empty values to check the tiebreak and NULL handling.
+        prices = [50, 150, 150, None, 20, 150, None, 75, 20, 300, 150]
+        for i, price in enumerate(prices):
+            self.create_product(f"product-{i}", name=f"Product {i}", price=price)
+
+        self.category_url = reverse(
+            "product:product-list-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+            },
+        )
+
+        # Reduce the log level to avoid messages like 'not found'
+        logger = logging.getLogger("django.request")
+        self.previous_level = logger.getEffectiveLevel()
+        logger.setLevel(logging.ERROR)
+
+    def tearDown(self) -> None:
+        """Reset the log level back to normal."""
+        logger = logging.getLogger("django.request")
+        logger.setLevel(self.previous_level)
+        cache.clear()
+
+    def collect_pages(self, url: str, params: dict) -> list[dict]:
+        """Utility method to follow 'next' links and collect all pages."""
+        pages = []
+        response = self.client.get(url, {"pagination": "cursor", **params})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            pages.append(response.data)
+            if response.data["next"] is None:
+                return pages
+            response = self.client.get(response.data["next"])
+
+    def assert_pages_match(self, url: str, params: dict, expected_ids: list[str]) -> None:
+        """Utility method to check that cursor pages cover the expected ordering exactly."""
+        pages = self.collect_pages(url, params)
+        ids = [product["id"] for page in pages for product in page["results"]]
+
+        self.assertEqual(ids, expected_ids)
+        self.assertTrue(all(len(page["results"]) <= params["page_size"] for page in pages))
+
+    def test_default_ordering(self):
+        """Test walking through all products ordered by creation date."""
+        expected = [
+            str(pk)
+            for pk in Product.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        ]
+
+        self.assert_pages_match(reverse("product:product-list"), {"page_size": 3}, expected)
+
+    def test_price_ordering_with_ties_and_nulls(self):
+        """Test walking through products ordered by price in both directions."""
+        for ordering in ["price", "-price"]:
+            queryset = Product.objects.filter(categories=self.lower_level_category)
+            if ordering == "price":
+                queryset = queryset.order_by(ordering, "id")
+                expected = [p for p in queryset if p.price is not None]
+                expected += [p for p in queryset if p.price is None]
+            else:
+                queryset = queryset.order_by(ordering, "-id")
+                expected = [p for p in queryset if p.price is None]
+                expected += [p for p in queryset if p.price is not None]
+
+            with self.subTest(ordering=ordering):
+                self.assert_pages_match(
+                    self.category_url,
+                    {"ordering": ordering, "page_size": 4},
+                    [str(p.id) for p in expected],
+                )
+
+    def test_previous_link(self):
+        """Test that previous link returns the same rows as the previous page."""
+        pages = self.collect_pages(self.category_url, {"ordering": "price", "page_size": 4})
+        self.assertIsNone(pages[0]["previous"])
+
+        response = self.client.get(pages[2]["previous"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], pages[1]["results"])
+        self.assertIsNotNone(response.data["previous"])
+        self.assertIsNotNone(response.data["next"])
+
+    def test_stable_under_inserts(self):
+        """Test that rows inserted while paginating don't shift the following pages."""
+        url = reverse("product:product-list")
+        first_page = self.client.get(url, {"pagination": "cursor", "page_size": 5}).data
+
+        self.create_product("product-100", name="Product 100", price=10)
+        second_page = self.client.get(first_page["next"]).data
+
+        first_ids = {product["id"] for product in first_page["results"]}
+        second_ids = {product["id"] for product in second_page["results"]}
+        self.assertFalse(first_ids & second_ids)
+        self.assertEqual(len(second_ids), 5)
+
+    def test_invalid_cursor(self):
+        """Test that tampered cursors and cursors of another ordering are rejected."""
+        response = self.client.get(self.category_url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        page = self.client.get(
+            self.category_url, {"pagination": "cursor", "ordering": "price", "page_size": 2}
+        ).data
+        response = self.client.get(page["next"].replace("ordering=price", "ordering=rating"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_pagination_by_default(self):
+        """Test that page number pagination is used unless cursor pagination is requested."""
+        response = self.client.get(reverse("product:product-list"), {"page_size": 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 12)
@@ -0,0 +1,117 @@
+"""
+Test module for the popularity ranking of products.
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.order.models.order import Order
+from apps.order.models.order_item import OrderItem
+from apps.product.models import Product, ProductListing
+from apps.product.services.popularity import (
+    POPULARITY_HALF_LIFE,
+    POPULARITY_LANDMARK,
+    get_sales_weight,
+    rebuild_product_popularity,
+)
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class ProductPopularityTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for popularity scores maintained from order items.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.other_product = Product.objects.create(
+            name="Other Product",
+            slug="other-product",
+            price=200,
+            product_code="OTHER1",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="product/default.jpg",
+        )
+        self.order = Order.objects.create(order_number=1001)
+
+        self.url = reverse(
+            "product:product-list-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+            },
+        )
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def create_order_item(self, product: Product, quantity: int) -> OrderItem:
+        """Utility method to sell the product."""
+        return OrderItem.objects.create(
+            order=self.order, product=product, price=product.price, quantity=quantity
+        )
+
+    def get_popularity(self, product: Product) -> float:
+        """Utility method to read the stored popularity of the product."""
+        return ProductListing.objects.get(pk=product.pk).popularity
+
+    def get_slugs(self, ordering: str) -> list[str]:
+        """Utility method to list slugs of the category products in the ordering."""
+        response = self.client.get(self.url, {"ordering": ordering})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [product["slug"] for product in response.data["results"]]
+
+    def test_sales_weight(self):
+        """Test that weights of sales double every half-life."""
+        self.assertEqual(get_sales_weight(POPULARITY_LANDMARK), 1)
+        self.assertEqual(get_sales_weight(POPULARITY_LANDMARK + 3 * POPULARITY_HALF_LIFE), 8)
+
+    def test_popularity_maintained_from_order_items(self):
+        """Test that created, changed and deleted order items update popularity scores."""
+        item = self.create_order_item(self.other_product, 2)
+        weight = get_sales_weight(item.created_at)
+        self.assertAlmostEqual(
+            self.get_popularity(self.other_product), 2 * weight, delta=weight * 1e-9
+        )
+        self.assertEqual(self.get_slugs("-popularity"), ["other-product", "test-product"])
+
+        self.create_order_item(self.product, 3)
+        self.assertEqual(self.get_slugs("-popularity"), ["test-product", "other-product"])
+
+        item.quantity = 5
+        item.save()
+        self.assertAlmostEqual(
+            self.get_popularity(self.other_product), 5 * weight, delta=weight * 1e-9
+        )
+        self.assertEqual(self.get_slugs("-popularity"), ["other-product", "test-product"])
+
+        item.delete()
+        self.assertAlmostEqual(self.get_popularity(self.other_product), 0, delta=weight * 1e-9)
+        self.assertEqual(self.get_slugs("popularity"), ["other-product", "test-product"])
+
+    def test_rebuild_product_popularity(self):
+        """Test that rebuilt scores equal the maintained scores."""
+        item = self.create_order_item(self.product, 1)
+        self.create_order_item(self.other_product, 2)
+        item.quantity = 4
+        item.save()
+        maintained = {
+            product.pk: self.get_popularity(product)
+            for product in (self.product, self.other_product)
+        }
+
+        self.assertEqual(rebuild_product_popularity(), 2)
+        for product_id, popularity in maintained.items():
+            self.assertAlmostEqual(
+                ProductListing.objects.get(pk=product_id).popularity,
+                popularity,
+                delta=popularity * 1e-9,
+            )
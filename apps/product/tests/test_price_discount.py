@@ -0,0 +1,91 @@
+"""
+Test module for the stored promotional price of products.
+"""
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.product.models import Product, ProductListing
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class ProductPriceDiscountTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for calculation, ordering and filtering of the promotional price.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        # Promotional prices: 90.00 for the setup product, 75.00, 80.00 and none.
+        self.create_product("cheap-promo", price=150, discount_percentage=50)
+        self.create_product("no-promo", price=80)
+        self.create_product("no-price", price=None)
+
+        self.url = reverse(
+            "product:product-list-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+            },
+        )
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def test_price_discount_calculated_on_save(self):
+        """Test that the promotional price is stored and rounded half up."""
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.price_discount, Decimal("90.00"))
+
+        self.product.price = Decimal("0.05")
+        self.product.discount_percentage = 50
+        self.product.save(update_fields=["price", "discount_percentage"])
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.price_discount, Decimal("0.03"))
+
+        self.assertIsNone(Product.objects.get(slug="no-price").price_discount)
+
+    def test_ordering_by_price_discount(self):
+        """Test sorting the category product list by the promotional price."""
+        response = self.client.get(self.url, {"ordering": "price_discount"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Placement of products without price depends on the database in page mode.
+        slugs = [product["slug"] for product in response.data["results"]]
+        slugs.remove("no-price")
+        self.assertEqual(slugs, ["cheap-promo", "no-promo", "test-product"])
+
+        response = self.client.get(
+            self.url, {"ordering": "-price_discount", "pagination": "cursor"}
+        )
+        slugs = [product["slug"] for product in response.data["results"]]
+        self.assertEqual(slugs, ["no-price", "test-product", "no-promo", "cheap-promo"])
+
+    def test_filtering_by_price_discount(self):
+        """Test filtering the category product list by the promotional price."""
+        response = self.client.get(self.url, {"min_price_discount": 80, "max_price_discount": 89})
+
+        self.assertEqual([product["slug"] for product in response.data["results"]], ["no-promo"])
+
+    def test_bulk_discount_removal(self):
+        """Test that the admin action keeps the stored promotional price up to date."""
+        self.client.force_login(self.admin_user)
+        self.admin_user.is_superuser = True
+        self.admin_user.save()
+
+        self.client.post(
+            reverse("admin:product_product_changelist"),
+            {"action": "remove_discount", "_selected_action": [self.product.pk]},
+        )
+
+        self.assertEqual(Product.objects.get(pk=self.product.pk).price_discount, Decimal("100"))
+        self.assertEqual(ProductListing.objects.get(pk=self.product.pk).price_discount, 100)
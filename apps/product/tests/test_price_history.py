@@ -0,0 +1,134 @@
+"""
+Test module for the price history of products.
+"""
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.product.admin import ProductAdmin
+from apps.product.models import Product, ProductPriceHistory
+from apps.product.services.price_history import get_lowest_prices
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class ProductPriceHistoryTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for the price history appended on changes of prices.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.other_product = Product.objects.create(
+            name="Other Product",
+            slug="other-product",
+            price=200,
+            product_code="OTHER1",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="product/default.jpg",
+        )
+        self.url = reverse("product:product-price-history", args=[self.product.pk])
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def age_history(self, days: int) -> None:
+        """Utility method to move all recorded changes to the past."""
+        for row in ProductPriceHistory.objects.all():
+            row.changed_at -= timedelta(days=days)
+            row.save()
+
+    def test_price_changes_recorded(self):
+        """Test that only changes of prices are appended, including bulk admin changes."""
+        self.assertEqual(self.product.price_history.count(), 1)
+
+        self.product.name = "Renamed Product"
+        self.product.save()
+        self.assertEqual(self.product.price_history.count(), 1)
+
+        self.product.discount_percentage = 50
+        self.product.save()
+        self.assertEqual(
+            list(self.product.price_history.values_list("price", "price_discount")),
+            [(Decimal("100.00"), Decimal("90.00")), (Decimal("100.00"), Decimal("50.00"))],
+        )
+
+        request = RequestFactory().post("/")
+        admin = ProductAdmin(Product, AdminSite())
+        admin.message_user = lambda *args, **kwargs: None
+        admin.remove_discount(request, Product.objects.filter(pk=self.product.pk))
+        self.assertEqual(
+            self.product.price_history.order_by("-changed_at", "-pk").first().price_discount,
+            Decimal("100.00"),
+        )
+        self.assertEqual(self.product.price_history.count(), 3)
+
+    def test_lowest_prices(self):
+        """Test that the lowest price includes the price valid at the start of the period."""
+        self.product.discount_percentage = 50
+        self.product.save()
+        self.age_history(40)
+        self.product.discount_percentage = 0
+        self.product.save()
+
+        with self.assertNumQueries(1):
+            lowest_prices = get_lowest_prices([self.product.pk, self.other_product.pk])
+        self.assertEqual(
+            lowest_prices,
+            {self.product.pk: Decimal("50.00"), self.other_product.pk: Decimal("200.00")},
+        )
+        self.assertEqual(get_lowest_prices([self.product.pk], days=50)[self.product.pk], 50)
+
+        self.age_history(40)
+        self.assertEqual(get_lowest_prices([self.product.pk])[self.product.pk], 100)
+
+    def test_price_history_endpoint(self):
+        """Test the history of a product and lowest prices of a category page."""
+        self.product.discount_percentage = 20
+        self.product.save()
+        self.product.discount_percentage = 0
+        self.product.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["lowestPrice"], "80.00")
+        self.assertEqual(
+            [row["priceDiscount"] for row in response.data["history"]],
+            ["90.00", "80.00", "100.00"],
+        )
+
+        self.age_history(10)
+        response = self.client.get(self.url, {"days": 5})
+        self.assertEqual(response.data["lowestPrice"], "100.00")
+        self.assertEqual(len(response.data["history"]), 1)
+
+        response = self.client.get(self.url, {"days": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(
+            reverse("product:product-price-history", args=[self.lower_level_category.pk])
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        url = reverse(
+            "product:product-list-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+            },
+        )
+        response = self.client.get(url, {"lowest_price": "true", "ordering": "price"})
+        self.assertEqual(
+            [item["lowestPrice"] for item in response.data["results"]], ["80.00", "200.00"]
+        )
+        self.assertNotIn("lowestPrice", self.client.get(url).data["results"][0])
@@ -76,6 +76,23 @@ class ProductSetupMixin:
             image="product/default.jpg",
         )
 
+    def create_product(self, slug: str, **kwargs) -> Product:
+        """
+        Utility method to create a product in the lower level category.
+
+        The name and the code are made of the slug, any field can be passed instead.
+        """
+        fields = {
+            "name": slug,
+            "price": 100,
+            "product_code": slug.upper().replace("-", ""),
+            "manufacturer": self.manufacturer,
+            "categories": self.lower_level_category,
+            "image": "product/default.jpg",
+            **kwargs,
+        }
+        return Product.objects.create(slug=slug, **fields)
+
 
 class ProductTestCase(ProductSetupMixin, TestCase):
     """
@@ -165,6 +182,7 @@ class ProductTestCase(ProductSetupMixin, TestCase):
 
         # test that product's price without discount equals to it's price
         instance.discount_percentage = 0
+        instance.save()
         self.assertEqual(instance.price_discount, instance.price)
 
 
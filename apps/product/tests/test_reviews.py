@@ -0,0 +1,136 @@
+"""
+Test module for reviews and rating aggregates of products.
+"""
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.product.models import Product, ProductListing, ProductReview
+from apps.product.services.reviews import calculate_rating
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class ProductReviewTestCase(ProductSetupMixin, APITestCase):
+    """
+    TestCase for reviews maintaining rating aggregates of products.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.users = [
+            get_user_model().objects.create_user(email=f"user{i}@example.com", password="pass")
+            for i in range(3)
+        ]
+        self.url = reverse("product:product-reviews", args=[self.product.pk])
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def get_ratings(self) -> tuple:
+        """Utility method to read the rating aggregates and the listing rating."""
+        product = Product.objects.get(pk=self.product.pk)
+        listing = ProductListing.objects.get(pk=self.product.pk)
+        return product.rating, product.rating_sum, product.rating_count, listing.rating
+
+    def test_calculate_rating(self):
+        """Test rounding of average ratings."""
+        self.assertEqual(calculate_rating(0, 0), 0)
+        self.assertEqual(calculate_rating(14, 3), Decimal("4.67"))
+        self.assertEqual(calculate_rating(33, 8), Decimal("4.13"))
+
+    def test_rating_aggregates_maintained(self):
+        """Test that created, changed and deleted reviews update aggregates in place."""
+        review = ProductReview.objects.create(product=self.product, user=self.users[0], rating=5)
+        ProductReview.objects.create(product=self.product, user=self.users[1], rating=4)
+        ProductReview.objects.create(product=self.product, user=self.users[2], rating=5)
+        self.assertEqual(self.get_ratings(), (Decimal("4.67"), 14, 3, Decimal("4.67")))
+
+        review.rating = 1
+        review.save()
+        self.assertEqual(self.get_ratings(), (Decimal("3.33"), 10, 3, Decimal("3.33")))
+
+        ProductReview.objects.filter(product=self.product).exclude(pk=review.pk).delete()
+        self.assertEqual(self.get_ratings(), (Decimal("1.00"), 1, 1, Decimal("1.00")))
+
+        review.delete()
+        self.assertEqual(self.get_ratings(), (Decimal("0.00"), 0, 0, Decimal("0.00")))
+
+    def test_product_save_keeps_aggregates(self):
+        """Test that saving a product read before a review doesn't overwrite aggregates."""
+        product = Product.objects.get(pk=self.product.pk)
+        ProductReview.objects.create(product=self.product, user=self.users[0], rating=3)
+
+        product.name = "Renamed Product"
+        product.save()
+        self.assertEqual(self.get_ratings(), (Decimal("3.00"), 3, 1, Decimal("3.00")))
+
+    def test_reconcile_product_ratings(self):
+        """Test that reconciliation corrects only products with wrong aggregates."""
+        ProductReview.objects.create(product=self.product, user=self.users[0], rating=4)
+        ProductReview.objects.bulk_create(
+            [ProductReview(product=self.product, user=self.users[1], rating=2)]
+        )
+        other_product = Product.objects.create(
+            name="Other Product",
+            slug="other-product",
+            price=200,
+            product_code="OTHER1",
+            manufacturer=self.manufacturer,
+            categories=self.lower_level_category,
+            image="product/default.jpg",
+        )
+
+        out = StringIO()
+        call_command("reconcile_product_ratings", chunk_size=1, stdout=out)
+        self.assertIn("1 products corrected", out.getvalue())
+        self.assertEqual(self.get_ratings(), (Decimal("3.00"), 6, 2, Decimal("3.00")))
+        self.assertEqual(Product.objects.get(pk=other_product.pk).rating, 0)
+
+    def test_reviews_endpoint(self):
+        """Test listing reviews and creating one review per authenticated user."""
+        response = self.client.post(self.url, {"rating": 4, "text": "Good"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(self.users[0])
+        response = self.client.post(self.url, {"rating": 4, "text": "Good"})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.get_ratings()[:3], (Decimal("4.00"), 4, 1))
+
+        response = self.client.post(self.url, {"rating": 5})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.client.force_authenticate(self.users[1])
+        response = self.client.post(self.url, {"rating": 6})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(
+            reverse("product:product-reviews", args=[self.lower_level_category.pk]), {"rating": 5}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["text"], "Good")
+
+    def test_concurrent_review_rejected(self):
+        """Test that a review passing the check along with a concurrent one is rejected."""
+        self.client.force_authenticate(self.users[0])
+        self.client.post(self.url, {"rating": 4})
+
+        with mock.patch.object(QuerySet, "exists", side_effect=[False, True]):
+            response = self.client.post(self.url, {"rating": 5})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "You have already reviewed this product.")
+        self.assertEqual(ProductReview.objects.filter(user=self.users[0]).count(), 1)
@@ -0,0 +1,130 @@
+"""
+Test module for the product search engine.
+"""
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from apps.product.models import Product, ProductSearchDocument
+from apps.product.models.product import ProductCharacteristics, TypeProductCharacteristics
+from apps.product.services.search import search_products
+from apps.product.tests.test_product import ProductSetupMixin
+
+
+class ProductSearchTestCase(ProductSetupMixin, TestCase):
+    """
+    TestCase for product search documents, the search backend and the search filter.
+    """
+
+    def setUp(self):
+        """
+        Set up basic environment for test case.
+        """
+        super().product_setup()
+
+        self.salmon_food = self.create_product(
+            "salmon1", name="Salmon dry food", product_code="SALMON1"
+        )
+        self.chicken_food = self.create_product(
+            "chicken1", name="Chicken dry food", product_code="CHICKEN1"
+        )
+        self.salmon_treats = self.create_product(
+            "treats1", name="Dental treats", product_code="TREATS1"
+        )
+
+        characteristic = ProductCharacteristics.objects.create(name="Taste")
+        salmon = TypeProductCharacteristics.objects.create(
+            name="Salmon", product_characteristics=characteristic
+        )
+        salmon.product.add(self.salmon_treats)
+
+    def tearDown(self) -> None:
+        """Clear cached responses."""
+        cache.clear()
+
+    def test_document_created_with_product(self):
+        """Test that saving a product creates its search document."""
+        document = ProductSearchDocument.objects.get(product=self.product)
+
+        self.assertEqual(document.name, "Test Product")
+        self.assertEqual(document.brand, "Test Brand")
+        self.assertEqual(document.code, "TEST123")
+        self.assertEqual(document.document, "test product test brand test123")
+
+    def test_document_updated_with_related_objects(self):
+        """Test that documents follow changes of manufacturer and characteristics."""
+        self.manufacturer.trade_brand = "Brit"
+        self.manufacturer.save()
+        self.assertEqual(ProductSearchDocument.objects.get(product=self.product).brand, "Brit")
+
+        document = ProductSearchDocument.objects.get(product=self.salmon_treats)
+        self.assertEqual(document.characteristics, "Taste Salmon")
+
+        TypeProductCharacteristics.objects.get(name="Salmon").product.clear()
+        document.refresh_from_db()
+        self.assertEqual(document.characteristics, "")
+
+    def test_search_ranking(self):
+        """Test that name matches rank above characteristic matches."""
+        self.assertEqual(search_products("salmon"), [self.salmon_food.pk, self.salmon_treats.pk])
+
+    def test_search_all_terms_required(self):
+        """Test that every term of the query has to match."""
+        self.assertEqual(search_products("dry salmon"), [self.salmon_food.pk])
+        self.assertEqual(search_products("dental chicken"), [])
+
+    def test_search_prefix_code_and_brand(self):
+        """Test searching by a word prefix, product code and brand."""
+        self.assertCountEqual(search_products("chick"), [self.chicken_food.pk])
+        self.assertEqual(search_products("treats1"), [self.salmon_treats.pk])
+        self.assertEqual(len(search_products("test brand")), 4)
+
+    def test_search_with_typo(self):
+        """Test that misspelled terms still find products."""
+        self.assertEqual(search_products("chiken"), [self.chicken_food.pk])
+
+    def test_search_scope(self):
+        """Test limiting search to a queryset of products."""
+        scope = Product.objects.exclude(pk=self.salmon_food.pk)
+
+        self.assertEqual(search_products("salmon", scope=scope), [self.salmon_treats.pk])
+
+    def test_search_filter(self):
+        """Test searching products in the category endpoint."""
+        url = reverse(
+            "product:product-list-by-category",
+            kwargs={
+                "category_slug": self.top_level_category.slug,
+                "subcategory_slug": self.medium_level_category.slug,
+                "lower_category_slug": self.lower_level_category.slug,
+            },
+        )
+
+        response = self.client.get(url, {"search": "salmon"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [product["id"] for product in response.data["results"]],
+            [str(self.salmon_food.pk), str(self.salmon_treats.pk)],
+        )
+
+        response = self.client.get(url, {"search": "salmon", "pagination": "cursor"})
+        self.assertEqual(len(response.data["results"]), 2)
+
+        response = self.client.get(url, {"search": "nothing matches"})
+        self.assertEqual(response.data["count"], 0)
+
+    def test_commands(self):
+        """Test rebuilding documents and running the benchmark."""
+        ProductSearchDocument.objects.all().delete()
+
+        call_command("rebuild_search_documents", stdout=StringIO())
+        self.assertEqual(ProductSearchDocument.objects.count(), 4)
+
+        out = StringIO()
+        call_command("benchmark_product_search", products=20, repeat=1, stdout=out)
+        self.assertIn("engine", out.getvalue())
+        self.assertEqual(Product.objects.count(), 4)
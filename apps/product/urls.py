@@ -6,15 +6,43 @@ This module contains urls for the product app.
 
 from django.urls import path
 
+from apps.product.views.autocomplete import AutocompleteView
+from apps.product.views.feeds import ProductFeedView, SitemapIndexView, SitemapView
 from apps.product.views.manufacturer import ManufacturerListView
-from apps.product.views.product import ProductDetailView, ProductCategoryListView, ProductListView
+from apps.product.views.product import (
+    ProductCoPurchaseListView,
+    ProductDetailView,
+    ProductCategoryListView,
+    ProductListView,
+    ProductPriceHistoryView,
+    ProductReviewListView,
+)
 from apps.product.views.category import CategoryListView, CategoryDetailView
 
 app_name = "product"
 
 urlpatterns = [
     path("products/", ProductListView.as_view(), name="product-list"),
+    path(
+        "products/<uuid:product_id>/bought-together/",
+        ProductCoPurchaseListView.as_view(),
+        name="product-bought-together",
+    ),
+    path(
+        "products/<uuid:product_id>/price-history/",
+        ProductPriceHistoryView.as_view(),
+        name="product-price-history",
+    ),
+    path(
+        "products/<uuid:product_id>/reviews/",
+        ProductReviewListView.as_view(),
+        name="product-reviews",
+    ),
     path("manufacturers/", ManufacturerListView.as_view(), name="manufacturer-list"),
+    path("autocomplete/", AutocompleteView.as_view(), name="autocomplete"),
+    path("sitemap.xml", SitemapIndexView.as_view(), name="sitemap-index"),
+    path("sitemap-<int:page>.xml", SitemapView.as_view(), name="sitemap-page"),
+    path("feed.<slug:feed_format>", ProductFeedView.as_view(), name="product-feed"),
     path("", CategoryListView.as_view(), name="categories-list"),
     path(
         "<slug:category_slug>/",
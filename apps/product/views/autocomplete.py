@@ -0,0 +1,40 @@
+"""
+This module contains the autocomplete view.
+"""
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.product.serializers.autocomplete import AutocompleteQuerySerializer, SuggestionSerializer
+from apps.product.services.autocomplete import autocomplete
+
+
+class AutocompleteView(APIView):
+    """
+    API endpoint that completes product names, brands and categories.
+
+    Suggestions are read from an in-process index, no database queries are made unless
+    the catalog has changed since the index was built.
+
+    - To complete a prefix, use the 'q' parameter, any word of a name may be completed
+      - Example: /api/shop/autocomplete/?q=brit%20sal
+    - To limit the number of suggestions of every kind, use the 'limit' parameter
+      - Example: /api/shop/autocomplete/?q=brit&limit=10
+    """
+
+    def get(self, request, *args, **kwargs) -> Response:
+        """
+        Retrieve suggestions for the typed prefix.
+
+        :param request: The HTTP request object.
+        :return: suggestions grouped by kind.
+        """
+        query = AutocompleteQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        suggestions = autocomplete(query.validated_data["q"], query.validated_data["limit"])
+        return Response(
+            {
+                kind: SuggestionSerializer(items, many=True).data
+                for kind, items in suggestions.items()
+            }
+        )
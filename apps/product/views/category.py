@@ -3,6 +3,7 @@ This module contains Category-related views.
 """
 from django.conf import settings
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
 from rest_framework.response import Response
@@ -11,6 +12,8 @@ from apps.base.mixins import CachedListMixin, CachedRetrieveMixin
 from apps.base.pagination import PaginationCommon
 from apps.product.models import Category
 from apps.product.serializers.category import CategoryDetailSerializer, CategoryListSerializer
+from apps.product.services.cache import CATEGORY_TREE_TAG
+from apps.product.services.category_tree import get_category_tree
 
 CACHE_TTL = getattr(settings, "CACHE_TTL", DEFAULT_TIMEOUT)
 
@@ -30,6 +33,15 @@ class CategoryDetailView(CachedRetrieveMixin, generics.RetrieveAPIView):
         """
         return f"category_detail:{self.request.path}?{self.request.GET.urlencode()}"
 
+    def get_cache_tags(self, instance) -> list[str]:
+        """
+        Method to get cache tags of a specific category.
+
+        :param instance: retrieved category.
+        :return: list of cache tags
+        """
+        return [CATEGORY_TREE_TAG]
+
     def get_object(self):
         """
         Retrieving descendant categories based on the provided slugs.
@@ -40,15 +52,19 @@ class CategoryDetailView(CachedRetrieveMixin, generics.RetrieveAPIView):
         subcategory_slug = self.kwargs.get("subcategory_slug")
 
         if category_slug:
-            parent_category = get_object_or_404(Category, slug=category_slug, level=0)
-
+            tree = get_category_tree()
             if subcategory_slug:
-                descendant_category = get_object_or_404(
-                    Category, parent=parent_category, slug=subcategory_slug, level=1
-                )
-                return descendant_category
+                node = tree.resolve(category_slug, subcategory_slug)
             else:
-                return parent_category
+                node = tree.resolve(category_slug)
+
+            if node is None:
+                raise Http404("No Category matches the given query.")
+
+            return get_object_or_404(
+                Category.objects.select_related("parent").prefetch_related("subcategories"),
+                pk=node.id,
+            )
         else:
             # If no category slug is provided, return 404
             return Response(status=status.HTTP_404_NOT_FOUND)
@@ -60,9 +76,19 @@ class CategoryListView(CachedListMixin, generics.ListAPIView):
     """
 
     serializer_class = CategoryListSerializer
-    queryset = Category.objects.prefetch_related("subcategories").filter(parent=None)
+    queryset = Category.objects.filter(parent=None)
     pagination_class = PaginationCommon
 
+    def get_serializer_context(self) -> dict:
+        """
+        Provide the category tree snapshot to the serializer to build subcategories.
+
+        :return: serializer context.
+        """
+        context = super().get_serializer_context()
+        context["category_tree"] = get_category_tree()
+        return context
+
     def get_cache_key(self) -> str:
         """
         Method to get cache key for list of categories.
@@ -70,3 +96,11 @@ class CategoryListView(CachedListMixin, generics.ListAPIView):
         :return: cache key for the provided category
         """
         return f"category_list:{self.request.path}?{self.request.GET.urlencode()}"
+
+    def get_cache_tags(self) -> list[str]:
+        """
+        Method to get cache tags of list of categories.
+
+        :return: list of cache tags
+        """
+        return [CATEGORY_TREE_TAG]
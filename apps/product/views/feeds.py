@@ -0,0 +1,101 @@
+"""
+This module contains views of sitemaps and product feeds.
+"""
+from django.http import Http404, StreamingHttpResponse
+from django.urls import reverse
+from django.views import View
+
+from apps.product.services.feeds import (
+    FEED_FORMATS,
+    get_sitemap_pages_count,
+    iter_product_feed,
+    iter_sitemap,
+    iter_sitemap_index,
+)
+
+FEED_CONTENT_TYPES = {
+    "xml": "application/xml; charset=utf-8",
+    "jsonl": "application/jsonl; charset=utf-8",
+}
+
+
+def get_base_url(request) -> str:
+    """
+    Retrieve the scheme and host of the request.
+
+    :param request: The HTTP request object.
+    :return: base URL without the trailing slash.
+    """
+    return request.build_absolute_uri("/").rstrip("/")
+
+
+class SitemapIndexView(View):
+    """
+    Sitemap index listing pages of the product sitemap.
+
+    - Example: /api/shop/sitemap.xml
+    """
+
+    def get(self, request, *args, **kwargs) -> StreamingHttpResponse:
+        """
+        Stream the sitemap index.
+
+        :param request: The HTTP request object.
+        :return: streamed XML document.
+        """
+        page_urls = [
+            reverse("product:sitemap-page", kwargs={"page": page})
+            for page in range(1, get_sitemap_pages_count() + 1)
+        ]
+        return StreamingHttpResponse(
+            iter_sitemap_index(get_base_url(request), page_urls),
+            content_type=FEED_CONTENT_TYPES["xml"],
+        )
+
+
+class SitemapView(View):
+    """
+    Page of the sitemap with product pages, streamed without loading the catalog in memory.
+
+    - Example: /api/shop/sitemap-1.xml
+    """
+
+    def get(self, request, page: int, *args, **kwargs) -> StreamingHttpResponse:
+        """
+        Stream a page of the sitemap.
+
+        :param request: The HTTP request object.
+        :param page: number of the page starting from 1.
+        :return: streamed XML document.
+        """
+        if not 1 <= page <= get_sitemap_pages_count():
+            raise Http404
+        return StreamingHttpResponse(
+            iter_sitemap(get_base_url(request), page), content_type=FEED_CONTENT_TYPES["xml"]
+        )
+
+
+class ProductFeedView(View):
+    """
+    Product feed for marketplaces and ads, streamed without loading the catalog in memory.
+
+    Large catalogs should be served from files pre-generated by the `generate_feeds` command.
+
+    - Example: /api/shop/feed.xml
+    - Example: /api/shop/feed.jsonl
+    """
+
+    def get(self, request, feed_format: str, *args, **kwargs) -> StreamingHttpResponse:
+        """
+        Stream the product feed.
+
+        :param request: The HTTP request object.
+        :param feed_format: "xml" or "jsonl".
+        :return: streamed document.
+        """
+        if feed_format not in FEED_FORMATS:
+            raise Http404
+        return StreamingHttpResponse(
+            iter_product_feed(get_base_url(request), feed_format),
+            content_type=FEED_CONTENT_TYPES[feed_format],
+        )
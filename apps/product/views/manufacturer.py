@@ -1,16 +1,96 @@
 """
 This module contains manufacturer-related views.
 """
+from uuid import UUID
+
+from django.db.models import Count, Q
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListAPIView
 
-from apps.product.models import Manufacturer
-from apps.product.serializers.manufacturer import ManufacturerSerializer
+from apps.base.mixins import CachedListMixin
+from apps.base.pagination import PaginationCommon
+from apps.product.models import Category, Manufacturer, Product
+from apps.product.serializers.manufacturer import ManufacturerListSerializer
+from apps.product.services.cache import (
+    CATEGORY_TREE_TAG,
+    MANUFACTURER_LIST_TAG,
+    get_category_tag,
+    get_manufacturer_products_tag,
+)
 
 
-class ManufacturerListView(ListAPIView):
+class ManufacturerListView(CachedListMixin, ListAPIView):
     """
-    API endpoint that returns a list of manufacturers.
+    API endpoint that returns a paginated list of manufacturers with counts of active products.
+
+    Products withdrawn from sale are not counted.
+
+    - To count products of a category and its subcategories, use the 'category' parameter
+      with the category id, only manufacturers with products in the category are listed
+      - Example: /api/shop/manufacturers/?category=<uuid>
+    - To paginate, use the 'page' parameter in the URL
+      - Example: /api/shop/manufacturers/?page=2&page_size=50
     """
 
-    serializer_class = ManufacturerSerializer
-    queryset = Manufacturer.objects.all()
+    serializer_class = ManufacturerListSerializer
+    pagination_class = PaginationCommon
+    category_query_param = "category"
+
+    def get_category_id(self):
+        """
+        Retrieve the id of the category the counts are scoped to.
+
+        :return: id of the category or None.
+        """
+        category_id = self.request.query_params.get(self.category_query_param)
+        if not category_id:
+            return None
+        try:
+            return UUID(category_id)
+        except ValueError:
+            raise ValidationError({self.category_query_param: "Must be a valid UUID."})
+
+    def get_queryset(self):
+        """
+        Annotate manufacturers with counts of active products in a single grouped query.
+        """
+        products = ~Q(products__stock=Product.ProductStockChoices.WITHDRAWN_FROM_SALE)
+        category_id = self.get_category_id()
+        if category_id is not None:
+            products &= Q(products__categories__in=Category.get_subtree_ids(category_id))
+
+        queryset = Manufacturer.objects.annotate(
+            products_count=Count("products", filter=products)
+        ).order_by("trade_brand", "id")
+        if category_id is not None:
+            queryset = queryset.filter(products_count__gt=0)
+        return queryset
+
+    def get_cache_key(self) -> str:
+        """
+        Generate cache key based on the query parameters.
+        """
+        return f"manufacturer_list:{self.request.path}?{self.request.GET.urlencode()}"
+
+    def get_cache_tags(self) -> list[str]:
+        """
+        Lists scoped to a category are also invalidated by changes of its subtree.
+
+        Changes of products of the subtree change counts, changes of the category tree may add
+        categories to the subtree.
+        """
+        category_id = self.get_category_id()
+        if category_id is None:
+            return [MANUFACTURER_LIST_TAG]
+        return [MANUFACTURER_LIST_TAG, CATEGORY_TREE_TAG] + [
+            get_category_tag(subcategory_id)
+            for subcategory_id in Category.get_subtree_ids(category_id).values_list(
+                "descendant_id", flat=True
+            )
+        ]
+
+    def get_page_cache_tags(self, rows) -> list[str]:
+        """
+        Counts of listed manufacturers change with their products.
+        """
+        return [get_manufacturer_products_tag(manufacturer.pk) for manufacturer in rows]
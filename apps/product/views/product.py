@@ -3,17 +3,39 @@ Module: views.py.
 
 This module contains handler for the product app.
 """
-from django.db.models import F
+from uuid import UUID
+
+from django.db import IntegrityError, transaction
+from django.http import Http404
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
-from rest_framework.generics import ListAPIView, RetrieveAPIView
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.generics import (
+    ListAPIView,
+    ListCreateAPIView,
+    RetrieveAPIView,
+    get_object_or_404,
+)
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.base.mixins import CachedRetrieveMixin, CachedListMixin
-from apps.base.pagination import PaginationCommon
-from apps.product.filters.product import ProductFilter
+from apps.base.pagination import PaginationCommon, PaginationCommonOrCursor
+from apps.product.filters.product import ProductListingFilter
+from apps.product.filters.search import ProductSearchFilter
 from apps.product.mixins.category import CategoryMixin
-from apps.product.models import Product
-from apps.product.serializers.product import ProductListSerializer, ProductDetailSerializer
+from apps.product.models import Product, ProductCoPurchase, ProductListing, ProductReview
+from apps.product.models.product import get_types_product_prefetch
+from apps.product.serializers.price_history import (
+    PriceHistoryQuerySerializer,
+    PriceHistorySerializer,
+)
+from apps.product.serializers.product import ProductDetailSerializer, ProductListingSerializer
+from apps.product.serializers.review import ProductReviewSerializer
+from apps.product.services.cache import get_category_tag, get_manufacturer_tag, get_product_tag
+from apps.product.services.facets import get_facet_index
+from apps.product.services.price_history import get_lowest_prices, get_price_history
 
 
 class ProductCategoryListView(CategoryMixin, CachedListMixin, ListAPIView):
@@ -26,18 +48,31 @@ class ProductCategoryListView(CategoryMixin, CachedListMixin, ListAPIView):
       - Example: /api/shop/category1/category2/category3/?ordering=-price - by decrease
     - To filter by price or type of product, use the next URL
       - Example: /api/shop/category1/category2/category3/?min_price=1000&max_price=1500
-    - To search, use the 'search' parameter in the URL
+    - To sort or filter by the promotional price, use 'price_discount'
+      - Example: /api/shop/category1/category2/category3/?ordering=price_discount
+      - Example: /api/shop/category1/category2/category3/?max_price_discount=1000
+    - To sort by sales with recent sales weighted higher, use 'popularity'
+      - Example: /api/shop/category1/category2/category3/?ordering=-popularity - bestsellers
+    - To search by name, brand, code or characteristics, use the 'search' parameter in the URL
+      - Results are ordered by relevance and tolerate typos
       - Example: /api/shop/category1/category2/category3/?search=brit
     - To paginate, use the 'page' parameter in the URL
       - Example: /api/shop/category1/category2/category3/?page=2&page_size=5
+    - To get counts of products for every filter option, use the 'facets' parameter in the URL
+      - Example: /api/shop/category1/category2/category3/?facets=true&manufacturer=brit
+    - To paginate with cursors, use the 'pagination' parameter and follow 'next'/'previous' links
+      - Example: /api/shop/category1/category2/category3/?pagination=cursor&ordering=price
+    - To get the lowest promotional price of every product in the last 30 days, use the
+      'lowest_price' parameter in the URL
+      - Example: /api/shop/category1/category2/category3/?lowest_price=true
     """
 
-    serializer_class = ProductListSerializer
-    filterset_class = ProductFilter
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    ordering_fields = ["price", "rating"]
-    search_fields = ["name", "manufacturer__trade_brand", "product_code"]
-    pagination_class = PaginationCommon
+    serializer_class = ProductListingSerializer
+    filterset_class = ProductListingFilter
+    filter_backends = [DjangoFilterBackend, ProductSearchFilter, OrderingFilter]
+    ordering_fields = ["price", "price_discount", "rating", "popularity"]
+    pagination_class = PaginationCommonOrCursor
+    restricting_filters = ("name", "in_stock_only", "min_price_discount", "max_price_discount")
 
     def get_cache_key(self) -> str:
         """
@@ -45,13 +80,65 @@ class ProductCategoryListView(CategoryMixin, CachedListMixin, ListAPIView):
         """
         return f"product_list:{self.request.path}?{self.request.GET.urlencode()}"
 
+    def get_cache_tags(self) -> list[str]:
+        """
+        Cached lists are invalidated by changes of products of the category.
+        """
+        category, subcategory, lower_category = self.get_categories()
+        return [get_category_tag(lower_category.id)]
+
     def get_queryset(self):
-        """Different filters require different sets of queries."""
+        """
+        Products of the category are read from the listing rows with a single query.
+
+        Rows are fetched as dictionaries to be serialized with the fast path.
+        """
         category, subcategory, lower_category = self.get_categories()
-        return (
-            Product.objects.prefetch_related("product_characteristics", "types_product", "images")
-            .select_related("manufacturer", "categories")
-            .filter(categories=lower_category)
+        return ProductListing.objects.filter(category_id=lower_category.id).values()
+
+    def get_paginated_response(self, data) -> Response:
+        """
+        Return a paginated response, with facet counts and lowest prices if they are requested.
+        """
+        if self.request.query_params.get("lowest_price") in ("true", "1"):
+            lowest_prices = get_lowest_prices([item["id"] for item in data])
+            for item in data:
+                lowest_price = lowest_prices.get(UUID(item["id"]))
+                item["lowestPrice"] = None if lowest_price is None else f"{lowest_price:.2f}"
+        response = super().get_paginated_response(data)
+        if self.request.query_params.get("facets") in ("true", "1"):
+            response.data["facets"] = self.get_facets()
+        return response
+
+    def get_facets(self) -> dict:
+        """
+        Count products for every option of product filters in the current category.
+
+        Options of a filter are counted with all other selected filters applied.
+        """
+        category, subcategory, lower_category = self.get_categories()
+        filterset = self.filterset_class(self.request.query_params, queryset=self.get_queryset())
+        filters = filterset.form.cleaned_data if filterset.is_valid() else {}
+
+        # Filters without a facet restrict counted products to rows matching them.
+        selected = [
+            name for name in self.restricting_filters if filters.get(name) not in (None, "")
+        ]
+        product_ids = None
+        if self.request.query_params.get(ProductSearchFilter.search_param) or selected:
+            queryset = ProductSearchFilter().filter_queryset(
+                self.request, self.get_queryset(), self
+            )
+            for name in selected:
+                queryset = filterset.filters[name].filter(queryset, filters[name])
+            product_ids = queryset.values_list("pk", flat=True)
+
+        return get_facet_index(lower_category.id).get_facets(
+            min_price=filters.get("min_price"),
+            max_price=filters.get("max_price"),
+            manufacturer=filters.get("manufacturer"),
+            type_characteristic=filters.get("type_characteristic"),
+            product_ids=product_ids,
         )
 
 
@@ -68,26 +155,138 @@ class ProductDetailView(CategoryMixin, CachedRetrieveMixin, RetrieveAPIView):
         """
         return f"product_detail:{self.request.path}?{self.request.GET.urlencode()}"
 
+    def get_cache_tags(self, instance) -> list[str]:
+        """
+        Cached products are invalidated by changes of the product, its category and manufacturer.
+        """
+        return [
+            get_product_tag(instance.pk),
+            get_category_tag(instance.categories_id),
+            get_manufacturer_tag(instance.manufacturer_id),
+        ]
+
     def get_queryset(self):
         """Filters the queryset based on the product's unique slug."""
         category, subcategory, lower_category = self.get_categories()
         product_slug = self.kwargs.get("product_slug")
         return (
-            Product.objects.prefetch_related("product_characteristics", "types_product", "images")
-            .select_related("manufacturer", "categories")
-            .filter(slug=product_slug, categories=lower_category)
+            Product.objects.prefetch_related(
+                "product_characteristics", get_types_product_prefetch(), "images"
+            )
+            .select_related("manufacturer", "categories", "listing")
+            .filter(slug=product_slug, categories_id=lower_category.id)
         )
 
 
 class ProductListView(ListAPIView):
-    """Returns a list of products sorted by creation date in descending order."""
+    """
+    Returns a list of products sorted by creation date in descending order.
+
+    - To paginate with cursors, use the 'pagination' parameter and follow 'next'/'previous' links
+      - Example: /api/shop/products/?pagination=cursor&page_size=20
+    """
+
+    serializer_class = ProductListingSerializer
+    pagination_class = PaginationCommonOrCursor
+    queryset = ProductListing.objects.order_by("-created_at").values()
+
+
+class ProductCoPurchaseListView(ListAPIView):
+    """
+    Returns products frequently bought together with the product.
 
-    serializer_class = ProductListSerializer
+    Products are ranked by the number of orders with both products, the index is built
+    by the `build_co_purchases` management command.
+
+    - Example: /api/shop/products/<uuid>/bought-together/
+    """
+
+    serializer_class = ProductListingSerializer
+    pagination_class = None
+
+    def get_queryset(self) -> list[dict]:
+        """
+        Read ids of neighbours from the index and their listing rows by primary keys.
+        """
+        related_ids = list(
+            ProductCoPurchase.objects.filter(product_id=self.kwargs["product_id"])
+            .order_by("-orders_count", "related_product")
+            .values_list("related_product_id", flat=True)
+        )
+        rows = {
+            row["product_id"]: row
+            for row in ProductListing.objects.filter(product_id__in=related_ids).values()
+        }
+        return [rows[product_id] for product_id in related_ids if product_id in rows]
+
+
+class ProductPriceHistoryView(APIView):
+    """
+    Returns prices of the product over the last days and the lowest promotional price.
+
+    The history starts with the prices valid at the start of the period.
+
+    - Example: /api/shop/products/<uuid>/price-history/
+    - To change the period, use the 'days' parameter, 30 days by default
+      - Example: /api/shop/products/<uuid>/price-history/?days=90
+    """
+
+    def get(self, request, product_id, *args, **kwargs) -> Response:
+        """
+        Retrieve the price history of the product.
+
+        :param request: The HTTP request object.
+        :param product_id: id of the product.
+        :return: lowest promotional price and prices since every change.
+        """
+        query = PriceHistoryQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        history = get_price_history(product_id, query.validated_data["days"])
+        # Every product has prices valid at the start of any period since its creation.
+        if not history:
+            raise Http404
+        prices = [row.price_discount for row in history if row.price_discount is not None]
+        lowest_price = min(prices) if prices else None
+        return Response(
+            {
+                "lowestPrice": None if lowest_price is None else f"{lowest_price:.2f}",
+                "history": PriceHistorySerializer(history, many=True).data,
+            }
+        )
+
+
+class ProductReviewListView(ListCreateAPIView):
+    """
+    Returns reviews of the product, newest first, and creates reviews of authenticated users.
+
+    Every user reviews a product once, ratings of reviews are added to the product rating.
+
+    - Example: /api/shop/products/<uuid>/reviews/
+    """
+
+    serializer_class = ProductReviewSerializer
     pagination_class = PaginationCommon
-    queryset = (
-        Product.objects.select_related("manufacturer", "categories")
-        .prefetch_related("product_characteristics", "types_product", "images")
-        .annotate(newest_first=F("created_at"))  # Add annotation for sorting
-        .order_by("-newest_first")  # Order by creation date descending
-        .all()
-    )
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    def get_queryset(self):
+        """Filters reviews of the product."""
+        return ProductReview.objects.filter(product_id=self.kwargs["product_id"]).select_related(
+            "user"
+        )
+
+    def perform_create(self, serializer) -> None:
+        """Save the review of the product by the user of the request."""
+        product = get_object_or_404(Product, pk=self.kwargs["product_id"])
+        reviews = ProductReview.objects.filter(product=product, user=self.request.user)
+        error = ValidationError({"detail": "You have already reviewed this product."})
+        if reviews.exists():
+            raise error
+        # Concurrent requests pass the check together, the unique constraint rejects the second.
+        try:
+            with transaction.atomic():
+                serializer.save(product=product, user=self.request.user)
+        except IntegrityError:
+            if reviews.exists():
+                raise error
+            raise
@@ -25,6 +25,7 @@ from apps.warehouse.models import (
     Warehouse,
 )
 from apps.warehouse.serializers.warehouse import WarehouseSerializer
+from apps.warehouse.signals import update_product_availability
 from apps.warehouse.utils import calculate_total_quantities
 
 
@@ -108,6 +109,18 @@ def generate_transactions_report(modeladmin, request, queryset):
     )
 
 
+@admin.action(description=_("Toggle is_active status for selected entries"))
+def toggle_reserves_is_active(modeladmin, request, queryset):
+    """
+    Action to toggle is_active status of reserves and update availability of their products.
+
+    Reserves are updated in bulk without signals, so availability is updated here.
+    """
+    product_ids = set(queryset.values_list("reserved_item_id", flat=True))
+    toggle_is_active(modeladmin, request, queryset)
+    update_product_availability(product_ids)
+
+
 def product_link(obj):
     """Method to generate link to product, if exists."""
     if obj.product:
@@ -265,7 +278,7 @@ class ReserveAdmin(admin.ModelAdmin):
     ]
     search_fields = ["order__order_number", "reserved_item__name"]
     search_help_text = _("Search for reservations by order and reserved item name")
-    actions = [toggle_is_active]
+    actions = [toggle_reserves_is_active]
     readonly_fields = ("created_at", "updated_at")
     fieldsets = (
         (None, {"fields": ("order", "reserved_item", "quantity")}),
@@ -19,7 +19,6 @@ class WarehouseSubcategoryFilter(BaseSubcategoryFilter):
         :return: filtered queryset
         """
         if self.value():
-            category = Category.objects.get(pk=self.value())
-            subcategories = list(category.get_descendants()) + [category]
+            subcategories = Category.get_subtree_ids(self.value())
 
             return queryset.filter(product__categories__in=subcategories)
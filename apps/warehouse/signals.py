@@ -2,14 +2,26 @@
 Django signals related to the warehouse app.
 """
 from django.db.models import F
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from apps.product.models.product import Product
-from apps.warehouse.models import Transaction
+from apps.product.services.cache import invalidate_product_cache
+from apps.product.services.listing import refresh_listing_availability
+from apps.warehouse.models import Reserve, Transaction
 from apps.warehouse.models.warehouse import Warehouse
 
 
+def update_product_availability(product_ids) -> None:
+    """
+    Update available quantities of the products in their listings and cached responses.
+
+    :param product_ids: ids of the products with changed balances or reserves.
+    """
+    refresh_listing_availability(product_ids)
+    invalidate_product_cache(product_ids)
+
+
 @receiver(post_save, sender=Product)
 def ensure_warehouse_for_product(sender, instance, created, **kwargs):
     """
@@ -32,3 +44,24 @@ def update_total_balance(sender, instance, created, **kwargs):
         Warehouse.objects.filter(product_id=product_id).update(
             total_balance=F("total_balance") + quantity
         )
+        update_product_availability([product_id])
+
+
+@receiver(post_save, sender=Warehouse)
+@receiver(post_delete, sender=Warehouse)
+def update_warehouse_availability(sender, instance, raw=False, **kwargs):
+    """
+    Signal to update the available quantity of the product after its balance is changed.
+    """
+    if not raw:
+        update_product_availability([instance.product_id])
+
+
+@receiver(post_save, sender=Reserve)
+@receiver(post_delete, sender=Reserve)
+def update_reserve_availability(sender, instance, raw=False, **kwargs):
+    """
+    Signal to update the available quantity of the product after its reserve is changed.
+    """
+    if not raw:
+        update_product_availability([instance.reserved_item_id])
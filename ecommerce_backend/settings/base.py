@@ -42,6 +42,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "django_filters",
 ]
@@ -189,3 +190,10 @@ SIMPLE_JWT = {
 # LiqPay API keys
 LIQPAY_PUBLIC_KEY = os.getenv("LIQPAY_PUBLIC_KEY")
 LIQPAY_PRIVATE_KEY = os.getenv("LIQPAY_PRIVATE_KEY")
+
+# Cart storage: "sql" writes cart items to the database, "redis" keeps active carts in Redis
+# and writes them to the database later, see `apps.cart.services.storage`.
+CART_STORAGE = os.getenv("CART_STORAGE", "sql")
+CART_REDIS_URL = os.getenv(
+    "CART_REDIS_URL", f"redis://{os.getenv('REDIS_HOST')}:{os.getenv('REDIS_PORT')}/2"
+)